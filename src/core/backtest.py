@@ -39,19 +39,28 @@ class BacktestEngine:
             min_notional_usd=settings.min_notional_usd,
             max_slippage_bps=settings.max_slippage_bps,
         )
+        # One limits object shared by the risk manager and the sizer
+        risk_limits = settings.get_risk_limits()
         self.risk_manager = RiskManager(
-            risk_limits=settings.get_risk_limits(),
+            risk_limits=risk_limits,
             max_drawdown_pct=settings.max_drawdown_pct,
             circuit_breaker_error_rate=settings.circuit_breaker_error_rate,
             circuit_breaker_latency_ms=settings.circuit_breaker_latency_ms,
         )
         self.position_sizer = PositionSizer(
-            risk_limits=settings.get_risk_limits(),
+            risk_limits=risk_limits,
             kelly_fraction=settings.kelly_fraction,
             bankroll=settings.starting_balance_usd,
         )
         self.portfolio = Portfolio(initial_balance=settings.starting_balance_usd)
 
+        # Fee model per venue, shared by every loaded contract, and the
+        # simulated taker fee per unit of quantity
+        self._venue_fees = {venue: settings.get_venue_fees(venue) for venue in Venue}
+        self._fee_rate: dict[Venue, float] = {
+            venue: fees.taker_bps / 10000.0 for venue, fees in self._venue_fees.items()
+        }
+
         # Historical data
         self._historical_data: dict[str, pd.DataFrame] = {}
         self._current_time: datetime | None = None
@@ -169,8 +178,7 @@ class BacktestEngine:
         quotes = self._data_to_quotes(current_data)
 
         # Update discovery engine with current data
-        self.discovery_engine._contracts_cache = contracts
-        self.discovery_engine._quotes_cache = quotes
+        self.discovery_engine.set_market_data(contracts, quotes)
 
         # Get matched pairs
         matched_pairs = self.discovery_engine._get_matched_pairs()
@@ -202,7 +210,7 @@ class BacktestEngine:
                     tick_size=0.01,
                     settlement_ccy=row.get('settlement_ccy', 'USD'),
                     expires_at=row.get('expires_at', datetime.utcnow()),
-                    fees=settings.get_venue_fees(venue),
+                    fees=self._venue_fees[venue],
                 )
                 venue_contracts.append(yes_contract)
 
@@ -216,7 +224,7 @@ class BacktestEngine:
                     tick_size=0.01,
                     settlement_ccy=row.get('settlement_ccy', 'USD'),
                     expires_at=row.get('expires_at', datetime.utcnow()),
-                    fees=settings.get_venue_fees(venue),
+                    fees=self._venue_fees[venue],
                 )
                 venue_contracts.append(no_contract)
 
@@ -328,20 +336,19 @@ class BacktestEngine:
 
     def _simulate_fee(self, venue: Venue, qty: float) -> float:
         """Simulate trading fees."""
-        fee_model = settings.get_venue_fees(venue)
-        return qty * (fee_model.taker_bps / 10000.0)
+        return qty * self._fee_rate[venue]
 
     def _calculate_backtest_pnl(self, opportunity: ArbOpportunity, qty: float) -> float:
         """Calculate PnL for backtest trade."""
         edge_decimal = opportunity.edge_bps / 10000.0
-        gross_pnl = qty * edge_decimal
 
         # Subtract estimated fees
-        fee_a = self._simulate_fee(opportunity.leg_a.venue, qty)
-        fee_b = self._simulate_fee(opportunity.leg_b.venue, qty)
+        fee_rate = (
+            self._fee_rate[opportunity.leg_a.venue]
+            + self._fee_rate[opportunity.leg_b.venue]
+        )
 
-        net_pnl = gross_pnl - fee_a - fee_b
-        return net_pnl
+        return qty * (edge_decimal - fee_rate)
 
     def _update_portfolio_at_timestamp(self, current_data: dict[str, pd.DataFrame]) -> None:
         """Update portfolio at current timestamp."""
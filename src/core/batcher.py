@@ -0,0 +1,110 @@
+"""Coalescing of concurrent per-contract venue requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import partial
+
+from .types import Contract, Quote, Venue
+
+logger = logging.getLogger(__name__)
+
+
+class VenueBatcher:
+    """Batches concurrent quote requests into one bulk call per venue.
+
+    The first request for a venue opens a short window; every request for
+    that venue arriving within it is answered by a single
+    ``connector.get_quotes`` call. Contract listings are single-flight:
+    concurrent callers share one in-flight ``list_contracts`` call.
+    """
+
+    def __init__(self, connectors: dict[Venue, any], window: float = 0.005):
+        """Initialize venue batcher.
+
+        Args:
+            connectors: Dictionary mapping venues to their connectors
+            window: Seconds to collect quote requests before flushing
+        """
+        self.connectors = connectors
+        self.window = window
+
+        # Contract ID -> future for the quote, per venue with an open window
+        self._pending: dict[Venue, dict[str, asyncio.Future]] = {}
+        # In-flight contract listings per venue
+        self._listings: dict[Venue, asyncio.Task] = {}
+        # Strong references to flush tasks until they finish
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit_quote_request(self, venue: Venue, contract_id: str) -> Quote | None:
+        """Get a quote for one contract, batched with concurrent requests.
+
+        Returns None when the venue returned no quote for the contract.
+        Connector errors propagate to every request in the batch.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(venue)
+        if pending is None:
+            pending = self._pending[venue] = {}
+            task = loop.create_task(self._flush_quotes(venue, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(partial(self._release_window, venue, pending))
+
+        future = pending.get(contract_id)
+        if future is None:
+            future = pending[contract_id] = loop.create_future()
+
+        # A cancelled caller must not cancel the result shared with others
+        return await asyncio.shield(future)
+
+    async def list_contracts(self, venue: Venue) -> list[Contract]:
+        """List a venue's contracts, sharing any listing already in flight."""
+        task = self._listings.get(venue)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self.connectors[venue].list_contracts()
+            )
+            self._listings[venue] = task
+            task.add_done_callback(lambda _: self._listings.pop(venue, None))
+        return await asyncio.shield(task)
+
+    async def _flush_quotes(
+        self, venue: Venue, pending: dict[str, asyncio.Future]
+    ) -> None:
+        """Issue one get_quotes call for a venue's window and resolve waiters."""
+        await asyncio.sleep(self.window)
+        self._close_window(venue, pending)
+
+        try:
+            quotes = await self.connectors[venue].get_quotes(list(pending))
+        except Exception as e:
+            logger.warning("Batched quote request to %s failed: %s", venue.value, e)
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_id = {quote.contract_id: quote for quote in quotes}
+        for contract_id, future in pending.items():
+            if not future.done():
+                future.set_result(by_id.get(contract_id))
+
+    def _close_window(self, venue: Venue, pending: dict[str, asyncio.Future]) -> None:
+        """Stop adding a venue's new requests to ``pending``."""
+        if self._pending.get(venue) is pending:
+            del self._pending[venue]
+
+    def _release_window(
+        self, venue: Venue, pending: dict[str, asyncio.Future], _task: asyncio.Task
+    ) -> None:
+        """Close a finished flush's window and cancel any waiters it left.
+
+        A flush cancelled before or during its call resolves nothing; without
+        this its waiters, and requests joining its window, would hang.
+        """
+        self._close_window(venue, pending)
+        for future in pending.values():
+            if not future.done():
+                future.cancel()
@@ -37,6 +37,7 @@ class Settings(BaseSettings):
     max_position_per_event_usd: float = Field(default=5000.0, ge=0.0)
     min_notional_usd: float = Field(default=100.0, ge=0.0)
     max_drawdown_pct: float = Field(default=10.0, ge=0.0, le=100.0)
+    max_concurrent_trades: int = Field(default=4, ge=1)
 
     # Circuit Breakers
     circuit_breaker_error_rate: float = Field(default=0.1, ge=0.0, le=1.0)
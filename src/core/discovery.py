@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import logging
+import random
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Executor
 from datetime import datetime
+from itertools import chain, starmap
+
+import numpy as np
 
 from .event_registry import EventRegistry
 from .fees import FeeCalculator
 from .matcher import EventMatcher
-from .odds import (
-    calculate_arbitrage_edge,
-    is_arbitrage_profitable,
-    min_executable_qty,
-)
+from .odds import min_executable_qty, score_directions
 from .types import (
     ArbOpportunity,
     Contract,
+    MatchedPair,
     OrderRequest,
     OrderSide,
     OrderTIF,
@@ -24,6 +31,18 @@ from .types import (
 )
 from .venue_mappers import KalshiMapper, PolymarketMapper
 
+logger = logging.getLogger(__name__)
+
+# Fixed slot per venue for per-venue state
+_VENUES = tuple(Venue)
+_VENUE_IDX = {venue: i for i, venue in enumerate(_VENUES)}
+
+# Directions evaluated for every matched pair, in emission order
+_DIRECTIONS = ("YES@A+NO@B", "NO@A+YES@B")
+
+# Minimum bid/ask size on both legs for a pair to be considered
+_MIN_LIQUIDITY = 100.0
+
 
 class DiscoveryEngine:
     """Discovers arbitrage opportunities across venues."""
@@ -37,6 +56,14 @@ class DiscoveryEngine:
         min_notional_usd: float = 100.0,
         max_slippage_bps: float = 25.0,
         use_deterministic_mapping: bool = True,
+        batch_min_pairs: int = 32,
+        quote_batch_size: int = 100,
+        mapping_cache_size: int = 50_000,
+        scan_executor: Executor | None = None,
+        scan_chunk_size: int = 64,
+        quote_ttl_ms: float = 250.0,
+        max_quote_age_ms: float = 2000.0,
+        max_opportunities: int | None = None,
     ):
         """Initialize discovery engine.
         
@@ -48,6 +75,20 @@ class DiscoveryEngine:
             min_notional_usd: Minimum notional size in USD
             max_slippage_bps: Maximum slippage tolerance in basis points
             use_deterministic_mapping: Use registry-based deterministic mapping
+            batch_min_pairs: Pair count at which edges are computed with
+                vectorized NumPy math instead of pair by pair
+            quote_batch_size: Maximum contract IDs per quote request; larger
+                sets are split into concurrent requests
+            mapping_cache_size: Maximum remembered market-to-event mappings
+            scan_executor: Optional executor that runs the per-pair scan in
+                chunks; the scan is pure Python, so threads only help on
+                free-threaded builds or with GIL-releasing fee calculators
+            scan_chunk_size: Pairs per executor task
+            quote_ttl_ms: Age below which a fetched quote is not re-fetched
+                (jittered by +/-10% per batch to spread refreshes)
+            max_quote_age_ms: Age above which a fetched quote is ignored
+            max_opportunities: Return only this many highest-edge
+                opportunities per cycle (None returns all, fully sorted)
         """
         self.fee_calculator = fee_calculator
         self.event_matcher = event_matcher
@@ -55,6 +96,13 @@ class DiscoveryEngine:
         self.min_notional_usd = min_notional_usd
         self.max_slippage_bps = max_slippage_bps
         self.use_deterministic_mapping = use_deterministic_mapping
+        self.batch_min_pairs = batch_min_pairs
+        self.quote_batch_size = quote_batch_size
+        self.scan_executor = scan_executor
+        self.scan_chunk_size = scan_chunk_size
+        self.quote_ttl_ms = quote_ttl_ms
+        self.max_quote_age_ms = max_quote_age_ms
+        self.max_opportunities = max_opportunities
 
         # Event registry and mappers
         self.event_registry = event_registry or EventRegistry()
@@ -62,11 +110,35 @@ class DiscoveryEngine:
             Venue.POLYMARKET: PolymarketMapper(self.event_registry),
             Venue.KALSHI: KalshiMapper(self.event_registry),
         }
+        self._mappers = tuple(self.venue_mappers.get(venue) for venue in _VENUES)
+
+        # LRU of mapper results keyed by (venue, market_id); unmapped markets
+        # are not cached so mappings registered later are picked up
+        self.mapping_cache_size = mapping_cache_size
+        self._mapping_cache: OrderedDict[tuple[Venue, str], str] = OrderedDict()
 
-        # Cache for contracts and quotes
-        self._contracts_cache: dict[Venue, list[Contract]] = {}
+        # Cache for contracts and quotes; per-venue lists are indexed by _VENUE_IDX
+        self._contracts_cache: list[list[Contract] | None] = [None] * len(_VENUES)
         self._quotes_cache: dict[str, Quote] = {}
-        self._last_update: dict[Venue, datetime] = {}
+        # (fetched_ns, refresh_at_ns) on the monotonic clock for fetched quotes;
+        # quotes loaded via set_market_data have no entry and never go stale
+        self._quote_times: dict[str, tuple[int, int]] = {}
+        self._last_update: list[datetime | None] = [None] * len(_VENUES)
+
+        # Contracts grouped by event_id and side, built when contracts are stored
+        self._by_event: list[dict[str, dict[str, Contract]] | None] = [None] * len(_VENUES)
+        # Per-venue contract set versions, bumped only when the set changes
+        self._contracts_version: list[int] = [0] * len(_VENUES)
+        self._contracts_fingerprint: list[frozenset | None] = [None] * len(_VENUES)
+        self._matched_pairs_cache: tuple[tuple, list] | None = None
+        self._quote_ids_cache: tuple[list, list[list[str]]] | None = None
+
+        # Per-venue (fee rate, gas, withdrawal) for one-unit taker orders,
+        # rebuilt whenever the fee calculator's version changes
+        self._fee_version = fee_calculator.version
+        self._taker_fee_lut: dict[Venue, tuple[float, float, float]] = {}
+        self._fees_nonnegative = True
+        self._build_fee_lut()
         
         # Track mapping statistics
         self._mapping_stats = {
@@ -89,10 +161,10 @@ class DiscoveryEngine:
         Returns:
             List of arbitrage opportunities
         """
-        opportunities = []
+        self._check_fee_version()
 
         # Refresh contracts if needed
-        if refresh_contracts or not self._contracts_cache:
+        if refresh_contracts or not self._loaded_contracts():
             await self._refresh_contracts(connectors)
 
         # Get matched pairs
@@ -101,45 +173,53 @@ class DiscoveryEngine:
         # Refresh quotes for matched contracts
         await self._refresh_quotes(connectors, matched_pairs)
 
+        # Resolve quotes once, skipping pairs missing a quote on either leg
+        quoted_pairs = self._resolve_quotes(matched_pairs)
+
         # Find opportunities
-        for pair in matched_pairs:
-            pair_opportunities = self._find_pair_opportunities(pair)
-            opportunities.extend(pair_opportunities)
+        if len(quoted_pairs) >= self.batch_min_pairs:
+            opportunities = self._batch_find_opportunities(quoted_pairs)
+        elif self.scan_executor is not None:
+            opportunities = self._parallel_scan(quoted_pairs)
+        else:
+            opportunities = list(chain.from_iterable(
+                starmap(self._scan_quoted_pair, quoted_pairs)
+            ))
 
         # Filter and sort opportunities
-        filtered_opportunities = self._filter_opportunities(opportunities)
+        filtered_opportunities = self._filter_opportunities(
+            opportunities, top_k=self.max_opportunities
+        )
 
         return filtered_opportunities
 
     async def _refresh_contracts(self, connectors: dict[Venue, any]) -> None:
         """Refresh contract lists from all venues."""
-        tasks = []
-        for venue, connector in connectors.items():
-            tasks.append(self._fetch_contracts(venue, connector))
-
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for venue, connector in connectors.items():
+                    tg.create_task(self._fetch_contracts(venue, connector))
+        except* Exception as eg:
+            for e in eg.exceptions:
+                logger.error("Contract refresh failed", exc_info=e)
 
     async def _fetch_contracts(self, venue: Venue, connector: any) -> None:
         """Fetch contracts from a single venue."""
         try:
             contracts = await connector.list_contracts()
+            venue_idx = _VENUE_IDX[venue]
             
             # Map contracts to canonical event IDs if using deterministic mapping
             if self.use_deterministic_mapping:
                 mapped_contracts = []
-                mapper = self.venue_mappers.get(venue)
+                mapper = self._mappers[venue_idx]
                 
                 for contract in contracts:
                     self._mapping_stats["total_markets"] += 1
                     
                     if mapper:
                         # Try to map to canonical event ID
-                        event_id = mapper.map_to_event_id(
-                            market_id=contract.normalized_event_id,
-                            title=contract.event_key,
-                            description="",
-                            metadata={"close_time": contract.expires_at},
-                        )
+                        event_id = self._map_to_event_id(venue, mapper, contract)
                         
                         if event_id:
                             # Update contract with canonical event ID
@@ -153,32 +233,124 @@ class DiscoveryEngine:
                         # No mapper for venue, include as-is
                         mapped_contracts.append(contract)
                 
-                self._contracts_cache[venue] = mapped_contracts
+                self._store_contracts(venue_idx, mapped_contracts)
             else:
                 # Use legacy matcher
-                self._contracts_cache[venue] = contracts
+                self._store_contracts(venue_idx, contracts)
             
-            self._last_update[venue] = datetime.utcnow()
-        except Exception as e:
-            print(f"Failed to fetch contracts from {venue}: {e}")
+            self._last_update[venue_idx] = datetime.utcnow()
+        except Exception:
+            logger.exception("Failed to fetch contracts from %s", venue)
+
+    def _map_to_event_id(
+        self,
+        venue: Venue,
+        mapper: any,  # EventMapper
+        contract: Contract,
+    ) -> str | None:
+        """Map a venue market to its canonical event ID, memoized per market."""
+        key = (venue, contract.normalized_event_id)
+        cache = self._mapping_cache
+        event_id = cache.get(key)
+        if event_id is not None:
+            cache.move_to_end(key)
+            return event_id
+
+        event_id = mapper.map_to_event_id(
+            market_id=contract.normalized_event_id,
+            title=contract.event_key,
+            description="",
+            metadata={"close_time": contract.expires_at},
+        )
+        if event_id is None:
+            return None
+        cache[key] = event_id
+        if len(cache) > self.mapping_cache_size:
+            cache.popitem(last=False)
+        return event_id
 
     def _get_matched_pairs(self) -> list[any]:  # MatchedPair
-        """Get matched pairs from cached contracts."""
-        venues = list(self._contracts_cache.keys())
-        if len(venues) < 2:
+        """Get matched pairs from cached contracts.
+
+        Pairs are cached until the contract set of any venue changes.
+        """
+        cache_key = tuple(self._contracts_version)
+        if self._matched_pairs_cache is not None and self._matched_pairs_cache[0] == cache_key:
+            return self._matched_pairs_cache[1]
+
+        loaded = [
+            idx for idx, contracts in enumerate(self._contracts_cache)
+            if contracts is not None
+        ]
+        if len(loaded) < 2:
             return []
 
         # Get contracts from first two venues
-        venue_a, venue_b = venues[0], venues[1]
-        contracts_a = self._contracts_cache[venue_a]
-        contracts_b = self._contracts_cache[venue_b]
+        idx_a, idx_b = loaded[0], loaded[1]
 
         if self.use_deterministic_mapping:
             # Use deterministic event_id matching
-            return self._match_by_event_id(contracts_a, contracts_b)
+            matched_pairs = self._match_event_groups(
+                self._by_event[idx_a], self._by_event[idx_b]
+            )
         else:
             # Use legacy fuzzy matching
-            return self.event_matcher.match_events(contracts_a, contracts_b)
+            matched_pairs = self.event_matcher.match_events(
+                self._contracts_cache[idx_a], self._contracts_cache[idx_b]
+            )
+
+        self._matched_pairs_cache = (cache_key, matched_pairs)
+        return matched_pairs
+
+    def _store_contracts(self, venue_idx: int, contracts: list[Contract] | None) -> None:
+        """Cache a venue's contracts along with their event index.
+
+        An identical contract set keeps the existing objects and version, so
+        matched pairs built from them stay valid.
+        """
+        if contracts is None:
+            fingerprint = None
+        else:
+            fingerprint = frozenset(
+                (c.contract_id, c.normalized_event_id, c.event_key, c.expires_at)
+                for c in contracts
+            )
+            if (
+                self._contracts_cache[venue_idx] is not None
+                and fingerprint == self._contracts_fingerprint[venue_idx]
+            ):
+                return
+
+        if contracts is None and self._contracts_cache[venue_idx] is None:
+            return
+
+        self._contracts_cache[venue_idx] = contracts
+        self._by_event[venue_idx] = (
+            None if contracts is None else self._index_by_event(contracts)
+        )
+        self._contracts_fingerprint[venue_idx] = fingerprint
+        self._contracts_version[venue_idx] += 1
+
+    def _loaded_contracts(self) -> list[list[Contract]]:
+        """Get cached contract lists for venues that have been loaded."""
+        return [contracts for contracts in self._contracts_cache if contracts is not None]
+
+    def set_market_data(
+        self,
+        contracts: dict[Venue, list[Contract]],
+        quotes: dict[str, Quote],
+    ) -> None:
+        """Replace cached contracts and quotes, e.g. with historical data.
+
+        Args:
+            contracts: Contracts per venue
+            quotes: Quotes keyed by contract ID
+        """
+        for venue_idx, venue in enumerate(_VENUES):
+            self._store_contracts(venue_idx, contracts.get(venue))
+        self._quotes_cache = quotes
+        self._quote_times = {}
+        self._check_fee_version()
 
     async def _refresh_quotes(
         self,
@@ -186,23 +358,58 @@ class DiscoveryEngine:
         matched_pairs: list[any],  # MatchedPair
     ) -> None:
         """Refresh quotes for matched contracts."""
-        # Collect all contract IDs
-        contract_ids = set()
-        for pair in matched_pairs:
-            contract_ids.add(pair.contract_a.contract_id)
-            contract_ids.add(pair.contract_b.contract_id)
+        by_venue = self._quote_ids_by_venue(matched_pairs)
+        now = time.monotonic_ns()
+        times = self._quote_times
+
+        # Fetch quotes from each venue, skipping ones fetched within the TTL
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for venue, connector in connectors.items():
+                    venue_contracts = [
+                        cid for cid in by_venue[_VENUE_IDX[venue]]
+                        if (entry := times.get(cid)) is None or entry[1] <= now
+                    ]
+                    if venue_contracts:
+                        tg.create_task(
+                            self._fetch_quotes(venue, connector, venue_contracts)
+                        )
+        except* Exception as eg:
+            for e in eg.exceptions:
+                logger.error("Quote refresh failed", exc_info=e)
+
+    def _quote_ids_by_venue(self, matched_pairs: list[MatchedPair]) -> list[list[str]]:
+        """Get contract IDs to quote per venue, indexed by _VENUE_IDX.
 
-        # Fetch quotes from each venue
-        tasks = []
-        for venue, connector in connectors.items():
-            venue_contracts = [
-                cid for cid in contract_ids
-                if cid.startswith(f"{venue.value}_")
-            ]
-            if venue_contracts:
-                tasks.append(self._fetch_quotes(venue, connector, venue_contracts))
+        The partition is reused while the cached matched-pair list is.
+        """
+        cached = self._quote_ids_cache
+        if cached is not None and cached[0] is matched_pairs:
+            return cached[1]
+
+        # Partition contract IDs by venue in a single pass
+        by_venue: list[list[str]] = [[] for _ in _VENUES]
+        seen: list[set[str]] = [set() for _ in _VENUES]
+        for pair in matched_pairs:
+            for contract in (pair.contract_a, pair.contract_b):
+                venue_idx = _VENUE_IDX[contract.venue]
+                venue_seen = seen[venue_idx]
+                cid = contract.contract_id
+                if cid not in venue_seen:
+                    venue_seen.add(cid)
+                    by_venue[venue_idx].append(cid)
+
+        # Forget quotes for contracts that are no longer matched
+        wanted = set().union(*seen)
+        self._quotes_cache = {
+            cid: quote for cid, quote in self._quotes_cache.items() if cid in wanted
+        }
+        self._quote_times = {
+            cid: entry for cid, entry in self._quote_times.items() if cid in wanted
+        }
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+        self._quote_ids_cache = (matched_pairs, by_venue)
+        return by_venue
 
     async def _fetch_quotes(
         self,
@@ -210,222 +417,392 @@ class DiscoveryEngine:
         connector: any,
         contract_ids: list[str],
     ) -> None:
-        """Fetch quotes from a single venue."""
+        """Fetch quotes from a single venue in concurrent batches."""
+        batch_size = self.quote_batch_size
+        if len(contract_ids) <= batch_size:
+            await self._fetch_quote_batch(venue, connector, contract_ids)
+            return
+
+        async with asyncio.TaskGroup() as tg:
+            for i in range(0, len(contract_ids), batch_size):
+                tg.create_task(self._fetch_quote_batch(
+                    venue, connector, contract_ids[i:i + batch_size]
+                ))
+
+    async def _fetch_quote_batch(
+        self,
+        venue: Venue,
+        connector: any,
+        contract_ids: list[str],
+    ) -> None:
+        """Fetch one batch of quotes and cache them as soon as they arrive."""
         try:
             quotes = await connector.get_quotes(contract_ids)
+            fetched_ns = time.monotonic_ns()
+            ttl_ns = int(self.quote_ttl_ms * 1e6 * random.uniform(0.9, 1.1))
+            entry = (fetched_ns, fetched_ns + ttl_ns)
             for quote in quotes:
                 self._quotes_cache[quote.contract_id] = quote
-        except Exception as e:
-            print(f"Failed to fetch quotes from {venue}: {e}")
+                self._quote_times[quote.contract_id] = entry
+        except Exception:
+            logger.exception("Failed to fetch quotes from %s", venue)
 
-    def _find_pair_opportunities(self, pair: any) -> list[ArbOpportunity]:  # MatchedPair
+    def _find_pair_opportunities(
+        self,
+        pair: any,  # MatchedPair
+    ) -> Iterator[ArbOpportunity]:
         """Find opportunities for a matched pair."""
-        opportunities = []
+        for _, quote_a, quote_b in self._resolve_quotes([pair]):
+            yield from self._scan_quoted_pair(pair, quote_a, quote_b)
 
-        # Get quotes for both contracts
-        quote_a = self._quotes_cache.get(pair.contract_a.contract_id)
-        quote_b = self._quotes_cache.get(pair.contract_b.contract_id)
+    def _resolve_quotes(
+        self,
+        pairs: list[MatchedPair],
+    ) -> list[tuple[MatchedPair, Quote, Quote]]:
+        """Attach cached quotes to pairs.
 
-        if not quote_a or not quote_b:
-            return opportunities
+        Pairs missing either quote, or with a fetched quote older than
+        max_quote_age_ms, are dropped so stale ticks never produce edges.
+        """
+        get_quote = self._quotes_cache.get
+        get_time = self._quote_times.get
+        stale_before = time.monotonic_ns() - int(self.max_quote_age_ms * 1e6)
+        resolved = []
+        for pair in pairs:
+            cid_a = pair.contract_a.contract_id
+            cid_b = pair.contract_b.contract_id
+            quote_a = get_quote(cid_a)
+            if quote_a is None:
+                continue
+            quote_b = get_quote(cid_b)
+            if quote_b is None:
+                continue
+            entry_a = get_time(cid_a)
+            entry_b = get_time(cid_b)
+            if (
+                (entry_a is not None and entry_a[0] < stale_before)
+                or (entry_b is not None and entry_b[0] < stale_before)
+            ):
+                continue
+            resolved.append((pair, quote_a, quote_b))
+        return resolved
 
-        # Check liquidity
-        if not self._has_sufficient_liquidity(quote_a, quote_b):
-            return opportunities
+    def _parallel_scan(
+        self,
+        quoted_pairs: list[tuple[MatchedPair, Quote, Quote]],
+    ) -> list[ArbOpportunity]:
+        """Scan quoted pairs in chunks on the scan executor, preserving order."""
+        size = self.scan_chunk_size
+        chunks = [quoted_pairs[i:i + size] for i in range(0, len(quoted_pairs), size)]
+        return list(chain.from_iterable(
+            self.scan_executor.map(self._scan_chunk, chunks)
+        ))
+
+    def _scan_chunk(
+        self,
+        quoted_pairs: list[tuple[MatchedPair, Quote, Quote]],
+    ) -> list[ArbOpportunity]:
+        """Scan a chunk of quoted pairs; runs on a scan executor worker."""
+        return list(chain.from_iterable(starmap(self._scan_quoted_pair, quoted_pairs)))
 
-        # Calculate both directions
-        opportunities.extend(
-            self._calculate_direction_opportunities(
-                pair, quote_a, quote_b, "YES@A+NO@B"
-            )
-        )
-        opportunities.extend(
-            self._calculate_direction_opportunities(
-                pair, quote_a, quote_b, "NO@A+YES@B"
-            )
+    def _scan_quoted_pair(
+        self,
+        pair: MatchedPair,
+        quote_a: Quote,
+        quote_b: Quote,
+    ) -> Iterator[ArbOpportunity]:
+        """Find opportunities for a matched pair with resolved quotes."""
+        # Check liquidity
+        min_size = _MIN_LIQUIDITY
+        if (
+            quote_a.best_bid_size < min_size
+            or quote_a.best_ask_size < min_size
+            or quote_b.best_bid_size < min_size
+            or quote_b.best_ask_size < min_size
+        ):
+            return
+
+        # Pairs hold the same side on both venues, so either direction buys
+        # the best ask of contract A and of contract B: score once, emit both
+        ask_a = quote_a.best_ask
+        ask_b = quote_b.best_ask
+
+        score = self._score_direction(
+            pair, ask_a, ask_b, quote_a.best_ask_size, quote_b.best_ask_size
         )
+        if score is None:
+            return
 
-        return opportunities
-
-    def _has_sufficient_liquidity(self, quote_a: Quote, quote_b: Quote) -> bool:
-        """Check if quotes have sufficient liquidity."""
-        min_size = 100.0  # Minimum size requirement
-
-        return (
-            quote_a.best_bid_size >= min_size and
-            quote_a.best_ask_size >= min_size and
-            quote_b.best_bid_size >= min_size and
-            quote_b.best_ask_size >= min_size
+        edge_bps, qty, notional = score
+        yield from self._emit_opportunities(
+            pair, ask_a, ask_b, qty, edge_bps, notional
         )
 
-    def _calculate_direction_opportunities(
+    def _score_direction(
         self,
         pair: any,  # MatchedPair
-        quote_a: Quote,
-        quote_b: Quote,
-        direction: str,
+        ask_a: float,
+        ask_b: float,
+        size_a: float,
+        size_b: float,
+    ) -> tuple[float, float, float] | None:
+        """Score buying both legs at the given asks.
+
+        Returns:
+            Tuple of (edge_bps, qty, notional), or None if any check fails
+        """
+        if ask_a <= 0 or ask_b <= 0:
+            return None
+
+        # Fees only shrink the edge, so skip the fee math when the raw asks
+        # already fall short (same expression, so the bound is exact in floats)
+        min_edge_bps = self.min_edge_bps
+        if (
+            self._fees_nonnegative
+            and min_edge_bps > 0
+            and (1.0 - (ask_a + ask_b)) * 10000.0 < min_edge_bps
+        ):
+            return None
+
+        # Calculate effective prices including costs
+        eff_a = self._calculate_effective_price(pair.contract_a, ask_a, OrderSide.BUY)
+        eff_b = self._calculate_effective_price(pair.contract_b, ask_b, OrderSide.BUY)
+
+        # Calculate edge
+        edge_bps = max(0.0, (1.0 - (eff_a + eff_b)) * 10000.0)
+        if edge_bps < min_edge_bps:
+            return None
+
+        # Calculate executable quantity
+        qty = min_executable_qty(size_a, size_b, self.min_notional_usd, eff_a, eff_b)
+        if qty < 1.0:
+            return None
+
+        notional = qty * (eff_a + eff_b)
+        if notional < self.min_notional_usd:
+            return None
+
+        return edge_bps, qty, notional
+
+    def _emit_opportunities(
+        self,
+        pair: MatchedPair,
+        price_a: float,
+        price_b: float,
+        qty: float,
+        edge_bps: float,
+        notional: float,
     ) -> list[ArbOpportunity]:
-        """Calculate opportunities for a specific direction."""
-        opportunities = []
+        """Build one opportunity per direction for a scored pair."""
+        contract_a = pair.contract_a
+        contract_b = pair.contract_b
+        venue_a, cid_a = contract_a.venue, contract_a.contract_id
+        venue_b, cid_b = contract_b.venue, contract_b.contract_id
+        event_id = pair.event_id
+        expiry = contract_a.expires_at
+        expiry_ts = contract_a.expires_ts
+        confidence_score = pair.confidence_score
+        edge_str = f"{edge_bps:.1f}bps"
+
+        return [
+            ArbOpportunity(
+                event_id=event_id,
+                leg_a=OrderRequest(
+                    venue=venue_a,
+                    contract_id=cid_a,
+                    side=OrderSide.BUY,
+                    price=price_a,
+                    qty=qty,
+                    tif=OrderTIF.IOC,
+                ),
+                leg_b=OrderRequest(
+                    venue=venue_b,
+                    contract_id=cid_b,
+                    side=OrderSide.BUY,
+                    price=price_b,
+                    qty=qty,
+                    tif=OrderTIF.IOC,
+                ),
+                edge_bps=edge_bps,
+                notional=notional,
+                expiry=expiry,
+                rationale=f"{direction}: {edge_str}",
+                confidence_score=confidence_score,
+                expiry_ts=expiry_ts,
+            )
+            for direction in _DIRECTIONS
+        ]
 
-        if direction == "YES@A+NO@B":
-            # Buy YES at A, Buy NO at B
-            ask_yes_a = quote_a.best_ask
-            ask_no_b = quote_b.best_ask
+    def _batch_find_opportunities(
+        self,
+        quoted_pairs: list[tuple[MatchedPair, Quote, Quote]],
+    ) -> list[ArbOpportunity]:
+        """Find opportunities for many quoted pairs at once.
 
-            # Calculate effective prices including costs
-            eff_ask_yes_a = self._calculate_effective_price(
-                pair.contract_a, ask_yes_a, OrderSide.BUY
-            )
-            eff_ask_no_b = self._calculate_effective_price(
-                pair.contract_b, ask_no_b, OrderSide.BUY
-            )
+        Effective prices, edges and quantities are evaluated as NumPy array
+        expressions over all pairs; objects are only built for pairs that
+        pass every check. Results match calling _scan_quoted_pair on each
+        pair in order.
+        """
+        n = len(quoted_pairs)
+        if n == 0:
+            return []
 
-            # Calculate edge
-            edge_bps, _, rationale = calculate_arbitrage_edge(
-                eff_ask_yes_a, eff_ask_no_b, 0.0, 0.0
-            )
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=n)
 
-            if edge_bps >= self.min_edge_bps:
-                # Calculate executable quantity
-                qty = min_executable_qty(
-                    quote_a.best_ask_size,
-                    quote_b.best_ask_size,
-                    self.min_notional_usd,
-                    eff_ask_yes_a,
-                    eff_ask_no_b,
-                )
-
-                if qty >= 1.0:
-                    notional = qty * (eff_ask_yes_a + eff_ask_no_b)
-
-                    if notional >= self.min_notional_usd:
-                        opportunity = ArbOpportunity(
-                            event_id=pair.event_id,
-                            leg_a=OrderRequest(
-                                venue=pair.contract_a.venue,
-                                contract_id=pair.contract_a.contract_id,
-                                side=OrderSide.BUY,
-                                price=ask_yes_a,
-                                qty=qty,
-                                tif=OrderTIF.IOC,
-                            ),
-                            leg_b=OrderRequest(
-                                venue=pair.contract_b.venue,
-                                contract_id=pair.contract_b.contract_id,
-                                side=OrderSide.BUY,
-                                price=ask_no_b,
-                                qty=qty,
-                                tif=OrderTIF.IOC,
-                            ),
-                            edge_bps=edge_bps,
-                            notional=notional,
-                            expiry=pair.contract_a.expires_at,
-                            rationale=rationale,
-                            confidence_score=pair.confidence_score,
-                        )
-                        opportunities.append(opportunity)
+        ask_a = column(qa.best_ask for _, qa, _ in quoted_pairs)
+        ask_b = column(qb.best_ask for _, _, qb in quoted_pairs)
+        ask_size_a = column(qa.best_ask_size for _, qa, _ in quoted_pairs)
+        ask_size_b = column(qb.best_ask_size for _, _, qb in quoted_pairs)
+        bid_size_a = column(qa.best_bid_size for _, qa, _ in quoted_pairs)
+        bid_size_b = column(qb.best_bid_size for _, _, qb in quoted_pairs)
 
-        elif direction == "NO@A+YES@B":
-            # Buy NO at A, Buy YES at B
-            ask_no_a = quote_a.best_ask
-            ask_yes_b = quote_b.best_ask
+        # Venue ordinals per leg, for the fee calculator's per-venue arrays
+        venue_idx = _VENUE_IDX
+        venues_a = np.fromiter(
+            (venue_idx[p.contract_a.venue] for p, _, _ in quoted_pairs), dtype=np.intp, count=n
+        )
+        venues_b = np.fromiter(
+            (venue_idx[p.contract_b.venue] for p, _, _ in quoted_pairs), dtype=np.intp, count=n
+        )
 
-            # Calculate effective prices including costs
-            eff_ask_no_a = self._calculate_effective_price(
-                pair.contract_a, ask_no_a, OrderSide.BUY
-            )
-            eff_ask_yes_b = self._calculate_effective_price(
-                pair.contract_b, ask_yes_b, OrderSide.BUY
-            )
+        eff_a = self._batch_effective_price(venues_a, ask_a)
+        eff_b = self._batch_effective_price(venues_b, ask_b)
 
-            # Calculate edge
-            edge_bps, _, rationale = calculate_arbitrage_edge(
-                0.0, 0.0, eff_ask_no_a, eff_ask_yes_b
-            )
+        liquid = (
+            (bid_size_a >= _MIN_LIQUIDITY)
+            & (ask_size_a >= _MIN_LIQUIDITY)
+            & (bid_size_b >= _MIN_LIQUIDITY)
+            & (ask_size_b >= _MIN_LIQUIDITY)
+        )
 
-            if edge_bps >= self.min_edge_bps:
-                # Calculate executable quantity
-                qty = min_executable_qty(
-                    quote_a.best_ask_size,
-                    quote_b.best_ask_size,
-                    self.min_notional_usd,
-                    eff_ask_no_a,
-                    eff_ask_yes_b,
-                )
-
-                if qty >= 1.0:
-                    notional = qty * (eff_ask_no_a + eff_ask_yes_b)
-
-                    if notional >= self.min_notional_usd:
-                        opportunity = ArbOpportunity(
-                            event_id=pair.event_id,
-                            leg_a=OrderRequest(
-                                venue=pair.contract_a.venue,
-                                contract_id=pair.contract_a.contract_id,
-                                side=OrderSide.BUY,
-                                price=ask_no_a,
-                                qty=qty,
-                                tif=OrderTIF.IOC,
-                            ),
-                            leg_b=OrderRequest(
-                                venue=pair.contract_b.venue,
-                                contract_id=pair.contract_b.contract_id,
-                                side=OrderSide.BUY,
-                                price=ask_yes_b,
-                                qty=qty,
-                                tif=OrderTIF.IOC,
-                            ),
-                            edge_bps=edge_bps,
-                            notional=notional,
-                            expiry=pair.contract_a.expires_at,
-                            rationale=rationale,
-                            confidence_score=pair.confidence_score,
-                        )
-                        opportunities.append(opportunity)
+        edge_bps, qty, notional = score_directions(
+            eff_a, eff_b, ask_size_a, ask_size_b, self.min_notional_usd
+        )
+
+        survivors = np.flatnonzero(
+            liquid
+            & (ask_a > 0)
+            & (ask_b > 0)
+            & (edge_bps >= self.min_edge_bps)
+            & (qty >= 1.0)
+            & (notional >= self.min_notional_usd)
+        )
+
+        # Every survivor emits exactly one opportunity per direction, so the
+        # result size is known up front; fill it by slice instead of growing it
+        per_pair = len(_DIRECTIONS)
+        opportunities: list[ArbOpportunity] = [None] * (per_pair * len(survivors))
+        start = 0
+        for i, pair_edge, pair_qty, pair_notional in zip(
+            survivors.tolist(),
+            edge_bps[survivors].tolist(),
+            qty[survivors].tolist(),
+            notional[survivors].tolist(),
+            strict=True,
+        ):
+            pair, quote_a, quote_b = quoted_pairs[i]
+            opportunities[start:start + per_pair] = self._emit_opportunities(
+                pair,
+                quote_a.best_ask,
+                quote_b.best_ask,
+                pair_qty,
+                pair_edge,
+                pair_notional,
+            )
+            start += per_pair
 
         return opportunities
 
+    def _taker_fee_terms(self, venue: Venue) -> tuple[float, float, float]:
+        """Get (fee rate, gas, withdrawal fee) for a one-unit taker order."""
+        fee_model = self.fee_calculator.fee_models.get(venue)
+        if not fee_model:
+            return 0.0, 0.0, 0.0
+
+        return (
+            fee_model.taker_bps / 10000.0,
+            fee_model.gas_estimate_usd,
+            fee_model.withdrawal_fee or 0.0,
+        )
+
+    def _batch_effective_price(self, venues: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """Vectorized FeeCalculator.calculate_effective_price for one-unit taker buys."""
+        cost = self.fee_calculator.estimate_trade_cost_batch(venues, prices, 1.0)
+        return np.where(prices == 0, prices, prices + cost)
+
     def _calculate_effective_price(
         self,
         contract: Contract,
         price: float,
         side: OrderSide,
     ) -> float:
-        """Calculate effective price including fees and slippage."""
-        return self.fee_calculator.calculate_effective_price(
-            contract.venue,
-            side,
-            price,
-            1.0,  # Assume 1 unit for cost calculation
-            is_maker=False,  # Assume taker orders
+        """Calculate effective price including fees and slippage.
+
+        Taker buys, the only orders discovery prices, are computed from the
+        per-venue fee table with the fee calculator's operation order, so
+        results match FeeCalculator.calculate_effective_price exactly.
+        """
+        if side is not OrderSide.BUY:
+            return self.fee_calculator.calculate_effective_price(
+                contract.venue,
+                side,
+                price,
+                1.0,  # Assume 1 unit for cost calculation
+                is_maker=False,  # Assume taker orders
+            )
+
+        if price == 0:
+            return price
+        rate, gas, withdrawal = self._taker_fee_lut[contract.venue]
+        return price + (price * rate + gas + withdrawal)
+
+    def _check_fee_version(self) -> None:
+        """Rebuild the taker fee table if fee models have changed."""
+        version = self.fee_calculator.version
+        if version != self._fee_version:
+            self._fee_version = version
+            self._build_fee_lut()
+
+    def _build_fee_lut(self) -> None:
+        """Snapshot taker fee terms for every venue."""
+        self._taker_fee_lut = {venue: self._taker_fee_terms(venue) for venue in _VENUES}
+        # With no negative fee terms costs can only raise a buy price, so a
+        # pair short of min edge at raw asks can be rejected before fee math
+        self._fees_nonnegative = all(
+            min(terms) >= 0.0 for terms in self._taker_fee_lut.values()
         )
 
     def _filter_opportunities(
         self,
         opportunities: list[ArbOpportunity],
+        top_k: int | None = None,
     ) -> list[ArbOpportunity]:
-        """Filter opportunities based on criteria."""
-        filtered = []
-
-        for opp in opportunities:
-            # Check profitability
-            if not is_arbitrage_profitable(
-                opp.edge_bps,
-                self.min_edge_bps,
-                opp.notional,
-                self.min_notional_usd,
-            ):
-                continue
+        """Filter opportunities based on criteria.
 
-            # Check expiry (avoid trades too close to expiry)
-            time_to_expiry = (opp.expiry - datetime.utcnow()).total_seconds()
-            if time_to_expiry < 3600:  # Less than 1 hour
-                continue
+        With ``top_k`` set only the highest-edge ``top_k`` survivors are
+        returned, via a partial sort; ties keep their discovery order either way.
+        """
+        min_edge_bps = self.min_edge_bps
+        min_notional_usd = self.min_notional_usd
 
-            filtered.append(opp)
+        # Avoid trades too close to expiry (less than 1 hour). Comparing POSIX
+        # seconds also works for naive and tz-aware expiries alike.
+        expiry_cutoff = time.time() + 3600.0
+
+        # Same criteria as odds.is_arbitrage_profitable, inlined for the hot loop
+        filtered = [
+            opp for opp in opportunities
+            if opp.expiry_ts >= expiry_cutoff
+            and opp.edge_bps >= min_edge_bps
+            and opp.notional >= min_notional_usd
+        ]
 
         # Sort by edge (highest first)
+        if top_k is not None:
+            return heapq.nlargest(top_k, filtered, key=lambda x: x.edge_bps)
+
         filtered.sort(key=lambda x: x.edge_bps, reverse=True)
 
         return filtered
@@ -444,68 +821,79 @@ class DiscoveryEngine:
         Returns:
             List of matched pairs
         """
-        from .types import MatchedPair
-        
+        return self._match_event_groups(
+            self._index_by_event(contracts_a),
+            self._index_by_event(contracts_b),
+        )
+
+    @staticmethod
+    def _index_by_event(contracts: list[Contract]) -> dict[str, dict[str, Contract]]:
+        """Bucket contracts by event_id and side in a single pass."""
+        events: defaultdict[str, dict[str, Contract]] = defaultdict(dict)
+        for contract in contracts:
+            events[contract.normalized_event_id][contract.side_str] = contract
+        return dict(events)
+
+    def _match_event_groups(
+        self,
+        events_a: dict[str, dict[str, Contract]],
+        events_b: dict[str, dict[str, Contract]],
+    ) -> list[any]:  # MatchedPair
+        """Match contracts already grouped by event_id and side."""
         matched_pairs = []
-        
-        # Group contracts by event_id
-        events_a: dict[str, list[Contract]] = {}
-        for contract in contracts_a:
-            event_id = contract.normalized_event_id
-            if event_id not in events_a:
-                events_a[event_id] = []
-            events_a[event_id].append(contract)
-        
-        events_b: dict[str, list[Contract]] = {}
-        for contract in contracts_b:
-            event_id = contract.normalized_event_id
-            if event_id not in events_b:
-                events_b[event_id] = []
-            events_b[event_id].append(contract)
-        
-        # Find matching event_ids
-        common_event_ids = set(events_a.keys()) & set(events_b.keys())
-        
-        for event_id in common_event_ids:
-            contracts_a_group = events_a[event_id]
-            contracts_b_group = events_b[event_id]
-            
+        append = matched_pairs.append
+
+        # Walk the smaller index in insertion order and probe the larger one
+        if len(events_a) <= len(events_b):
+            probe = ((event_id, group_a, events_b.get(event_id))
+                     for event_id, group_a in events_a.items())
+        else:
+            probe = ((event_id, events_a.get(event_id), group_b)
+                     for event_id, group_b in events_b.items())
+
+        for event_id, group_a, group_b in probe:
+            if group_a is None or group_b is None:
+                continue
+
             # Create matched pairs for YES/NO contracts
-            yes_a = next((c for c in contracts_a_group if c.side.value == "YES"), None)
-            no_a = next((c for c in contracts_a_group if c.side.value == "NO"), None)
-            yes_b = next((c for c in contracts_b_group if c.side.value == "YES"), None)
-            no_b = next((c for c in contracts_b_group if c.side.value == "NO"), None)
-            
+            yes_a, no_a = group_a.get("YES"), group_a.get("NO")
+            yes_b, no_b = group_b.get("YES"), group_b.get("NO")
+
             if yes_a and yes_b:
-                matched_pairs.append(MatchedPair(
+                append(MatchedPair(
                     event_id=event_id,
                     contract_a=yes_a,
                     contract_b=yes_b,
                     confidence_score=1.0,
                     match_reason="deterministic_event_id_yes",
                 ))
-            
+
             if no_a and no_b:
-                matched_pairs.append(MatchedPair(
+                append(MatchedPair(
                     event_id=event_id,
                     contract_a=no_a,
                     contract_b=no_b,
                     confidence_score=1.0,
                     match_reason="deterministic_event_id_no",
                 ))
-        
+
         return matched_pairs
 
     def get_discovery_stats(self) -> dict[str, any]:
         """Get discovery statistics."""
-        total_contracts = sum(len(contracts) for contracts in self._contracts_cache.values())
+        loaded = self._loaded_contracts()
+        total_contracts = sum(len(contracts) for contracts in loaded)
         total_quotes = len(self._quotes_cache)
 
         stats = {
             "total_contracts": total_contracts,
             "total_quotes": total_quotes,
-            "venues_connected": len(self._contracts_cache),
-            "last_update": self._last_update,
+            "venues_connected": len(loaded),
+            "last_update": {
+                venue: ts
+                for venue, ts in zip(_VENUES, self._last_update, strict=True)
+                if ts is not None
+            },
         }
         
         # Add mapping statistics if using deterministic mapping
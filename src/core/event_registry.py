@@ -8,12 +8,26 @@ from __future__ import annotations
 
 import csv
 import hashlib
+import logging
+import os
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional columnar storage
+    pa = None
+    pa_csv = None
+    pq = None
+
+logger = logging.getLogger(__name__)
 
 class EventType(str, Enum):
     """Canonical event type categories."""
@@ -136,20 +150,27 @@ class EventRegistry:
         """Initialize event registry.
         
         Args:
-            events_file: Path to canonical events CSV
-            mappings_file: Path to venue mappings CSV
+            events_file: Path to canonical events CSV (or ``.parquet``)
+            mappings_file: Path to venue mappings CSV (or ``.parquet``)
         """
         self.events_file = Path(events_file) if events_file else None
         self.mappings_file = Path(mappings_file) if mappings_file else None
         
         # In-memory storage
         self.events: dict[str, CanonicalEvent] = {}
-        self.mappings: dict[str, VenueMapping] = {}  # Key: f"{venue}:{market_id}"
-        self.event_aliases: dict[str, str] = {}  # Alias -> event_id
+        self.mappings: dict[tuple[str, str], VenueMapping] = {}  # Key: (venue, market_id)
+        self.event_aliases: dict[str, str] = {}  # Casefolded alias -> event_id
+        self._by_event: defaultdict[str, list[VenueMapping]] = defaultdict(list)
+
+        # Mapping keys added since the last save, and the row count of the
+        # mappings CSV journal (None until its layout is known to match)
+        self._dirty_mappings: set[tuple[str, str]] = set()
+        self._mapping_rows_on_disk: int | None = None
         
         # Load from disk
         self._load_events()
         self._load_mappings()
+        self._dirty_mappings.clear()
     
     def add_event(self, event: CanonicalEvent) -> None:
         """Add a canonical event to the registry."""
@@ -157,7 +178,7 @@ class EventRegistry:
         
         # Register aliases
         for alias in event.aliases:
-            self.event_aliases[alias.upper()] = event.event_id
+            self.event_aliases[alias.casefold()] = event.event_id
     
     def get_event(self, event_id: str) -> CanonicalEvent | None:
         """Get canonical event by ID."""
@@ -165,14 +186,25 @@ class EventRegistry:
     
     def add_mapping(self, mapping: VenueMapping) -> None:
         """Add a venue mapping to the registry."""
-        key = f"{mapping.venue}:{mapping.market_id}"
+        # Venue, event and method strings repeat across many mappings; interning
+        # shares one copy and lets dict lookups short-circuit on identity.
+        mapping.venue = sys.intern(mapping.venue)
+        mapping.event_id = sys.intern(mapping.event_id)
+        mapping.mapping_method = sys.intern(mapping.mapping_method)
         mapping.updated_at = datetime.utcnow()
+        key = (mapping.venue, mapping.market_id)
+
+        previous = self.mappings.get(key)
+        if previous is not None:
+            self._unindex_mapping(previous)
+
         self.mappings[key] = mapping
+        self._by_event[mapping.event_id].append(mapping)
+        self._dirty_mappings.add(key)
     
     def get_mapping(self, venue: str, market_id: str) -> VenueMapping | None:
         """Get venue mapping for a specific market."""
-        key = f"{venue}:{market_id}"
-        return self.mappings.get(key)
+        return self.mappings.get((venue, market_id))
     
     def get_event_id(self, venue: str, market_id: str) -> str | None:
         """Get canonical event ID for a venue market.
@@ -189,14 +221,15 @@ class EventRegistry:
     
     def get_mapped_markets(self, event_id: str) -> list[VenueMapping]:
         """Get all venue mappings for a canonical event."""
-        return [
-            mapping for mapping in self.mappings.values()
-            if mapping.event_id == event_id
-        ]
+        return list(self._by_event.get(event_id, ()))
     
     def search_by_alias(self, alias: str) -> CanonicalEvent | None:
-        """Search for event by alias."""
-        event_id = self.event_aliases.get(alias.upper())
+        """Search for event by alias (case-insensitive).
+
+        Callers resolving many aliases can pass ``alias.casefold()`` once
+        upfront; such keys hit on the first probe without re-normalizing.
+        """
+        event_id = self.event_aliases.get(alias) or self.event_aliases.get(alias.casefold())
         return self.events.get(event_id) if event_id else None
     
     def get_coverage_stats(self) -> dict[str, Any]:
@@ -216,12 +249,10 @@ class EventRegistry:
             method_counts[method] = method_counts.get(method, 0) + 1
         
         # Events with cross-venue mappings
-        events_with_multiple_venues = 0
-        for event_id in self.events:
-            mapped_markets = self.get_mapped_markets(event_id)
-            venues = set(m.venue for m in mapped_markets)
-            if len(venues) >= 2:
-                events_with_multiple_venues += 1
+        events_with_multiple_venues = sum(
+            1 for event_id, mapped_markets in self._by_event.items()
+            if event_id in self.events and len({m.venue for m in mapped_markets}) >= 2
+        )
         
         return {
             "total_events": total_events,
@@ -231,151 +262,301 @@ class EventRegistry:
             "coverage_by_method": method_counts,
         }
     
+    def _unindex_mapping(self, mapping: VenueMapping) -> None:
+        """Drop a replaced mapping from the event_id reverse index."""
+        mapped_markets = self._by_event.get(mapping.event_id)
+        if mapped_markets is None:
+            return
+        mapped_markets[:] = [m for m in mapped_markets if m is not mapping]
+        if not mapped_markets:
+            del self._by_event[mapping.event_id]
+
     def save(self) -> None:
         """Save registry to disk."""
         self._save_events()
         self._save_mappings()
     
     def _load_events(self) -> None:
-        """Load canonical events from CSV."""
+        """Load canonical events from CSV or Parquet."""
         if not self.events_file or not self.events_file.exists():
             return
         
         try:
-            with open(self.events_file, encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    event = self._parse_event_row(row)
-                    if event:
-                        self.add_event(event)
-        except Exception as e:
-            print(f"Failed to load events from {self.events_file}: {e}")
+            for row in _read_rows(self.events_file, _EVENT_COLUMNS):
+                event = self._parse_event_row(row)
+                if event:
+                    self.add_event(event)
+        except Exception:
+            logger.exception("Failed to load events from %s", self.events_file)
     
     def _load_mappings(self) -> None:
-        """Load venue mappings from CSV."""
+        """Load venue mappings from CSV or Parquet."""
         if not self.mappings_file or not self.mappings_file.exists():
             return
         
         try:
-            with open(self.mappings_file, encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    mapping = self._parse_mapping_row(row)
-                    if mapping:
-                        self.add_mapping(mapping)
-        except Exception as e:
-            print(f"Failed to load mappings from {self.mappings_file}: {e}")
+            rows = _read_rows(self.mappings_file, _MAPPING_COLUMNS)
+            # Journaled files repeat updated keys; later rows win
+            for row in rows:
+                mapping = self._parse_mapping_row(row)
+                if mapping:
+                    self.add_mapping(mapping)
+            if rows and list(rows[0]) == list(_MAPPING_COLUMNS):
+                self._mapping_rows_on_disk = len(rows)
+        except Exception:
+            logger.exception("Failed to load mappings from %s", self.mappings_file)
     
     def _save_events(self) -> None:
-        """Save canonical events to CSV."""
+        """Save canonical events to CSV or Parquet."""
         if not self.events_file:
             return
         
         try:
-            self.events_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.events_file, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = [
-                    'event_id', 'event_type', 'scope', 'date_close',
-                    'canonical_units', 'display_title', 'resolution_source',
-                    'aliases', 'created_at'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for event in self.events.values():
-                    writer.writerow({
-                        'event_id': event.event_id,
-                        'event_type': event.event_type.value,
-                        'scope': event.scope.value,
-                        'date_close': event.date_close.isoformat(),
-                        'canonical_units': event.canonical_units,
-                        'display_title': event.display_title,
-                        'resolution_source': event.resolution_source,
-                        'aliases': '|'.join(event.aliases),
-                        'created_at': event.created_at.isoformat(),
-                    })
-        except Exception as e:
-            print(f"Failed to save events to {self.events_file}: {e}")
+            rows = [
+                {
+                    'event_id': event.event_id,
+                    'event_type': event.event_type.value,
+                    'scope': event.scope.value,
+                    'date_close': event.date_close,
+                    'canonical_units': event.canonical_units,
+                    'display_title': event.display_title,
+                    'resolution_source': event.resolution_source,
+                    'aliases': event.aliases,
+                    'created_at': event.created_at,
+                }
+                for event in self.events.values()
+            ]
+            _write_rows(self.events_file, rows, _EVENT_COLUMNS)
+        except Exception:
+            logger.exception("Failed to save events to %s", self.events_file)
     
     def _save_mappings(self) -> None:
-        """Save venue mappings to CSV."""
+        """Save venue mappings to CSV or Parquet.
+
+        A CSV file is treated as an append-only journal: only mappings added
+        since the last save are appended, and the file is compacted by a full
+        rewrite once it holds more than _COMPACT_RATIO rows per live mapping.
+        Mappings edited in place must be re-added to be picked up.
+        """
         if not self.mappings_file:
             return
         
         try:
-            self.mappings_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.mappings_file, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = [
-                    'venue', 'market_id', 'event_id', 'title_raw',
-                    'description_raw', 'outcomes', 'confidence',
-                    'mapping_method', 'created_at', 'updated_at'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for mapping in self.mappings.values():
-                    writer.writerow({
-                        'venue': mapping.venue,
-                        'market_id': mapping.market_id,
-                        'event_id': mapping.event_id,
-                        'title_raw': mapping.title_raw,
-                        'description_raw': mapping.description_raw,
-                        'outcomes': '|'.join(mapping.outcomes),
-                        'confidence': mapping.confidence,
-                        'mapping_method': mapping.mapping_method,
-                        'created_at': mapping.created_at.isoformat(),
-                        'updated_at': mapping.updated_at.isoformat(),
-                    })
-        except Exception as e:
-            print(f"Failed to save mappings to {self.mappings_file}: {e}")
-    
-    def _parse_event_row(self, row: dict[str, str]) -> CanonicalEvent | None:
-        """Parse event from CSV row."""
+            rows_on_disk = self._mapping_rows_on_disk
+            dirty = self._dirty_mappings
+            if (
+                rows_on_disk is not None
+                and not _is_parquet(self.mappings_file)
+                and self.mappings_file.exists()
+                and rows_on_disk + len(dirty) <= _COMPACT_RATIO * len(self.mappings)
+            ):
+                if dirty:
+                    rows = [_mapping_record(self.mappings[key]) for key in dirty]
+                    _append_rows(self.mappings_file, rows, _MAPPING_COLUMNS)
+                self._mapping_rows_on_disk = rows_on_disk + len(dirty)
+            else:
+                rows = [_mapping_record(mapping) for mapping in self.mappings.values()]
+                _write_rows(self.mappings_file, rows, _MAPPING_COLUMNS)
+                self._mapping_rows_on_disk = len(rows)
+            dirty.clear()
+        except Exception:
+            logger.exception("Failed to save mappings to %s", self.mappings_file)
+
+    def _parse_event_row(self, row: dict[str, Any]) -> CanonicalEvent | None:
+        """Parse event from a CSV or Parquet row."""
         try:
-            aliases = row.get('aliases', '').split('|') if row.get('aliases') else []
-            aliases = [a.strip() for a in aliases if a.strip()]
-            
             return CanonicalEvent(
                 event_id=row['event_id'],
                 event_type=EventType(row['event_type']),
                 scope=EventScope(row['scope']),
                 date_open=None,
-                date_close=datetime.fromisoformat(row['date_close']),
+                date_close=_to_datetime(row['date_close']),
                 canonical_units=row.get('canonical_units', 'YES/NO'),
                 display_title=row.get('display_title', ''),
                 resolution_source=row.get('resolution_source', ''),
-                aliases=aliases,
-                created_at=datetime.fromisoformat(row.get('created_at', datetime.utcnow().isoformat())),
+                aliases=_split_list(row.get('aliases')),
+                created_at=_to_datetime(row.get('created_at') or datetime.utcnow()),
             )
-        except (KeyError, ValueError) as e:
-            print(f"Failed to parse event row: {e}")
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning("Failed to parse event row: %s", e)
             return None
     
-    def _parse_mapping_row(self, row: dict[str, str]) -> VenueMapping | None:
-        """Parse mapping from CSV row."""
+    def _parse_mapping_row(self, row: dict[str, Any]) -> VenueMapping | None:
+        """Parse mapping from a CSV or Parquet row."""
         try:
-            outcomes = row.get('outcomes', '').split('|') if row.get('outcomes') else []
-            outcomes = [o.strip() for o in outcomes if o.strip()]
-            
             return VenueMapping(
                 venue=row['venue'],
                 market_id=row['market_id'],
                 event_id=row['event_id'],
                 title_raw=row.get('title_raw', ''),
                 description_raw=row.get('description_raw', ''),
-                outcomes=outcomes,
+                outcomes=_split_list(row.get('outcomes')),
                 confidence=float(row.get('confidence', 1.0)),
                 mapping_method=row.get('mapping_method', 'manual'),
-                created_at=datetime.fromisoformat(row.get('created_at', datetime.utcnow().isoformat())),
-                updated_at=datetime.fromisoformat(row.get('updated_at', datetime.utcnow().isoformat())),
+                created_at=_to_datetime(row.get('created_at') or datetime.utcnow()),
+                updated_at=_to_datetime(row.get('updated_at') or datetime.utcnow()),
             )
-        except (KeyError, ValueError) as e:
-            print(f"Failed to parse mapping row: {e}")
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning("Failed to parse mapping row: %s", e)
             return None
 
 
+# Column layout shared by the CSV and Parquet formats. Parquet keeps the
+# declared types, so datetimes and list columns load without string parsing.
+_EVENT_COLUMNS: dict[str, str] = {
+    'event_id': 'string',
+    'event_type': 'string',
+    'scope': 'string',
+    'date_close': 'timestamp',
+    'canonical_units': 'string',
+    'display_title': 'string',
+    'resolution_source': 'string',
+    'aliases': 'list',
+    'created_at': 'timestamp',
+}
+
+_MAPPING_COLUMNS: dict[str, str] = {
+    'venue': 'string',
+    'market_id': 'string',
+    'event_id': 'string',
+    'title_raw': 'string',
+    'description_raw': 'string',
+    'outcomes': 'list',
+    'confidence': 'float',
+    'mapping_method': 'string',
+    'created_at': 'timestamp',
+    'updated_at': 'timestamp',
+}
+
+
+# Journaled mapping files are rewritten once they exceed this many rows per mapping
+_COMPACT_RATIO = 2
+
+
+def _mapping_record(mapping: VenueMapping) -> dict[str, Any]:
+    """Row for a venue mapping in the shared column layout."""
+    return {
+        'venue': mapping.venue,
+        'market_id': mapping.market_id,
+        'event_id': mapping.event_id,
+        'title_raw': mapping.title_raw,
+        'description_raw': mapping.description_raw,
+        'outcomes': mapping.outcomes,
+        'confidence': mapping.confidence,
+        'mapping_method': mapping.mapping_method,
+        'created_at': mapping.created_at,
+        'updated_at': mapping.updated_at,
+    }
+
+
+def _is_parquet(path: Path) -> bool:
+    """Registry files ending in ``.parquet`` use columnar storage."""
+    if path.suffix != '.parquet':
+        return False
+    if pq is None:
+        raise RuntimeError("pyarrow is required for Parquet registry files")
+    return True
+
+
+def _read_rows(path: Path, columns: dict[str, str]) -> list[dict[str, Any]]:
+    """Read all rows of a registry file."""
+    if _is_parquet(path):
+        return pq.read_table(path).to_pylist()
+
+    if pa_csv is not None:
+        # Parse the whole CSV in C with timestamps typed up front; any file
+        # arrow rejects (e.g. offset timestamps) goes through the stdlib reader.
+        column_types = {
+            name: pa.timestamp('us') if kind == 'timestamp' else pa.string()
+            for name, kind in columns.items()
+        }
+        try:
+            return pa_csv.read_csv(
+                path,
+                convert_options=pa_csv.ConvertOptions(column_types=column_types),
+            ).to_pylist()
+        except pa.ArrowInvalid:
+            pass
+
+    with open(path, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        return [dict(zip(header, row, strict=True)) for row in reader if row]
+
+
+def _write_rows(path: Path, rows: list[dict[str, Any]], columns: dict[str, str]) -> None:
+    """Write rows to a registry file in the format implied by its suffix.
+
+    The file is written beside the target, synced, and renamed over it, so a
+    crash mid-save never leaves a truncated registry behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+
+    if _is_parquet(path):
+        arrow_types = {
+            'string': pa.string(),
+            'float': pa.float64(),
+            'timestamp': pa.timestamp('us'),
+            'list': pa.list_(pa.string()),
+        }
+        schema = pa.schema([(name, arrow_types[kind]) for name, kind in columns.items()])
+        table = pa.table(
+            {name: [row[name] for row in rows] for name in columns},
+            schema=schema,
+        )
+        with open(tmp_path, 'wb') as f:
+            pq.write_table(table, f)
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(columns))
+            writer.writeheader()
+            writer.writerows(_csv_cells(row, columns) for row in rows)
+            f.flush()
+            os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def _append_rows(path: Path, rows: list[dict[str, Any]], columns: dict[str, str]) -> None:
+    """Append rows to an existing registry CSV with a matching header."""
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(columns))
+        writer.writerows(_csv_cells(row, columns) for row in rows)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _csv_cells(row: dict[str, Any], columns: dict[str, str]) -> dict[str, Any]:
+    """Render timestamp and list cells of a row as CSV text."""
+    for name, kind in columns.items():
+        if kind == 'timestamp':
+            row[name] = row[name].isoformat()
+        elif kind == 'list':
+            row[name] = '|'.join(row[name])
+    return row
+
+
+def _split_list(value: str | list[str] | None) -> list[str]:
+    """Normalize a pipe-joined CSV cell or a Parquet list cell."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split('|')
+    return [v.strip() for v in value if v.strip()]
+
+
+def _to_datetime(value: datetime | str) -> datetime:
+    """Accept a typed Parquet timestamp or an ISO string from CSV."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
 def generate_event_id_hash(*components: str) -> str:
     """Generate a deterministic hash-based event ID.
     
@@ -388,5 +569,7 @@ def generate_event_id_hash(*components: str) -> str:
         8-character hex hash
     """
     content = ":".join(str(c).upper().strip() for c in components)
-    return hashlib.sha256(content.encode()).hexdigest()[:8].upper()
+    # Non-cryptographic identifier: a 4-byte blake2b digest yields the 8 hex
+    # chars directly instead of hashing a full SHA-256 and slicing it.
+    return hashlib.blake2b(content.encode(), digest_size=4).hexdigest().upper()
 
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import logging
+import random
 import uuid
+from collections import Counter, deque
+from dataclasses import replace
 from datetime import datetime
 
 from .types import ArbOpportunity, Fill, OrderRequest, OrderSide, OrderTIF, Trade, Venue
 
+logger = logging.getLogger(__name__)
+
+# Trade IDs are a per-process random prefix plus a counter, like client order
+# IDs: unique across restarts and sortable within a run.
+_TRADE_ID_PREFIX = uuid.uuid4().hex[:12]
+_trade_seq = itertools.count(1)
+
 
 class ExecutionEngine:
     """Executes arbitrage trades with atomic-like behavior."""
@@ -17,21 +29,49 @@ class ExecutionEngine:
         connectors: dict[Venue, any],  # VenueClient protocol
         max_retries: int = 3,
         retry_delay: float = 0.1,
+        parallel_legs: bool = True,
+        backoff_factor: float = 2.0,
+        max_delay: float = 2.0,
+        jitter: float = 0.05,
+        history_size: int = 10_000,
     ):
         """Initialize execution engine.
         
         Args:
             connectors: Dictionary mapping venues to their connectors
             max_retries: Maximum number of retries for failed orders
-            retry_delay: Delay between retries in seconds
+            retry_delay: Delay before the first retry in seconds
+            parallel_legs: Place both legs concurrently; when False, place the
+                less liquid leg first and only then the other (safe mode)
+            backoff_factor: Multiplier applied to the retry delay per attempt
+            max_delay: Upper bound on any single retry delay in seconds
+            jitter: Maximum random seconds added to each retry delay so
+                concurrent retries against a venue do not fire in lockstep
+            history_size: Number of most recent finished trades kept for
+                get_trade_history; execution stats cover every trade
         """
         self.connectors = connectors
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.parallel_legs = parallel_legs
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+        # Leg placements currently running, keyed by order identity, so that
+        # a concurrent identical order is not sent to the venue twice
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
         # Track active trades
         self._active_trades: dict[str, Trade] = {}
-        self._trade_history: list[Trade] = []
+        self._trade_history: deque[Trade] = deque(maxlen=history_size)
+
+        # Running totals over every finished trade, including those that
+        # have aged out of the bounded history
+        self._status_counts: Counter[str] = Counter()
+        self._total_trades = 0
+        self._total_pnl = 0.0
+        self._total_fees = 0.0
 
     async def execute_opportunity(
         self,
@@ -47,7 +87,7 @@ class ExecutionEngine:
         Returns:
             Trade record if successful, None otherwise
         """
-        trade_id = str(uuid.uuid4())
+        trade_id = f"{_TRADE_ID_PREFIX}-{next(_trade_seq):08x}"
 
         # Create trade record
         trade = Trade(
@@ -70,12 +110,16 @@ class ExecutionEngine:
 
         try:
             # Execute both legs
-            fills = await self._execute_both_legs(opportunity, position_size)
+            fills = await self._execute_both_legs(trade, opportunity, position_size)
 
-            if fills:
+            if trade.status == "cancelled":
+                # cancel_trade finished the trade while its legs were out
+                return None
+
+            if fills and fills[0] and fills[1]:
                 # Update trade with fill information
-                trade.fee_a = fills[0].fee_paid if fills[0] else 0.0
-                trade.fee_b = fills[1].fee_paid if fills[1] else 0.0
+                trade.fee_a = fills[0].fee_paid
+                trade.fee_b = fills[1].fee_paid
                 trade.status = "filled"
                 trade.filled_at = datetime.utcnow()
 
@@ -83,69 +127,178 @@ class ExecutionEngine:
                 trade.pnl = self._calculate_trade_pnl(trade, fills)
 
                 # Move to history
-                self._trade_history.append(trade)
-                del self._active_trades[trade_id]
+                self._finish_trade(trade)
 
                 return trade
+            elif fills:
+                # Only one leg filled: hedge the open exposure
+                partial_fill = fills[0] or fills[1]
+                trade.fee_a = fills[0].fee_paid if fills[0] else 0.0
+                trade.fee_b = fills[1].fee_paid if fills[1] else 0.0
+                if (
+                    await self.hedge_partial_fill(trade, partial_fill) is None
+                    and trade.status != "cancelled"
+                ):
+                    trade.status = "partial"
+
+                self._finish_trade(trade)
+
+                return None
             else:
                 # Failed execution
                 trade.status = "failed"
-                self._trade_history.append(trade)
-                del self._active_trades[trade_id]
+                self._finish_trade(trade)
 
                 return None
 
         except Exception as e:
             # Handle execution errors
-            trade.status = "failed"
-            trade.extra = {"error": str(e)}
-            self._trade_history.append(trade)
-            del self._active_trades[trade_id]
+            if trade.status != "cancelled":
+                trade.status = "failed"
+                trade.extra = {"error": str(e)}
+                self._finish_trade(trade)
 
-            print(f"Trade execution failed: {e}")
+            logger.exception("Trade execution failed: %s", e)
             return None
 
     async def _execute_both_legs(
         self,
+        trade: Trade,
         opportunity: ArbOpportunity,
         position_size: float,
     ) -> list[Fill | None] | None:
-        """Execute both legs of the arbitrage trade."""
+        """Execute both legs of the arbitrage trade.
+
+        Each leg's venue order ID is recorded on the trade as soon as that
+        leg is placed, so cancel_trade can reach it mid-execution.
+
+        Returns:
+            [fill_a, fill_b] with None for a leg that did not fill, or None
+            if neither leg filled
+        """
+        if self.parallel_legs:
+            return await self._execute_legs_concurrently(
+                trade, opportunity, position_size
+            )
+
         # Determine execution order (place less liquid leg first)
         leg_a_liquidity = self._estimate_liquidity(opportunity.leg_a)
         leg_b_liquidity = self._estimate_liquidity(opportunity.leg_b)
 
         if leg_a_liquidity < leg_b_liquidity:
             # Execute leg A first, then leg B
-            fill_a = await self._execute_leg(opportunity.leg_a, position_size)
+            fill_a = await self._execute_trade_leg(
+                trade, "a", opportunity.leg_a, position_size
+            )
             if fill_a:
-                fill_b = await self._execute_leg(opportunity.leg_b, position_size)
+                fill_b = await self._execute_trade_leg(
+                    trade, "b", opportunity.leg_b, position_size
+                )
                 return [fill_a, fill_b]
             else:
                 return None
         else:
             # Execute leg B first, then leg A
-            fill_b = await self._execute_leg(opportunity.leg_b, position_size)
+            fill_b = await self._execute_trade_leg(
+                trade, "b", opportunity.leg_b, position_size
+            )
             if fill_b:
-                fill_a = await self._execute_leg(opportunity.leg_a, position_size)
+                fill_a = await self._execute_trade_leg(
+                    trade, "a", opportunity.leg_a, position_size
+                )
                 return [fill_a, fill_b]
             else:
                 return None
 
+    async def _execute_legs_concurrently(
+        self,
+        trade: Trade,
+        opportunity: ArbOpportunity,
+        position_size: float,
+    ) -> list[Fill | None] | None:
+        """Place both legs at once so latency is the slower venue, not the sum."""
+        results = await asyncio.gather(
+            self._execute_trade_leg(trade, "a", opportunity.leg_a, position_size),
+            self._execute_trade_leg(trade, "b", opportunity.leg_b, position_size),
+            return_exceptions=True,
+        )
+
+        fills: list[Fill | None] = []
+        errors: list[BaseException] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                errors.append(result)
+                fills.append(None)
+            else:
+                fills.append(result)
+
+        if fills[0] is None and fills[1] is None:
+            if errors:
+                raise errors[0]
+            return None
+
+        for error in errors:
+            logger.error("Leg execution failed: %s", error, exc_info=error)
+
+        return fills
+
+    async def _execute_trade_leg(
+        self,
+        trade: Trade,
+        leg: str,
+        order_request: OrderRequest,
+        position_size: float,
+    ) -> Fill | None:
+        """Execute one leg of a trade and record its venue order ID on it."""
+        fill = await self._execute_leg(order_request, position_size)
+        if fill is not None:
+            if leg == "a":
+                trade.order_id_a = fill.venue_order_id
+            else:
+                trade.order_id_b = fill.venue_order_id
+        return fill
+
     async def _execute_leg(
         self,
         order_request: OrderRequest,
         position_size: float,
     ) -> Fill | None:
         """Execute a single leg of the trade."""
-        # Update order request with position size
-        order_request.qty = position_size
+        # Size the order without touching the caller's opportunity legs
+        if order_request.qty != position_size:
+            order_request = replace(order_request, qty=position_size)
 
         connector = self.connectors.get(order_request.venue)
         if not connector:
             raise ValueError(f"No connector for venue {order_request.venue}")
 
-        # Retry logic
+        key = (
+            order_request.venue,
+            order_request.contract_id,
+            order_request.side,
+            round(order_request.price, 4),
+            round(position_size, 4),
+        )
+        if key in self._inflight:
+            # The fill belongs to the caller that placed the order; a
+            # duplicate gets no fill rather than reporting the same one twice
+            logger.debug("Identical order already in flight: %s", key)
+            return None
+
+        task = asyncio.ensure_future(self._place_with_retries(connector, order_request))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so a cancelled caller does not abandon an order that may
+        # already be resting at the venue
+        return await asyncio.shield(task)
+
+    async def _place_with_retries(
+        self,
+        connector: any,
+        order_request: OrderRequest,
+    ) -> Fill | None:
+        """Place an order, retrying with backoff until it fills."""
         for attempt in range(self.max_retries):
             try:
                 fill = await connector.place_order(order_request)
@@ -154,17 +307,22 @@ class ExecutionEngine:
 
                 # If no fill, wait and retry
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                    await asyncio.sleep(self._backoff_delay(attempt))
 
             except Exception as e:
-                print(f"Leg execution attempt {attempt + 1} failed: {e}")
+                logger.warning("Leg execution attempt %d failed: %s", attempt + 1, e)
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                 else:
                     raise
 
         return None
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given zero-based attempt."""
+        delay = self.retry_delay * (self.backoff_factor ** attempt)
+        return min(self.max_delay, delay + random.uniform(0.0, self.jitter))
+
     def _estimate_liquidity(self, order_request: OrderRequest) -> float:
         """Estimate liquidity for an order request."""
         # This is a simplified estimation
@@ -191,18 +349,14 @@ class ExecutionEngine:
         trade: Trade,
         partial_fill: Fill,
     ) -> Trade | None:
-        """Hedge a partial fill to minimize risk."""
-        # Determine which leg was filled
-        if partial_fill.venue == trade.venue_a:
-            # Leg A was filled, need to hedge on venue B
-            hedge_venue = trade.venue_b
-            hedge_contract = trade.contract_b
-            hedge_side = self._get_opposite_side(trade.side_b)
-        else:
-            # Leg B was filled, need to hedge on venue A
-            hedge_venue = trade.venue_a
-            hedge_contract = trade.contract_a
-            hedge_side = self._get_opposite_side(trade.side_a)
+        """Hedge a partial fill to minimize risk.
+
+        The filled leg is unwound with an opposite-side IOC order on its own
+        venue and contract, leaving no exposure from the unfilled leg.
+        """
+        hedge_venue = partial_fill.venue
+        hedge_contract = partial_fill.contract_id
+        hedge_side = self._get_opposite_side(partial_fill.side)
 
         # Create hedge order
         hedge_order = OrderRequest(
@@ -214,14 +368,15 @@ class ExecutionEngine:
             tif=OrderTIF.IOC,
         )
 
-        # Execute hedge
+        # Execute hedge, unless the trade has been cancelled meanwhile
         connector = self.connectors.get(hedge_venue)
-        if connector:
+        if connector and trade.status != "cancelled":
             hedge_fill = await connector.place_order(hedge_order)
             if hedge_fill:
-                # Update trade status
-                trade.status = "hedged"
                 trade.extra = {"hedge_fill": hedge_fill}
+                # A cancel during the hedge keeps its terminal status
+                if trade.status != "cancelled":
+                    trade.status = "hedged"
                 return trade
 
         return None
@@ -237,44 +392,59 @@ class ExecutionEngine:
             return False
 
         # Cancel both legs
-        cancelled_a = await self._cancel_leg(trade.venue_a, trade.contract_a)
-        cancelled_b = await self._cancel_leg(trade.venue_b, trade.contract_b)
+        cancelled_a, cancelled_b = await asyncio.gather(
+            self._cancel_leg(trade.venue_a, trade.order_id_a),
+            self._cancel_leg(trade.venue_b, trade.order_id_b),
+        )
 
-        if cancelled_a or cancelled_b:
+        # Execution may have finished the trade while the cancels were out
+        if (cancelled_a or cancelled_b) and trade_id in self._active_trades:
             trade.status = "cancelled"
-            self._trade_history.append(trade)
-            del self._active_trades[trade_id]
+            self._finish_trade(trade)
             return True
 
         return False
 
-    async def _cancel_leg(self, venue: Venue, contract_id: str) -> bool:
-        """Cancel a single leg."""
+    async def _cancel_leg(self, venue: Venue, order_id: str | None) -> bool:
+        """Cancel a single leg by its venue order ID."""
+        if not order_id:
+            return False
+
         connector = self.connectors.get(venue)
         if not connector:
             return False
 
-        # In practice, you would need to track order IDs
-        # For now, return False as we don't have order tracking
-        return False
+        return await connector.cancel_order(order_id)
+
+    def _finish_trade(self, trade: Trade) -> None:
+        """Move a trade in a terminal status from active to history."""
+        # A cancel can finish a trade while its execution is still unwinding
+        if self._active_trades.pop(trade.trade_id, None) is None:
+            return
+        self._trade_history.append(trade)
+
+        self._status_counts[trade.status] += 1
+        self._total_trades += 1
+        self._total_pnl += trade.pnl
+        self._total_fees += trade.fee_a + trade.fee_b
 
     def get_active_trades(self) -> list[Trade]:
         """Get list of active trades."""
         return list(self._active_trades.values())
 
     def get_trade_history(self) -> list[Trade]:
-        """Get trade history."""
-        return self._trade_history.copy()
+        """Get the most recent finished trades."""
+        return list(self._trade_history)
 
     def get_execution_stats(self) -> dict[str, any]:
         """Get execution statistics."""
-        total_trades = len(self._trade_history)
-        successful_trades = sum(1 for t in self._trade_history if t.status == "filled")
-        failed_trades = sum(1 for t in self._trade_history if t.status == "failed")
-        hedged_trades = sum(1 for t in self._trade_history if t.status == "hedged")
+        total_trades = self._total_trades
+        successful_trades = self._status_counts["filled"]
+        failed_trades = self._status_counts["failed"]
+        hedged_trades = self._status_counts["hedged"]
 
-        total_pnl = sum(trade.pnl for trade in self._trade_history)
-        total_fees = sum(trade.fee_a + trade.fee_b for trade in self._trade_history)
+        total_pnl = self._total_pnl
+        total_fees = self._total_fees
 
         success_rate = (successful_trades / total_trades * 100) if total_trades > 0 else 0.0
 
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from .types import FeeModel, OrderSide, Venue
 
+# Venue ordinals used to index the per-venue fee arrays in batch methods
+_VENUE_IDX = {venue: i for i, venue in enumerate(Venue)}
+
 
 class FeeCalculator:
     """Calculates trading fees and costs for different venues."""
@@ -15,6 +20,40 @@ class FeeCalculator:
             fee_models: Dictionary mapping venues to their fee models
         """
         self.fee_models = fee_models
+        # Bumped whenever a fee model changes so callers can drop cached costs
+        self.version = 0
+        self._rebuild_fee_terms()
+
+    def _rebuild_fee_terms(self) -> None:
+        """Precompute (taker rate, maker rate, gas, withdrawal) per venue."""
+        self._fee_terms: dict[Venue, tuple[float, float, float, float]] = {
+            venue: (
+                fee_model.taker_bps / 10000.0,
+                fee_model.maker_bps / 10000.0,
+                fee_model.gas_estimate_usd,
+                fee_model.withdrawal_fee or 0.0,
+            )
+            for venue, fee_model in self.fee_models.items()
+            if fee_model
+        }
+
+        # Same terms as arrays indexed by venue ordinal; venues without a fee
+        # model get zeros, matching the scalar methods
+        columns = np.zeros((4, len(_VENUE_IDX)))
+        for venue, terms in self._fee_terms.items():
+            columns[:, _VENUE_IDX[venue]] = terms
+        self._taker_rate_v, self._maker_rate_v, self._gas_v, self._wd_v = columns
+
+    def update_fee_model(self, venue: Venue, fee_model: FeeModel) -> None:
+        """Replace the fee model for a venue.
+
+        Args:
+            venue: Trading venue
+            fee_model: New fee model
+        """
+        self.fee_models[venue] = fee_model
+        self.version += 1
+        self._rebuild_fee_terms()
 
     def estimate_trade_cost(
         self,
@@ -36,23 +75,40 @@ class FeeCalculator:
         Returns:
             Total cost in USD
         """
-        fee_model = self.fee_models.get(venue)
-        if not fee_model:
+        terms = self._fee_terms.get(venue)
+        if terms is None:
             return 0.0
+        taker_rate, maker_rate, gas_cost, withdrawal_fee = terms
 
-        notional = price * qty
+        # Trading fee, plus gas (crypto venues) and withdrawal fees if applicable
+        trading_fee = price * qty * (maker_rate if is_maker else taker_rate)
 
-        # Calculate trading fee
-        fee_bps = fee_model.maker_bps if is_maker else fee_model.taker_bps
-        trading_fee = notional * (fee_bps / 10000.0)
+        return trading_fee + gas_cost + withdrawal_fee
 
-        # Add gas costs (for crypto venues)
-        gas_cost = fee_model.gas_estimate_usd
+    def estimate_trade_cost_batch(
+        self,
+        venue_idx: np.ndarray,
+        prices: np.ndarray,
+        qtys: np.ndarray | float,
+        is_maker: np.ndarray | bool = False,
+    ) -> np.ndarray:
+        """Vectorized estimate_trade_cost over many trades.
 
-        # Add withdrawal fees if applicable
-        withdrawal_fee = fee_model.withdrawal_fee or 0.0
+        Args:
+            venue_idx: Venue ordinal (position in ``tuple(Venue)``) per trade
+            prices: Contract price per trade
+            qtys: Trade quantity per trade, or one quantity for all
+            is_maker: Maker flag per trade, or one flag for all
 
-        return trading_fee + gas_cost + withdrawal_fee
+        Returns:
+            Total cost in USD per trade, equal to the scalar results
+        """
+        if isinstance(is_maker, bool):
+            rate = (self._maker_rate_v if is_maker else self._taker_rate_v)[venue_idx]
+        else:
+            rate = np.where(is_maker, self._maker_rate_v[venue_idx], self._taker_rate_v[venue_idx])
+
+        return prices * qtys * rate + self._gas_v[venue_idx] + self._wd_v[venue_idx]
 
     def calculate_effective_price(
         self,
@@ -107,14 +163,13 @@ class FeeCalculator:
         Returns:
             Breakeven contract price
         """
-        fee_model = self.fee_models.get(venue)
-        if not fee_model:
+        terms = self._fee_terms.get(venue)
+        if terms is None:
             return target_price
 
         # Calculate cost components
-        fee_bps = fee_model.maker_bps if is_maker else fee_model.taker_bps
-        gas_cost = fee_model.gas_estimate_usd
-        withdrawal_fee = fee_model.withdrawal_fee or 0.0
+        taker_rate, maker_rate, gas_cost, withdrawal_fee = terms
+        fee_rate = maker_rate if is_maker else taker_rate
 
         # Solve for contract price given target effective price
         # For BUY: target = price + (price * fee_bps/10000 + gas_cost + withdrawal_fee) / qty
@@ -123,19 +178,15 @@ class FeeCalculator:
         total_fixed_cost = gas_cost + withdrawal_fee
 
         if side == OrderSide.BUY:
-            # target = price + (price * fee_bps/10000 + total_fixed_cost) / qty
-            # target = price * (1 + fee_bps/10000/qty) + total_fixed_cost / qty
-            # price = (target - total_fixed_cost/qty) / (1 + fee_bps/10000/qty)
-            denominator = 1 + (fee_bps / 10000.0) / qty
-            numerator = target_price - total_fixed_cost / qty
-            return numerator / denominator if denominator != 0 else target_price
+            # target * qty = price * (qty + fee_bps/10000) + total_fixed_cost
+            denominator = qty + fee_rate
+            numerator = target_price * qty - total_fixed_cost
         else:
-            # target = price - (price * fee_bps/10000 + total_fixed_cost) / qty
-            # target = price * (1 - fee_bps/10000/qty) - total_fixed_cost / qty
-            # price = (target + total_fixed_cost/qty) / (1 - fee_bps/10000/qty)
-            denominator = 1 - (fee_bps / 10000.0) / qty
-            numerator = target_price + total_fixed_cost / qty
-            return numerator / denominator if denominator != 0 else target_price
+            # target * qty = price * (qty - fee_bps/10000) - total_fixed_cost
+            denominator = qty - fee_rate
+            numerator = target_price * qty + total_fixed_cost
+
+        return numerator / denominator if denominator != 0 else target_price
 
     def get_fee_summary(self, venue: Venue) -> dict[str, float]:
         """Get fee summary for a venue.
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from pydantic import BaseModel
 
 from .types import HealthStatus, Venue
@@ -35,21 +36,46 @@ class MetricsResponse(BaseModel):
 class HealthMonitor:
     """Health monitoring service."""
 
-    def __init__(self, app: FastAPI | None = None):
+    def __init__(
+        self,
+        app: FastAPI | None = None,
+        cache_ttl: float = 0.25,
+        flush_interval: float = 1.0,
+    ):
         """Initialize health monitor.
         
         Args:
             app: FastAPI application instance
+            cache_ttl: Seconds a built health response is reused for
+            flush_interval: Seconds metric updates are buffered before they
+                are applied to system_metrics
         """
         self.app = app or FastAPI(title="PM Arbitrage Bot Health")
         self.start_time = datetime.utcnow()
+        # Uptime is measured on the monotonic clock, immune to wall-clock jumps
+        self._start_monotonic = time.monotonic()
         self.version = "0.1.0"
 
         # Health status for venues
         self.venue_health: dict[Venue, HealthStatus] = {}
+        # Number of venues currently reporting unhealthy, kept in step with
+        # venue_health so probes need not scan it
+        self._unhealthy_count = 0
 
         # System metrics
         self.system_metrics: dict[str, Any] = {}
+        # Metric updates land here and are applied in one batch when a read
+        # finds the buffer older than flush_interval
+        self.flush_interval = flush_interval
+        self._pending_metrics: dict[str, Any] = {}
+        self._last_flush = 0.0
+
+        # Last health response and the monotonic time it was built, so
+        # bursts of probes share one build
+        self.cache_ttl = cache_ttl
+        self._cached_health: tuple[float, HealthResponse] | None = None
+        # JSON body for the cached response, serialized at most once per build
+        self._cached_health_json: tuple[HealthResponse, str] | None = None
 
         # Setup routes
         self._setup_routes()
@@ -57,15 +83,18 @@ class HealthMonitor:
     def _setup_routes(self) -> None:
         """Setup health check routes."""
 
-        @self.app.get("/health", response_model=HealthResponse)
+        # Probe endpoints return pre-serialized JSON so FastAPI skips its
+        # response validation and encoding pass on every request
+        @self.app.get("/health", responses={200: {"model": HealthResponse}})
         async def health_check():
             """Health check endpoint."""
-            return await self.get_health_status()
+            return Response(self.get_health_json(), media_type="application/json")
 
-        @self.app.get("/metrics", response_model=MetricsResponse)
+        @self.app.get("/metrics", responses={200: {"model": MetricsResponse}})
         async def get_metrics():
             """Metrics endpoint."""
-            return await self.get_metrics()
+            metrics = await self.get_metrics()
+            return Response(metrics.model_dump_json(), media_type="application/json")
 
         @self.app.get("/ready")
         async def readiness_check():
@@ -85,14 +114,17 @@ class HealthMonitor:
 
     def get_health_status(self) -> HealthResponse:
         """Get comprehensive health status."""
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        now = time.monotonic()
+        self._maybe_flush_metrics(now)
+        cached = self._cached_health
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
 
-        # Simple health check without async
-        is_healthy = len(self.venue_health) == 0 or all(
-            status.is_healthy for status in self.venue_health.values()
-        )
+        uptime = now - self._start_monotonic
+
+        is_healthy = self._unhealthy_count == 0
 
-        return HealthResponse(
+        response = HealthResponse(
             status="healthy" if is_healthy else "unhealthy",
             timestamp=datetime.utcnow(),
             version=self.version,
@@ -100,9 +132,21 @@ class HealthMonitor:
             venues=list(self.venue_health.values()),
             system=self.system_metrics,
         )
+        self._cached_health = (now, response)
+        return response
+
+    def get_health_json(self) -> str:
+        """Get the health status serialized as JSON."""
+        response = self.get_health_status()
+        cached = self._cached_health_json
+        if cached is None or cached[0] is not response:
+            cached = (response, response.model_dump_json())
+            self._cached_health_json = cached
+        return cached[1]
 
     async def get_metrics(self) -> MetricsResponse:
         """Get system metrics."""
+        self._maybe_flush_metrics(time.monotonic())
         return MetricsResponse(
             timestamp=datetime.utcnow(),
             trades=self.system_metrics.get("trades", {}),
@@ -113,25 +157,16 @@ class HealthMonitor:
 
     async def is_healthy(self) -> bool:
         """Check if system is healthy."""
-        # Check venue health
-        for venue_status in self.venue_health.values():
-            if not venue_status.is_healthy:
-                return False
-
-        # Check system metrics
-        if self.system_metrics.get("error_rate", 0) > 0.1:
-            return False
-
-        return True
+        self._maybe_flush_metrics(time.monotonic())
+        return (
+            self._unhealthy_count == 0
+            and self.system_metrics.get("error_rate", 0) <= 0.1
+        )
 
     async def is_ready(self) -> bool:
         """Check if system is ready to accept requests."""
-        # Check if all venues are connected
-        for venue_status in self.venue_health.values():
-            if not venue_status.is_healthy:
-                return False
-
-        return True
+        # Ready once every venue is connected
+        return self._unhealthy_count == 0
 
     async def is_alive(self) -> bool:
         """Check if system is alive."""
@@ -140,11 +175,29 @@ class HealthMonitor:
 
     def update_venue_health(self, venue: Venue, status: HealthStatus) -> None:
         """Update health status for a venue."""
+        previous = self.venue_health.get(venue)
+        was_unhealthy = previous is not None and not previous.is_healthy
+        if was_unhealthy != (not status.is_healthy):
+            self._unhealthy_count += -1 if was_unhealthy else 1
         self.venue_health[venue] = status
+        self._cached_health = None
 
     def update_system_metrics(self, metrics: dict[str, Any]) -> None:
-        """Update system metrics."""
-        self.system_metrics.update(metrics)
+        """Buffer system metrics until the next flush."""
+        self._pending_metrics.update(metrics)
+
+    def flush_now(self) -> None:
+        """Apply buffered metric updates immediately."""
+        self._last_flush = time.monotonic()
+        if self._pending_metrics:
+            self.system_metrics.update(self._pending_metrics)
+            self._pending_metrics.clear()
+            self._cached_health = None
+
+    def _maybe_flush_metrics(self, now: float) -> None:
+        """Apply buffered metric updates if the flush interval has passed."""
+        if self._pending_metrics and now - self._last_flush >= self.flush_interval:
+            self.flush_now()
 
     def get_app(self) -> FastAPI:
         """Get FastAPI application."""
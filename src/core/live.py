@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
+from collections import deque
 
+import numpy as np
+
+from .batcher import VenueBatcher
 from .config import settings
 from .discovery import DiscoveryEngine
 from .execution import ExecutionEngine
@@ -12,7 +18,9 @@ from .matcher import EventMatcher
 from .portfolio import Portfolio
 from .risk import RiskManager
 from .sizing import PositionSizer
-from .types import ArbOpportunity, Balance, Trade, Venue
+from .types import ArbOpportunity, Balance, Quote, Trade, Venue
+
+logger = logging.getLogger(__name__)
 
 
 class LiveTradingEngine:
@@ -32,14 +40,16 @@ class LiveTradingEngine:
             min_notional_usd=settings.min_notional_usd,
             max_slippage_bps=settings.max_slippage_bps,
         )
+        # One limits object shared by the risk manager and the sizer
+        risk_limits = settings.get_risk_limits()
         self.risk_manager = RiskManager(
-            risk_limits=settings.get_risk_limits(),
+            risk_limits=risk_limits,
             max_drawdown_pct=settings.max_drawdown_pct,
             circuit_breaker_error_rate=settings.circuit_breaker_error_rate,
             circuit_breaker_latency_ms=settings.circuit_breaker_latency_ms,
         )
         self.position_sizer = PositionSizer(
-            risk_limits=settings.get_risk_limits(),
+            risk_limits=risk_limits,
             kelly_fraction=settings.kelly_fraction,
             bankroll=settings.starting_balance_usd,
         )
@@ -48,12 +58,36 @@ class LiveTradingEngine:
         # Live connectors
         self.connectors: dict[Venue, any] = {}
         self.execution_engine: ExecutionEngine | None = None
+        self.batcher: VenueBatcher | None = None
 
         # Trading state
         self._is_running = False
         self._last_opportunities: list[ArbOpportunity] = []
         self._last_balances: dict[str, Balance] = {}
 
+        # Full status every N iterations, a one-line heartbeat otherwise
+        self._status_every = 10
+        self._iteration = 0
+
+        # Loop telemetry: how late each sleep wakes up, and per-stage timings
+        # of the most recent iteration, in milliseconds
+        self._wake_lag_ms: deque[float] = deque(maxlen=1024)
+        self._stage_ms: dict[str, float] = {}
+
+        # Contract IDs per venue with the monotonic time they were listed;
+        # listing is the heaviest venue call, so it is refreshed on a TTL
+        self._contracts_cache: dict[Venue, tuple[float, list[str]]] = {}
+        self._contracts_ttl = 60.0
+
+        # Opportunities execute concurrently up to this bound; notional of
+        # in-flight trades per event counts toward risk limits until filled
+        self._exec_semaphore = asyncio.Semaphore(settings.max_concurrent_trades)
+        self._pending_exposure: dict[str, float] = {}
+
+        # Exposure per event from filled positions; only add_trade changes
+        # it, so it is rebuilt lazily after each recorded trade
+        self._positions_cache: dict[str, float] | None = None
+
     async def start(self, connectors: dict[Venue, any]) -> None:
         """Start live trading.
         
@@ -62,13 +96,17 @@ class LiveTradingEngine:
         """
         self.connectors = connectors
         self.execution_engine = ExecutionEngine(connectors)
+        self.batcher = VenueBatcher(connectors)
         self._is_running = True
 
-        print("Starting live trading engine...")
-        print("WARNING: This will execute real trades with real money!")
-        print(f"Initial balance: ${settings.starting_balance_usd:,.2f}")
-        print(f"Min edge: {settings.min_edge_bps}bps")
-        print(f"Min notional: ${settings.min_notional_usd}")
+        logger.info("Starting live trading engine...")
+        logger.warning("This will execute real trades with real money!")
+        logger.info(
+            "Initial balance: $%.2f, min edge: %sbps, min notional: $%s",
+            settings.starting_balance_usd,
+            settings.min_edge_bps,
+            settings.min_notional_usd,
+        )
 
         # Verify balances
         await self._verify_balances()
@@ -79,75 +117,126 @@ class LiveTradingEngine:
     async def stop(self) -> None:
         """Stop live trading."""
         self._is_running = False
-        print("Live trading engine stopped.")
+        logger.info("Live trading engine stopped.")
 
     async def _verify_balances(self) -> None:
         """Verify account balances before starting."""
-        print("Verifying account balances...")
+        logger.info("Verifying account balances...")
 
-        for venue, connector in self.connectors.items():
-            try:
-                balances = await connector.get_balance()
-                self._last_balances.update(balances)
+        # Query every venue at once; report each before raising the first error
+        venues = list(self.connectors)
+        results = await asyncio.gather(
+            *(connector.get_balance() for connector in self.connectors.values()),
+            return_exceptions=True,
+        )
 
-                for currency, balance in balances.items():
-                    print(f"{venue.value} {currency}: ${balance.available:,.2f} available")
+        first_error: BaseException | None = None
+        for venue, balances in zip(venues, results, strict=True):
+            if isinstance(balances, BaseException):
+                logger.error("Failed to get balances from %s: %s", venue.value, balances)
+                first_error = first_error or balances
+                continue
 
-                if not balances:
-                    print(f"WARNING: No balances found for {venue.value}")
+            self._last_balances.update(balances)
 
-            except Exception as e:
-                print(f"ERROR: Failed to get balances from {venue.value}: {e}")
-                raise
+            for currency, balance in balances.items():
+                logger.info(
+                    "%s %s: $%.2f available", venue.value, currency, balance.available
+                )
+
+            if not balances:
+                logger.warning("No balances found for %s", venue.value)
+
+        if first_error is not None:
+            raise first_error
 
     async def _discovery_loop(self) -> None:
         """Main discovery and trading loop."""
         while self._is_running:
             try:
+                t0 = time.perf_counter()
+
                 # Update balances
                 await self._update_balances()
+                t1 = time.perf_counter()
 
                 # Discover opportunities
                 opportunities = await self.discovery_engine.discover_opportunities(
                     self.connectors,
                     refresh_contracts=False,  # Refresh every few iterations
                 )
+                t2 = time.perf_counter()
 
                 self._last_opportunities = opportunities
 
                 # Process opportunities
                 await self._process_opportunities(opportunities)
+                t3 = time.perf_counter()
 
                 # Update portfolio
                 await self._update_portfolio()
+                t4 = time.perf_counter()
+
+                self._stage_ms = {
+                    "balances": (t1 - t0) * 1000.0,
+                    "discovery": (t2 - t1) * 1000.0,
+                    "process": (t3 - t2) * 1000.0,
+                    "portfolio": (t4 - t3) * 1000.0,
+                }
 
                 # Print status
                 self._print_status()
 
-                # Wait before next iteration
+                # Wait before next iteration, recording how late the loop wakes
+                wake_target = time.perf_counter() + settings.discovery_interval
                 await asyncio.sleep(settings.discovery_interval)
+                self._wake_lag_ms.append((time.perf_counter() - wake_target) * 1000.0)
 
             except Exception as e:
-                print(f"Error in discovery loop: {e}")
+                logger.exception("Error in discovery loop: %s", e)
                 self.risk_manager.record_error(Venue.POLYMARKET, e)  # Log error
                 await asyncio.sleep(5.0)  # Wait before retrying
 
     async def _update_balances(self) -> None:
         """Update account balances."""
-        for venue, connector in self.connectors.items():
-            try:
-                balances = await connector.get_balance()
+        venues = list(self.connectors)
+        results = await asyncio.gather(
+            *(connector.get_balance() for connector in self.connectors.values()),
+            return_exceptions=True,
+        )
+
+        for venue, balances in zip(venues, results, strict=True):
+            if isinstance(balances, BaseException):
+                logger.warning("Failed to update balances from %s: %s", venue.value, balances)
+                self.risk_manager.record_error(venue, balances)
+            else:
                 self._last_balances.update(balances)
-            except Exception as e:
-                print(f"Failed to update balances from {venue.value}: {e}")
-                self.risk_manager.record_error(venue, e)
 
     async def _process_opportunities(self, opportunities: list[ArbOpportunity]) -> None:
-        """Process discovered opportunities."""
-        for opportunity in opportunities:
+        """Process discovered opportunities, up to max_concurrent_trades at once."""
+        await asyncio.gather(
+            *(self._process_opportunity(opportunity) for opportunity in opportunities)
+        )
+
+    async def _process_opportunity(self, opportunity: ArbOpportunity) -> None:
+        """Risk-check, size and execute a single opportunity."""
+        async with self._exec_semaphore:
             try:
-                # Check risk limits
+                if not await self._legs_still_priced(opportunity):
+                    logger.debug("Skipping opportunity: quotes moved since discovery")
+                    return
+
+                # Check risk limits against filled positions plus the
+                # notional of trades still executing. No await separates the
+                # check from the reservation, so concurrent opportunities
+                # cannot both pass against the same headroom.
                 current_positions = self._get_current_positions()
+                if self._pending_exposure:
+                    current_positions = dict(current_positions)
+                    for event_id, notional in self._pending_exposure.items():
+                        current_positions[event_id] = (
+                            current_positions.get(event_id, 0.0) + notional
+                        )
                 balances = self._last_balances
 
                 is_allowed, reason = self.risk_manager.check_trade_risk(
@@ -157,8 +246,8 @@ class LiveTradingEngine:
                 )
 
                 if not is_allowed:
-                    print(f"Skipping opportunity: {reason}")
-                    continue
+                    logger.debug("Skipping opportunity: %s", reason)
+                    return
 
                 # Calculate position size
                 position_size = self.position_sizer.calculate_position_size(
@@ -168,30 +257,66 @@ class LiveTradingEngine:
                 )
 
                 if position_size <= 0:
-                    print(f"Position size too small: {position_size}")
-                    continue
+                    logger.debug("Position size too small: %s", position_size)
+                    return
 
                 # Execute trade
-                trade = await self._execute_live_trade(opportunity, position_size)
+                event_id = opportunity.event_id
+                self._pending_exposure[event_id] = (
+                    self._pending_exposure.get(event_id, 0.0) + opportunity.notional
+                )
+                try:
+                    trade = await self._execute_live_trade(opportunity, position_size)
+                finally:
+                    remaining = self._pending_exposure[event_id] - opportunity.notional
+                    if remaining > 1e-9:
+                        self._pending_exposure[event_id] = remaining
+                    else:
+                        del self._pending_exposure[event_id]
 
                 if trade:
                     # Record trade
                     self.portfolio.add_trade(trade)
+                    self._positions_cache = None
                     self.risk_manager.record_trade(trade)
 
-                    print(f"Executed live trade: {trade.trade_id}")
-                    print(f"  Event: {trade.event_id}")
-                    print(f"  Size: {trade.qty}")
-                    print(f"  Edge: {trade.edge_bps:.1f}bps")
-                    print(f"  PnL: ${trade.pnl:.2f}")
+                    logger.info(
+                        "Executed live trade %s: event %s, size %s, edge %.1fbps, PnL $%.2f",
+                        trade.trade_id,
+                        trade.event_id,
+                        trade.qty,
+                        trade.edge_bps,
+                        trade.pnl,
+                    )
 
                     # Send alert if configured
                     await self._send_trade_alert(trade)
 
             except Exception as e:
-                print(f"Error processing opportunity: {e}")
+                logger.exception("Error processing opportunity: %s", e)
                 self.risk_manager.record_error(Venue.POLYMARKET, e)
 
+    async def _legs_still_priced(self, opportunity: ArbOpportunity) -> bool:
+        """Re-quote both legs and check each is still offered at its limit.
+
+        Requests from concurrently processed opportunities are coalesced by
+        the batcher into one get_quotes call per venue.
+        """
+        if self.batcher is None:
+            return True
+
+        leg_a, leg_b = opportunity.leg_a, opportunity.leg_b
+        quote_a, quote_b = await asyncio.gather(
+            self.batcher.submit_quote_request(leg_a.venue, leg_a.contract_id),
+            self.batcher.submit_quote_request(leg_b.venue, leg_b.contract_id),
+        )
+        return (
+            quote_a is not None
+            and quote_b is not None
+            and quote_a.best_ask <= leg_a.price
+            and quote_b.best_ask <= leg_b.price
+        )
+
     async def _execute_live_trade(
         self,
         opportunity: ArbOpportunity,
@@ -215,62 +340,112 @@ class LiveTradingEngine:
             return
 
         # This would send an HTTP request to the webhook
-        # For now, just print the alert
-        print(f"ALERT: Trade executed - {trade.trade_id}")
+        # For now, just log the alert
+        logger.info("ALERT: Trade executed - %s", trade.trade_id)
 
     def _get_current_positions(self) -> dict[str, float]:
-        """Get current positions for risk management."""
-        positions = {}
-        for event_id, venue_positions in self.portfolio.get_positions().items():
-            total_exposure = 0.0
-            for position in venue_positions.values():
-                if position.qty > 0:
-                    total_exposure += position.qty * position.avg_price
-            positions[event_id] = total_exposure
-        return positions
+        """Get current positions for risk management.
+
+        The returned dict is shared between calls and must not be mutated.
+        """
+        if self._positions_cache is None:
+            self._positions_cache = self._compute_positions()
+        return self._positions_cache
+
+    def _compute_positions(self) -> dict[str, float]:
+        """Sum open exposure per event across venues."""
+        return {
+            event_id: sum(
+                position.qty * position.avg_price
+                for position in venue_positions.values()
+                if position.qty > 0
+            )
+            for event_id, venue_positions in self.portfolio.get_positions().items()
+        }
 
     async def _update_portfolio(self) -> None:
         """Update portfolio with latest quotes."""
-        # Get latest quotes from all venues
-        for venue, connector in self.connectors.items():
-            try:
-                # Get contracts for this venue
-                contracts = await connector.list_contracts()
-                contract_ids = [c.contract_id for c in contracts]
-
-                # Get quotes
-                quotes = await connector.get_quotes(contract_ids)
+        # Get latest quotes from all venues in parallel
+        venues = list(self.connectors)
+        results = await asyncio.gather(
+            *(
+                self._fetch_quotes(venue, connector)
+                for venue, connector in self.connectors.items()
+            ),
+            return_exceptions=True,
+        )
 
-                # Update portfolio
+        for venue, quotes in zip(venues, results, strict=True):
+            if isinstance(quotes, BaseException):
+                logger.warning("Failed to update quotes from %s: %s", venue.value, quotes)
+                # Relist on the next pass in case the contract set changed
+                self._contracts_cache.pop(venue, None)
+                self.risk_manager.record_error(venue, quotes)
+            else:
                 self.portfolio.update_quotes(quotes)
 
-            except Exception as e:
-                print(f"Failed to update quotes from {venue.value}: {e}")
-                self.risk_manager.record_error(venue, e)
+    async def _fetch_quotes(self, venue: Venue, connector: any) -> list[Quote]:
+        """Get quotes for every contract listed on one venue."""
+        now = time.monotonic()
+        cached = self._contracts_cache.get(venue)
+        if cached is not None and now - cached[0] < self._contracts_ttl:
+            contract_ids = cached[1]
+        else:
+            if self.batcher is not None:
+                contracts = await self.batcher.list_contracts(venue)
+            else:
+                contracts = await connector.list_contracts()
+            contract_ids = [c.contract_id for c in contracts]
+            self._contracts_cache[venue] = (now, contract_ids)
+
+        return await connector.get_quotes(contract_ids)
 
     def _print_status(self) -> None:
-        """Print current status."""
+        """Log current status, in full every _status_every iterations."""
+        self._iteration += 1
+        if (self._iteration - 1) % self._status_every:
+            logger.info(
+                "Iteration %d: %d opportunities",
+                self._iteration,
+                len(self._last_opportunities),
+            )
+            return
+
         summary = self.portfolio.get_portfolio_summary()
         risk_summary = self.risk_manager.get_risk_summary()
 
-        print("\n--- Live Trading Status ---")
-        print(f"Balance: ${summary['current_balance']:,.2f}")
-        print(f"Total PnL: ${summary['total_pnl']:,.2f}")
-        print(f"Total Return: {summary['total_return_pct']:.2f}%")
-        print(f"Active Positions: {summary['active_positions']}")
-        print(f"Total Trades: {summary['total_trades']}")
-        print(f"Win Rate: {summary['win_rate']:.1f}%")
-        print(f"Opportunities: {len(self._last_opportunities)}")
-
-        # Print balances
-        print("Account Balances:")
-        for currency, balance in self._last_balances.items():
-            print(f"  {balance.venue.value} {currency}: ${balance.available:,.2f}")
+        lines = [
+            "--- Live Trading Status ---",
+            f"Balance: ${summary['current_balance']:,.2f}",
+            f"Total PnL: ${summary['total_pnl']:,.2f}",
+            f"Total Return: {summary['total_return_pct']:.2f}%",
+            f"Active Positions: {summary['active_positions']}",
+            f"Total Trades: {summary['total_trades']}",
+            f"Win Rate: {summary['win_rate']:.1f}%",
+            f"Opportunities: {len(self._last_opportunities)}",
+            "Account Balances:",
+        ]
+        lines.extend(
+            f"  {balance.venue.value} {currency}: ${balance.available:,.2f}"
+            for currency, balance in self._last_balances.items()
+        )
 
         if risk_summary['active_circuit_breakers']:
-            print(f"Circuit Breakers: {risk_summary['active_circuit_breakers']}")
-
-        print("--- End Status ---\n")
+            lines.append(f"Circuit Breakers: {risk_summary['active_circuit_breakers']}")
+
+        if self._stage_ms:
+            lines.append("Loop: " + ", ".join(
+                f"{stage} {ms:.1f}ms" for stage, ms in self._stage_ms.items()
+            ))
+        latency = self.get_loop_latency_stats()
+        if latency:
+            lines.append(
+                f"Wake lag: p50 {latency['wake_lag_p50_ms']:.2f}ms, "
+                f"p99 {latency['wake_lag_p99_ms']:.2f}ms"
+            )
+
+        lines.append("--- End Status ---")
+        logger.info("\n".join(lines))
 
     def get_status(self) -> dict[str, any]:
         """Get current status."""
@@ -283,8 +458,24 @@ class LiveTradingEngine:
             "opportunities": len(self._last_opportunities),
             "balances": self._last_balances,
             "is_running": self._is_running,
+            "loop_latency": self.get_loop_latency_stats(),
         }
 
+    def get_loop_latency_stats(self) -> dict[str, float]:
+        """Get event-loop wake lag percentiles and the last stage timings.
+
+        Wake lag is how long after its scheduled time the sleep between
+        iterations returned; growth points at a blocked event loop rather
+        than slow venues.
+        """
+        if not self._wake_lag_ms:
+            return {}
+
+        p50, p99 = np.percentile(np.fromiter(self._wake_lag_ms, dtype=np.float64), [50, 99])
+        stats = {"wake_lag_p50_ms": float(p50), "wake_lag_p99_ms": float(p99)}
+        stats.update({f"{stage}_ms": ms for stage, ms in self._stage_ms.items()})
+        return stats
+
     def get_opportunities(self) -> list[ArbOpportunity]:
         """Get last discovered opportunities."""
         return self._last_opportunities.copy()
@@ -0,0 +1,47 @@
+"""Process-wide logging setup.
+
+Handlers run on a background thread behind a queue, so log calls made from
+the event loop only enqueue a record instead of blocking on stream I/O.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listener: QueueListener | None = None
+
+
+def configure_logging(level: int | str = logging.INFO) -> QueueListener:
+    """Route root logging through a queue drained by a listener thread.
+
+    Safe to call more than once; later calls only update the level.
+
+    Args:
+        level: Root logger level, as a number or a name such as "INFO"
+
+    Returns:
+        The running queue listener (stopped automatically at exit)
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _listener is not None:
+        return _listener
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    return _listener
@@ -3,24 +3,117 @@
 from __future__ import annotations
 
 import csv
+import logging
 import re
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 from .types import Contract, MatchedPair
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional (pip install pm-arb[perf])
+    process = None
+
+logger = logging.getLogger(__name__)
+
+# Expiry similarity falls linearly to zero at this gap
+_EXPIRY_MAX_DIFF_S = 7 * 24 * 3600
+
+# Weights of the title and expiry similarity in a match score
+_TITLE_WEIGHT = 0.6
+_EXPIRY_WEIGHT = 0.4
+
+# Words dropped from titles before comparison
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "up", "about", "into", "through", "during",
+    "before", "after", "above", "below", "between", "among", "is", "are",
+    "was", "were", "be", "been", "being", "have", "has", "had", "do",
+    "does", "did", "will", "would", "could", "should", "may", "might",
+    "must", "can", "shall", "this", "that", "these", "those", "i", "you",
+    "he", "she", "it", "we", "they", "me", "him", "her", "us", "them"
+})
+
+_PUNCT_RE = re.compile(r'[^\w]+')
+
+
+@lru_cache(maxsize=4096)
+def normalize_title(title: str) -> str:
+    """Normalize an event title for comparison.
+
+    Lowercases, drops stopwords and strips punctuation. Results are cached
+    since the same titles are compared against many candidates.
+    """
+    if not title:
+        return ""
+
+    cleaned_words = []
+    for word in title.lower().split():
+        # Stopwords are checked before punctuation is stripped
+        if word in _STOPWORDS:
+            continue
+        cleaned = _PUNCT_RE.sub('', word)
+        if cleaned:
+            cleaned_words.append(cleaned)
+
+    return " ".join(cleaned_words)
+
+
+@dataclass(slots=True)
+class _EventColumns:
+    """Representative fields of event groups laid out as parallel columns."""
+
+    groups: list[list[Contract]]
+    normalized: list[str]
+    empty: np.ndarray
+    expiries: np.ndarray
+
+    @classmethod
+    def from_groups(cls, groups: list[list[Contract]]) -> _EventColumns:
+        """Read each group's first contract once into flat columns."""
+        titles = [group[0].event_key for group in groups]
+        return cls(
+            groups=groups,
+            normalized=[normalize_title(title) for title in titles],
+            empty=np.array([not title for title in titles], dtype=bool),
+            expiries=np.array([group[0].expires_ts for group in groups], dtype=np.float64),
+        )
+
+
+def title_prefix_block(normalized_title: str) -> Hashable:
+    """Blocking key from the first three words of a normalized title.
+
+    Suitable as ``EventMatcher(blocking_fn=...)``: only events whose titles
+    share their leading words are fuzzy-scored against each other.
+    """
+    return tuple(sorted(normalized_title.split()[:3]))
+
 
 class EventMatcher:
     """Matches events across different venues."""
 
-    def __init__(self, mappings_file: str | None = None):
+    def __init__(
+        self,
+        mappings_file: str | None = None,
+        blocking_fn: Callable[[str], Hashable] | None = None,
+    ):
         """Initialize event matcher.
         
         Args:
             mappings_file: Path to CSV file with manual event mappings
+            blocking_fn: Optional function mapping a normalized title to a
+                block key; fuzzy scoring then only compares events within
+                the same block instead of every pair
         """
         self.mappings_file = mappings_file
+        self.blocking_fn = blocking_fn
         self.manual_mappings: dict[str, str] = {}
         self._load_manual_mappings()
 
@@ -30,17 +123,30 @@ class EventMatcher:
             return
 
         try:
-            with open(self.mappings_file, encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(self.mappings_file, encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                if 'venue_a_id' not in header or 'venue_b_id' not in header:
+                    logger.warning("No venue_a_id/venue_b_id columns in %s", self.mappings_file)
+                    return
+                a_idx = header.index('venue_a_id')
+                b_idx = header.index('venue_b_id')
+                width = max(a_idx, b_idx) + 1
+
+                pairs = []
                 for row in reader:
-                    venue_a_id = row.get('venue_a_id', '').strip()
-                    venue_b_id = row.get('venue_b_id', '').strip()
+                    if len(row) < width:
+                        continue
+                    venue_a_id = row[a_idx].strip()
+                    venue_b_id = row[b_idx].strip()
                     if venue_a_id and venue_b_id:
-                        self.manual_mappings[venue_a_id] = venue_b_id
-                        self.manual_mappings[venue_b_id] = venue_a_id
+                        pairs.append((venue_a_id, venue_b_id))
+                        pairs.append((venue_b_id, venue_a_id))
+
+            self.manual_mappings.update(pairs)
 
-        except Exception as e:
-            print(f"Failed to load manual mappings: {e}")
+        except Exception:
+            logger.exception("Failed to load manual mappings from %s", self.mappings_file)
 
     def match_events(
         self,
@@ -77,37 +183,211 @@ class EventMatcher:
                     )
                     matched_pairs.extend(pairs)
 
-        # Find automatic matches
-        for event_id_a, contracts_a_group in events_a.items():
-            if event_id_a in self.manual_mappings:
-                continue  # Skip manually mapped events
+        # Find automatic matches, skipping manually mapped events
+        auto_a = [
+            group for event_id, group in events_a.items()
+            if event_id not in self.manual_mappings
+        ]
+        auto_b = [
+            group for event_id, group in events_b.items()
+            if event_id not in self.manual_mappings
+        ]
+        if not auto_a or not auto_b:
+            return matched_pairs
+
+        # Stage 1: exact normalized-title matches
+        exact_b: dict[str, list[list[Contract]]] = {}
+        for group in auto_b:
+            if group[0].event_key:
+                title = self._normalize_title(group[0].event_key)
+                exact_b.setdefault(title, []).append(group)
+
+        fuzzy_a = []
+        for contracts_a_group in auto_a:
+            title = contracts_a_group[0].event_key
+            candidates = exact_b.get(self._normalize_title(title)) if title else None
+            if candidates:
+                best_match, best_score = self._best_match(
+                    contracts_a_group,
+                    candidates,
+                    [1.0] * len(candidates),
+                    min_confidence,
+                )
+                if best_match:
+                    matched_pairs.extend(self._create_matched_pairs(
+                        contracts_a_group,
+                        best_match,
+                        confidence_score=best_score,
+                        match_reason="exact_title",
+                    ))
+                    continue
+            fuzzy_a.append(contracts_a_group)
+
+        # Stage 2: fuzzy scoring, within blocks if a blocking function is set
+        max_gap = self._max_expiry_gap(min_confidence)
+        for block_a, block_b in self._block_groups(fuzzy_a, auto_b):
+            columns_a = _EventColumns.from_groups(block_a)
+            if max_gap is None:
+                best_matches = self._best_matches_matrix(
+                    columns_a, _EventColumns.from_groups(block_b), min_confidence
+                )
+            else:
+                best_matches = self._best_matches_windowed(
+                    columns_a, block_b, max_gap, min_confidence
+                )
 
-            best_match = None
-            best_score = 0.0
+            for contracts_a_group, (best_match, best_score) in zip(
+                block_a, best_matches, strict=True
+            ):
+                if best_match:
+                    matched_pairs.extend(self._create_matched_pairs(
+                        contracts_a_group,
+                        best_match,
+                        confidence_score=best_score,
+                        match_reason="automatic",
+                    ))
 
-            for event_id_b, contracts_b_group in events_b.items():
-                if event_id_b in self.manual_mappings:
-                    continue  # Skip manually mapped events
+        return matched_pairs
 
-                score = self._calculate_match_score(
-                    contracts_a_group,
-                    contracts_b_group,
-                )
+    def _best_match(
+        self,
+        contracts_a_group: list[Contract],
+        candidates: list[list[Contract]],
+        title_scores: list[float],
+        min_confidence: float,
+    ) -> tuple[list[Contract] | None, float]:
+        """Pick the highest scoring candidate group above min_confidence."""
+        expires_a = contracts_a_group[0].expires_ts
+        best_match = None
+        best_score = 0.0
+
+        for contracts_b_group, title_score in zip(candidates, title_scores, strict=True):
+            gap = abs(expires_a - contracts_b_group[0].expires_ts)
+            expiry_score = max(0.0, 1.0 - gap / _EXPIRY_MAX_DIFF_S)
+            score = min(_TITLE_WEIGHT * title_score + _EXPIRY_WEIGHT * expiry_score, 1.0)
+
+            if score > best_score and score >= min_confidence:
+                best_match = contracts_b_group
+                best_score = score
+
+        return best_match, best_score
+
+    def _best_matches_matrix(
+        self,
+        columns_a: _EventColumns,
+        columns_b: _EventColumns,
+        min_confidence: float,
+    ) -> list[tuple[list[Contract] | None, float]]:
+        """Best candidate for every A group, scoring all pairs as matrices.
+
+        Same selection as ``_best_match`` per row: the first highest score
+        that is positive and at least min_confidence.
+        """
+        title_scores = self._normalized_similarity_matrix(
+            columns_a.normalized, columns_b.normalized, columns_a.empty, columns_b.empty
+        )
+        expiry_scores = self._expiry_similarity_matrix(
+            columns_a.expiries, columns_b.expiries
+        )
 
-                if score > best_score and score >= min_confidence:
-                    best_match = contracts_b_group
-                    best_score = score
+        return [
+            (columns_b.groups[j], score) if j >= 0 else (None, 0.0)
+            for j, score in self._select_best(title_scores, expiry_scores, min_confidence)
+        ]
 
-            if best_match:
-                pairs = self._create_matched_pairs(
-                    contracts_a_group,
-                    best_match,
-                    confidence_score=best_score,
-                    match_reason="automatic",
-                )
-                matched_pairs.extend(pairs)
+    def _best_matches_windowed(
+        self,
+        columns_a: _EventColumns,
+        groups_b: list[list[Contract]],
+        max_gap: float,
+        min_confidence: float,
+    ) -> list[tuple[list[Contract] | None, float]]:
+        """Best candidate for every A group among B groups within max_gap.
+
+        B groups are sorted by expiry once and each A group scores only the
+        searchsorted slice of candidates that can still match.
+        """
+        columns_b = _EventColumns.from_groups(
+            sorted(groups_b, key=lambda group: group[0].expires_ts)
+        )
+        los = np.searchsorted(columns_b.expiries, columns_a.expiries - max_gap, side="left")
+        his = np.searchsorted(columns_b.expiries, columns_a.expiries + max_gap, side="right")
+
+        best_matches = []
+        for i, (lo, hi) in enumerate(zip(los.tolist(), his.tolist(), strict=True)):
+            if lo == hi:
+                best_matches.append((None, 0.0))
+                continue
+
+            title_scores = self._normalized_similarity_matrix(
+                columns_a.normalized[i:i + 1],
+                columns_b.normalized[lo:hi],
+                columns_a.empty[i:i + 1],
+                columns_b.empty[lo:hi],
+                workers=1,
+            )
+            expiry_scores = self._expiry_similarity_matrix(
+                columns_a.expiries[i:i + 1], columns_b.expiries[lo:hi]
+            )
+
+            ((j, score),) = self._select_best(title_scores, expiry_scores, min_confidence)
+            best_matches.append((columns_b.groups[lo + j], score) if j >= 0 else (None, 0.0))
+
+        return best_matches
+
+    def _select_best(
+        self,
+        title_scores: np.ndarray,
+        expiry_scores: np.ndarray,
+        min_confidence: float,
+    ) -> list[tuple[int, float]]:
+        """Per row, the column of the first highest qualifying score, or -1."""
+        scores = np.minimum(
+            _TITLE_WEIGHT * title_scores + _EXPIRY_WEIGHT * expiry_scores, 1.0
+        )
+        scores[(scores < min_confidence) | (scores <= 0.0)] = -np.inf
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(scores.shape[0]), best]
 
-        return matched_pairs
+        return [
+            (j, score) if score > -np.inf else (-1, 0.0)
+            for j, score in zip(best.tolist(), best_scores.tolist(), strict=True)
+        ]
+
+    def _max_expiry_gap(self, min_confidence: float) -> float | None:
+        """Largest expiry gap in seconds that can still reach min_confidence.
+
+        Even a perfect title score needs enough expiry similarity to clear
+        the threshold, so pairs further apart can be skipped unscored.
+        Returns None when the title alone can clear it.
+        """
+        if min_confidence <= _TITLE_WEIGHT:
+            return None
+        needed = (min_confidence - _TITLE_WEIGHT) / _EXPIRY_WEIGHT
+        # Small slack so float rounding never drops a boundary pair
+        return (1.0 - needed) * _EXPIRY_MAX_DIFF_S + 1e-6
+
+    def _block_groups(
+        self,
+        groups_a: list[list[Contract]],
+        groups_b: list[list[Contract]],
+    ) -> list[tuple[list[list[Contract]], list[list[Contract]]]]:
+        """Split event groups into blocks that are fuzzy-scored together."""
+        if not groups_a or not groups_b:
+            return []
+        if self.blocking_fn is None:
+            return [(groups_a, groups_b)]
+
+        blocks: dict[Hashable, tuple[list, list]] = {}
+        for groups, side in ((groups_a, 0), (groups_b, 1)):
+            for group in groups:
+                key = self.blocking_fn(self._normalize_title(group[0].event_key))
+                blocks.setdefault(key, ([], []))[side].append(group)
+
+        return [
+            (block_a, block_b) for block_a, block_b in blocks.values()
+            if block_a and block_b
+        ]
 
     def _group_contracts_by_event(self, contracts: list[Contract]) -> dict[str, list[Contract]]:
         """Group contracts by normalized event ID."""
@@ -129,11 +409,18 @@ class EventMatcher:
         """Create matched pairs from contract groups."""
         pairs = []
 
-        # Find YES and NO contracts for each venue
-        yes_a = next((c for c in contracts_a if c.side.value == "YES"), None)
-        no_a = next((c for c in contracts_a if c.side.value == "NO"), None)
-        yes_b = next((c for c in contracts_b if c.side.value == "YES"), None)
-        no_b = next((c for c in contracts_b if c.side.value == "NO"), None)
+        # Find YES and NO contracts for each venue (first of each side wins)
+        a_by_side: dict[str, Contract] = {}
+        for contract in contracts_a:
+            a_by_side.setdefault(contract.side_str, contract)
+        b_by_side: dict[str, Contract] = {}
+        for contract in contracts_b:
+            b_by_side.setdefault(contract.side_str, contract)
+
+        yes_a = a_by_side.get("YES")
+        no_a = a_by_side.get("NO")
+        yes_b = b_by_side.get("YES")
+        no_b = b_by_side.get("NO")
 
         if yes_a and yes_b:
             pairs.append(MatchedPair(
@@ -155,38 +442,6 @@ class EventMatcher:
 
         return pairs
 
-    def _calculate_match_score(
-        self,
-        contracts_a: list[Contract],
-        contracts_b: list[Contract],
-    ) -> float:
-        """Calculate match score between two contract groups."""
-        if not contracts_a or not contracts_b:
-            return 0.0
-
-        # Get representative contracts
-        contract_a = contracts_a[0]
-        contract_b = contracts_b[0]
-
-        # Calculate various similarity scores
-        title_score = self._calculate_title_similarity(
-            contract_a.event_key,
-            contract_b.event_key,
-        )
-
-        expiry_score = self._calculate_expiry_similarity(
-            contract_a.expires_at,
-            contract_b.expires_at,
-        )
-
-        # Weighted combination
-        total_score = (
-            0.6 * title_score +
-            0.4 * expiry_score
-        )
-
-        return min(total_score, 1.0)
-
     def _calculate_title_similarity(self, title_a: str, title_b: str) -> float:
         """Calculate similarity between event titles."""
         if not title_a or not title_b:
@@ -196,8 +451,11 @@ class EventMatcher:
         norm_a = self._normalize_title(title_a)
         norm_b = self._normalize_title(title_b)
 
-        # Calculate string similarity
-        similarity = SequenceMatcher(None, norm_a, norm_b).ratio()
+        # Calculate string similarity, in C++ when RapidFuzz is installed
+        if process is not None:
+            similarity = fuzz.ratio(norm_a, norm_b) / 100.0
+        else:
+            similarity = SequenceMatcher(None, norm_a, norm_b).ratio()
 
         # Boost score for exact matches
         if norm_a == norm_b:
@@ -205,6 +463,40 @@ class EventMatcher:
 
         return similarity
 
+    def _normalized_similarity_matrix(
+        self,
+        norm_a: list[str],
+        norm_b: list[str],
+        empty_a: np.ndarray,
+        empty_b: np.ndarray,
+        workers: int = -1,
+    ) -> np.ndarray:
+        """Title similarity matrix from already normalized titles.
+
+        Args:
+            norm_a: Normalized titles for the rows
+            norm_b: Normalized titles for the columns
+            empty_a: True where the raw row title was empty
+            empty_b: True where the raw column title was empty
+            workers: RapidFuzz worker threads; 1 avoids thread start-up
+                cost for small matrices
+        """
+        if process is None:
+            scores = np.array(
+                [[SequenceMatcher(None, a, b).ratio() for b in norm_b] for a in norm_a],
+                dtype=np.float64,
+            ).reshape(len(norm_a), len(norm_b))
+        else:
+            scores = process.cdist(
+                norm_a, norm_b, scorer=fuzz.ratio, dtype=np.float64, workers=workers
+            ) / 100.0
+
+        # Empty titles never match, mirroring _calculate_title_similarity
+        scores[empty_a, :] = 0.0
+        scores[:, empty_b] = 0.0
+
+        return scores
+
     def _calculate_expiry_similarity(self, expiry_a: datetime, expiry_b: datetime) -> float:
         """Calculate similarity between expiry dates."""
         if not expiry_a or not expiry_b:
@@ -218,41 +510,22 @@ class EventMatcher:
         # 1 day difference = 0.8
         # 3 days difference = 0.4
         # 7 days difference = 0.0
-        max_diff = 7 * 24 * 3600  # 7 days in seconds
-        score = max(0.0, 1.0 - (time_diff / max_diff))
+        score = max(0.0, 1.0 - (time_diff / _EXPIRY_MAX_DIFF_S))
 
         return score
 
+    def _expiry_similarity_matrix(
+        self,
+        expiries_a: np.ndarray,
+        expiries_b: np.ndarray,
+    ) -> np.ndarray:
+        """Expiry similarity for every pair of POSIX expiry timestamps."""
+        gaps = np.abs(expiries_a[:, None] - expiries_b[None, :])
+        return np.maximum(0.0, 1.0 - gaps / _EXPIRY_MAX_DIFF_S)
+
     def _normalize_title(self, title: str) -> str:
         """Normalize event title for comparison."""
-        if not title:
-            return ""
-
-        # Convert to lowercase
-        normalized = title.lower()
-
-        # Remove common stopwords
-        stopwords = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "up", "about", "into", "through", "during",
-            "before", "after", "above", "below", "between", "among", "is", "are",
-            "was", "were", "be", "been", "being", "have", "has", "had", "do",
-            "does", "did", "will", "would", "could", "should", "may", "might",
-            "must", "can", "shall", "this", "that", "these", "those", "i", "you",
-            "he", "she", "it", "we", "they", "me", "him", "her", "us", "them"
-        }
-
-        words = normalized.split()
-        filtered_words = [word for word in words if word not in stopwords]
-
-        # Remove punctuation and special characters
-        cleaned_words = []
-        for word in filtered_words:
-            cleaned = re.sub(r'[^\w]', '', word)
-            if cleaned:
-                cleaned_words.append(cleaned)
-
-        return " ".join(cleaned_words)
+        return normalize_title(title)
 
     def add_manual_mapping(self, venue_a_id: str, venue_b_id: str) -> None:
         """Add a manual mapping between venues."""
@@ -284,8 +557,8 @@ class EventMatcher:
                         written.add(venue_a_id)
                         written.add(venue_b_id)
 
-        except Exception as e:
-            print(f"Failed to save manual mappings: {e}")
+        except Exception:
+            logger.exception("Failed to save manual mappings to %s", self.mappings_file)
 
     def get_match_statistics(self, matched_pairs: list[MatchedPair]) -> dict[str, float]:
         """Get statistics about matched pairs."""
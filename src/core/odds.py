@@ -2,8 +2,27 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
+
 from .types import ContractSide, Quote
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional (pip install pm-arb[perf])
+    njit = None
+
+# Largest Kelly fraction ever returned
+KELLY_CAP = 0.25
+
+# Price <-> probability is affine per side: offset + sign * value. A dict
+# lookup replaces two enum comparisons on calls made for every quote.
+_SIDE_AFFINE: dict[ContractSide, tuple[float, float]] = {
+    ContractSide.YES: (0.0, 1.0),
+    ContractSide.NO: (1.0, -1.0),
+}
+
 
 def price_to_probability(price: float, side: ContractSide) -> float:
     """Convert contract price to implied probability.
@@ -18,12 +37,10 @@ def price_to_probability(price: float, side: ContractSide) -> float:
     Returns:
         Implied probability (0-1)
     """
-    if side == ContractSide.YES:
-        return price
-    elif side == ContractSide.NO:
-        return 1.0 - price
-    else:
+    terms = _SIDE_AFFINE.get(side)
+    if terms is None:
         raise ValueError(f"Invalid contract side: {side}")
+    return terms[0] + terms[1] * price
 
 
 def probability_to_price(prob: float, side: ContractSide) -> float:
@@ -36,12 +53,10 @@ def probability_to_price(prob: float, side: ContractSide) -> float:
     Returns:
         Contract price (0-1)
     """
-    if side == ContractSide.YES:
-        return prob
-    elif side == ContractSide.NO:
-        return 1.0 - prob
-    else:
+    terms = _SIDE_AFFINE.get(side)
+    if terms is None:
         raise ValueError(f"Invalid contract side: {side}")
+    return terms[0] + terms[1] * prob
 
 
 def effective_price(
@@ -250,9 +265,22 @@ def calculate_liquidity_score(quote: Quote) -> float:
     return total_size / spread_bps
 
 
+@lru_cache(maxsize=64)
+def _ticks_per_unit(tick_size: float) -> float:
+    """Inverse of a tick size, snapped to an integer for decimal ticks."""
+    inv_tick = 1.0 / tick_size
+    nearest = round(inv_tick)
+    if nearest and abs(inv_tick - nearest) <= 1e-9 * inv_tick:
+        return float(nearest)
+    return inv_tick
+
+
 def round_to_tick_size(price: float, tick_size: float) -> float:
     """Round price to venue tick size.
     
+    Dividing the tick count by an integral ticks-per-unit gives the nearest
+    float to the decimal price (0.3, not 0.30000000000000004).
+
     Args:
         price: Raw price
         tick_size: Venue tick size
@@ -263,7 +291,8 @@ def round_to_tick_size(price: float, tick_size: float) -> float:
     if tick_size <= 0:
         return price
 
-    return round(price / tick_size) * tick_size
+    inv_tick = _ticks_per_unit(tick_size)
+    return round(price * inv_tick) / inv_tick
 
 
 def calculate_kelly_fraction(
@@ -276,26 +305,82 @@ def calculate_kelly_fraction(
     Args:
         edge_bps: Arbitrage edge in basis points
         probability: Event probability
-        bankroll: Available bankroll
+        bankroll: Available bankroll (unused, kept for compatibility)
         
     Returns:
         Kelly fraction (0-1)
     """
-    edge_decimal = edge_bps / 10000.0
-
-    if edge_decimal <= 0:
+    if edge_bps <= 0:
         return 0.0
 
-    # Kelly formula: f = (bp - q) / b
-    # where b = odds, p = win probability, q = lose probability
-    # For arbitrage: b = 1 (1:1 payout), p = probability, q = 1-p
-    b = 1.0  # 1:1 payout
-    p = probability
-    q = 1.0 - probability
+    # Kelly formula f = (bp - q) / b with a 1:1 payout (b = 1) and q = 1 - p
+    # reduces to 2p - 1; capped at a reasonable maximum
+    return max(0.0, min(2.0 * probability - 1.0, KELLY_CAP))
 
-    kelly_fraction = (b * p - q) / b
 
-    # Cap at reasonable maximum
-    return max(0.0, min(kelly_fraction, 0.25))
+def _score_directions_numpy(
+    eff_a: np.ndarray,
+    eff_b: np.ndarray,
+    size_a: np.ndarray,
+    size_b: np.ndarray,
+    max_capital: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """NumPy implementation of score_directions."""
+    capital_per_unit = eff_a + eff_b
+    edge_bps = np.maximum(0.0, (1.0 - capital_per_unit) * 10000.0)
+    qty = np.minimum(
+        np.divide(
+            max_capital,
+            capital_per_unit,
+            out=np.zeros_like(capital_per_unit),
+            where=capital_per_unit > 0,
+        ),
+        np.minimum(size_a, size_b),
+    )
+    return edge_bps, qty, qty * capital_per_unit
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _score_directions_jit(eff_a, eff_b, size_a, size_b, max_capital):
+        """Compiled implementation of score_directions."""
+        n = eff_a.shape[0]
+        edge_bps = np.empty(n)
+        qty = np.empty(n)
+        notional = np.empty(n)
+        for i in prange(n):
+            capital_per_unit = eff_a[i] + eff_b[i]
+            edge_bps[i] = max(0.0, (1.0 - capital_per_unit) * 10000.0)
+            qty_capital = max_capital / capital_per_unit if capital_per_unit > 0 else 0.0
+            qty[i] = min(qty_capital, min(size_a[i], size_b[i]))
+            notional[i] = qty[i] * capital_per_unit
+        return edge_bps, qty, notional
+
+
+def score_directions(
+    eff_a: np.ndarray,
+    eff_b: np.ndarray,
+    size_a: np.ndarray,
+    size_b: np.ndarray,
+    max_capital: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Score buying both legs for arrays of effective prices.
 
+    Vectorized equivalent of computing the edge of ``eff_a + eff_b`` and
+    calling ``min_executable_qty`` element-wise. Uses a compiled kernel when
+    numba is installed and falls back to NumPy otherwise.
 
+    Args:
+        eff_a: Effective ask prices at venue A
+        eff_b: Effective ask prices at venue B
+        size_a: Available ask sizes at venue A
+        size_b: Available ask sizes at venue B
+        max_capital: Maximum capital to deploy per pair
+
+    Returns:
+        Tuple of (edge_bps, qty, notional) arrays
+    """
+    if njit is not None:
+        return _score_directions_jit(eff_a, eff_b, size_a, size_b, float(max_capital))
+    return _score_directions_numpy(eff_a, eff_b, size_a, size_b, max_capital)
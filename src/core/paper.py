@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import logging
+import uuid
 from datetime import datetime
 
 from .config import settings
@@ -10,17 +13,35 @@ from .discovery import DiscoveryEngine
 from .execution import ExecutionEngine
 from .fees import create_default_fee_calculator
 from .matcher import EventMatcher
+from .persistence import PersistenceManager
 from .portfolio import Portfolio
 from .risk import RiskManager
 from .sizing import PositionSizer
 from .types import ArbOpportunity, Balance, Trade, Venue
 
+logger = logging.getLogger(__name__)
+
+# Paper trade IDs follow the live scheme, a per-process random prefix plus a
+# counter, so trades executed in the same tick never collide
+_PAPER_TRADE_PREFIX = f"paper_{uuid.uuid4().hex[:12]}"
+_paper_trade_seq = itertools.count(1)
+
+# Simulated balance per venue: (venue, currency, balances key)
+_BALANCE_SLOTS = tuple(
+    (venue, "USD" if venue == Venue.KALSHI else "USDC", f"{venue.value}_USD")
+    for venue in Venue
+)
+
 
 class PaperTradingEngine:
     """Paper trading engine that simulates trades without real money."""
 
-    def __init__(self):
-        """Initialize paper trading engine."""
+    def __init__(self, persistence: PersistenceManager | None = None):
+        """Initialize paper trading engine.
+
+        Args:
+            persistence: Optional store that executed paper trades are saved to
+        """
         self.fee_calculator = create_default_fee_calculator()
         self.event_matcher = EventMatcher()
         self.discovery_engine = DiscoveryEngine(
@@ -30,18 +51,27 @@ class PaperTradingEngine:
             min_notional_usd=settings.min_notional_usd,
             max_slippage_bps=settings.max_slippage_bps,
         )
+        # One limits object shared by the risk manager and the sizer
+        risk_limits = settings.get_risk_limits()
         self.risk_manager = RiskManager(
-            risk_limits=settings.get_risk_limits(),
+            risk_limits=risk_limits,
             max_drawdown_pct=settings.max_drawdown_pct,
             circuit_breaker_error_rate=settings.circuit_breaker_error_rate,
             circuit_breaker_latency_ms=settings.circuit_breaker_latency_ms,
         )
         self.position_sizer = PositionSizer(
-            risk_limits=settings.get_risk_limits(),
+            risk_limits=risk_limits,
             kelly_fraction=settings.kelly_fraction,
             bankroll=settings.starting_balance_usd,
         )
         self.portfolio = Portfolio(initial_balance=settings.starting_balance_usd)
+        self.persistence = persistence
+
+        # Simulated taker fee per unit of quantity, per venue
+        self._fee_rate: dict[Venue, float] = {
+            venue: settings.get_venue_fees(venue).taker_bps / 10000.0
+            for venue in Venue
+        }
 
         # Mock connectors for paper trading
         self.connectors: dict[Venue, any] = {}
@@ -51,6 +81,12 @@ class PaperTradingEngine:
         self._is_running = False
         self._last_opportunities: list[ArbOpportunity] = []
 
+        # Exposure per event and simulated balances both derive from the
+        # portfolio, which only add_trade changes, so they are rebuilt
+        # lazily after each recorded trade
+        self._positions_cache: dict[str, float] | None = None
+        self._balances_cache: dict[str, Balance] | None = None
+
     async def start(self, connectors: dict[Venue, any]) -> None:
         """Start paper trading.
         
@@ -61,10 +97,13 @@ class PaperTradingEngine:
         self.execution_engine = ExecutionEngine(connectors)
         self._is_running = True
 
-        print("Starting paper trading engine...")
-        print(f"Initial balance: ${settings.starting_balance_usd:,.2f}")
-        print(f"Min edge: {settings.min_edge_bps}bps")
-        print(f"Min notional: ${settings.min_notional_usd}")
+        logger.info("Starting paper trading engine...")
+        logger.info(
+            "Initial balance: $%.2f, min edge: %sbps, min notional: $%s",
+            settings.starting_balance_usd,
+            settings.min_edge_bps,
+            settings.min_notional_usd,
+        )
 
         # Start discovery loop
         await self._discovery_loop()
@@ -72,7 +111,7 @@ class PaperTradingEngine:
     async def stop(self) -> None:
         """Stop paper trading."""
         self._is_running = False
-        print("Paper trading engine stopped.")
+        logger.info("Paper trading engine stopped.")
 
     async def _discovery_loop(self) -> None:
         """Main discovery and trading loop."""
@@ -99,15 +138,43 @@ class PaperTradingEngine:
                 await asyncio.sleep(settings.discovery_interval)
 
             except Exception as e:
-                print(f"Error in discovery loop: {e}")
+                logger.exception("Error in discovery loop: %s", e)
                 await asyncio.sleep(5.0)  # Wait before retrying
 
     async def _process_opportunities(self, opportunities: list[ArbOpportunity]) -> None:
-        """Process discovered opportunities."""
+        """Process discovered opportunities.
+
+        Risk and sizing run in order, each approval reserving its notional
+        against later ones; approved trades then execute concurrently and
+        are recorded once all have finished.
+        """
+        if not opportunities:
+            return
+
+        # Once open risk leaves less headroom than the smallest notional on
+        # offer, every remaining opportunity would fail the total-risk check.
+        # Discovery returns opportunities highest edge first, so stopping
+        # there keeps the best ones.
+        max_open_risk = self.risk_manager.risk_limits.max_open_risk_usd
+        min_notional = min(opportunity.notional for opportunity in opportunities)
+        open_risk = sum(self._get_current_positions().values())
+
+        approved: list[tuple[ArbOpportunity, float]] = []
+        pending_exposure: dict[str, float] = {}
         for opportunity in opportunities:
+            if max_open_risk - open_risk < min_notional:
+                logger.debug("Total risk limit reached; skipping remaining opportunities")
+                break
+
             try:
-                # Check risk limits
+                # Check risk limits against positions plus approvals so far
                 current_positions = self._get_current_positions()
+                if pending_exposure:
+                    current_positions = dict(current_positions)
+                    for event_id, notional in pending_exposure.items():
+                        current_positions[event_id] = (
+                            current_positions.get(event_id, 0.0) + notional
+                        )
                 balances = self._get_current_balances()
 
                 is_allowed, reason = self.risk_manager.check_trade_risk(
@@ -117,7 +184,7 @@ class PaperTradingEngine:
                 )
 
                 if not is_allowed:
-                    print(f"Skipping opportunity: {reason}")
+                    logger.debug("Skipping opportunity: %s", reason)
                     continue
 
                 # Calculate position size
@@ -128,25 +195,61 @@ class PaperTradingEngine:
                 )
 
                 if position_size <= 0:
-                    print(f"Position size too small: {position_size}")
+                    logger.debug("Position size too small: %s", position_size)
                     continue
 
-                # Execute trade
-                trade = await self._execute_paper_trade(opportunity, position_size)
+                approved.append((opportunity, position_size))
+                open_risk += opportunity.notional
+                event_id = opportunity.event_id
+                pending_exposure[event_id] = (
+                    pending_exposure.get(event_id, 0.0) + opportunity.notional
+                )
+
+            except Exception as e:
+                logger.exception("Error processing opportunity: %s", e)
+
+        # Execute trades
+        results = await asyncio.gather(
+            *(
+                self._execute_paper_trade(opportunity, position_size)
+                for opportunity, position_size in approved
+            ),
+            return_exceptions=True,
+        )
 
-                if trade:
-                    # Record trade
-                    self.portfolio.add_trade(trade)
-                    self.risk_manager.record_trade(trade)
+        # Record trades; nothing awaits in between, so the portfolio and
+        # risk manager see them one at a time
+        executed: list[Trade] = []
+        for trade in results:
+            if isinstance(trade, BaseException):
+                logger.error("Error processing opportunity: %s", trade, exc_info=trade)
+                continue
+            if not trade:
+                continue
+
+            self.portfolio.add_trade(trade)
+            self.risk_manager.record_trade(trade)
+            executed.append(trade)
+
+            logger.info(
+                "Executed paper trade %s: event %s, size %s, edge %.1fbps, PnL $%.2f",
+                trade.trade_id,
+                trade.event_id,
+                trade.qty,
+                trade.edge_bps,
+                trade.pnl,
+            )
 
-                    print(f"Executed paper trade: {trade.trade_id}")
-                    print(f"  Event: {trade.event_id}")
-                    print(f"  Size: {trade.qty}")
-                    print(f"  Edge: {trade.edge_bps:.1f}bps")
-                    print(f"  PnL: ${trade.pnl:.2f}")
+        if executed:
+            self._positions_cache = None
+            self._balances_cache = None
 
+        # One transaction for the whole iteration's trades
+        if self.persistence is not None and executed:
+            try:
+                self.persistence.save_trades_bulk(executed)
             except Exception as e:
-                print(f"Error processing opportunity: {e}")
+                logger.exception("Error saving paper trades: %s", e)
 
     async def _execute_paper_trade(
         self,
@@ -155,8 +258,9 @@ class PaperTradingEngine:
     ) -> Trade | None:
         """Execute a paper trade."""
         # Simulate trade execution
+        now = datetime.utcnow()
         trade = Trade(
-            trade_id=f"paper_{datetime.utcnow().timestamp()}",
+            trade_id=f"{_PAPER_TRADE_PREFIX}-{next(_paper_trade_seq):08x}",
             event_id=opportunity.event_id,
             venue_a=opportunity.leg_a.venue,
             venue_b=opportunity.leg_b.venue,
@@ -172,31 +276,39 @@ class PaperTradingEngine:
             edge_bps=opportunity.edge_bps,
             pnl=self._calculate_paper_pnl(opportunity, position_size),
             status="filled",
-            created_at=datetime.utcnow(),
-            filled_at=datetime.utcnow(),
+            created_at=now,
+            filled_at=now,
         )
 
         return trade
 
     def _simulate_fee(self, venue: Venue, qty: float) -> float:
         """Simulate trading fees."""
-        fee_model = settings.get_venue_fees(venue)
-        return qty * (fee_model.taker_bps / 10000.0)
+        return qty * self._fee_rate[venue]
 
     def _calculate_paper_pnl(self, opportunity: ArbOpportunity, qty: float) -> float:
         """Calculate PnL for paper trade."""
         edge_decimal = opportunity.edge_bps / 10000.0
-        gross_pnl = qty * edge_decimal
 
         # Subtract estimated fees
-        fee_a = self._simulate_fee(opportunity.leg_a.venue, qty)
-        fee_b = self._simulate_fee(opportunity.leg_b.venue, qty)
+        fee_rate = (
+            self._fee_rate[opportunity.leg_a.venue]
+            + self._fee_rate[opportunity.leg_b.venue]
+        )
 
-        net_pnl = gross_pnl - fee_a - fee_b
-        return net_pnl
+        return qty * (edge_decimal - fee_rate)
 
     def _get_current_positions(self) -> dict[str, float]:
-        """Get current positions for risk management."""
+        """Get current positions for risk management.
+
+        The returned dict is shared between calls and must not be mutated.
+        """
+        if self._positions_cache is None:
+            self._positions_cache = self._compute_positions()
+        return self._positions_cache
+
+    def _compute_positions(self) -> dict[str, float]:
+        """Sum open exposure per event across venues."""
         positions = {}
         for event_id, venue_positions in self.portfolio.get_positions().items():
             total_exposure = 0.0
@@ -207,18 +319,22 @@ class PaperTradingEngine:
         return positions
 
     def _get_current_balances(self) -> dict[str, Balance]:
-        """Get current balances."""
+        """Get current balances.
+
+        The returned dict is shared between calls and must not be mutated.
+        """
+        if self._balances_cache is None:
+            self._balances_cache = self._compute_balances()
+        return self._balances_cache
+
+    def _compute_balances(self) -> dict[str, Balance]:
+        """Split the paper balance evenly across venues."""
         # For paper trading, return mock balances
-        balances = {}
-        for venue in Venue:
-            balance = Balance(
-                venue=venue,
-                currency="USD" if venue == Venue.KALSHI else "USDC",
-                available=self.portfolio.current_balance / len(Venue),
-                total=self.portfolio.current_balance / len(Venue),
-            )
-            balances[f"{venue.value}_USD"] = balance
-        return balances
+        share = self.portfolio.current_balance / len(_BALANCE_SLOTS)
+        return {
+            key: Balance(venue=venue, currency=currency, available=share, total=share)
+            for venue, currency, key in _BALANCE_SLOTS
+        }
 
     def _update_portfolio(self) -> None:
         """Update portfolio with latest quotes."""
@@ -227,23 +343,29 @@ class PaperTradingEngine:
         pass
 
     def _print_status(self) -> None:
-        """Print current status."""
+        """Log current status."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         summary = self.portfolio.get_portfolio_summary()
         risk_summary = self.risk_manager.get_risk_summary()
 
-        print("\n--- Paper Trading Status ---")
-        print(f"Balance: ${summary['current_balance']:,.2f}")
-        print(f"Total PnL: ${summary['total_pnl']:,.2f}")
-        print(f"Total Return: {summary['total_return_pct']:.2f}%")
-        print(f"Active Positions: {summary['active_positions']}")
-        print(f"Total Trades: {summary['total_trades']}")
-        print(f"Win Rate: {summary['win_rate']:.1f}%")
-        print(f"Opportunities: {len(self._last_opportunities)}")
+        lines = [
+            "--- Paper Trading Status ---",
+            f"Balance: ${summary['current_balance']:,.2f}",
+            f"Total PnL: ${summary['total_pnl']:,.2f}",
+            f"Total Return: {summary['total_return_pct']:.2f}%",
+            f"Active Positions: {summary['active_positions']}",
+            f"Total Trades: {summary['total_trades']}",
+            f"Win Rate: {summary['win_rate']:.1f}%",
+            f"Opportunities: {len(self._last_opportunities)}",
+        ]
 
         if risk_summary['active_circuit_breakers']:
-            print(f"Circuit Breakers: {risk_summary['active_circuit_breakers']}")
+            lines.append(f"Circuit Breakers: {risk_summary['active_circuit_breakers']}")
 
-        print("--- End Status ---\n")
+        lines.append("--- End Status ---")
+        logger.info("\n".join(lines))
 
     def get_status(self) -> dict[str, any]:
         """Get current status."""
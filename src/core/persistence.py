@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import logging
+from datetime import UTC, datetime, timedelta
 
+import numpy as np
+from sqlalchemy import Index, case, delete, event, func, inspect
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Field, Session, SQLModel, create_engine, select
 
+from .portfolio import trade_pnl_stats
 from .types import (
     Balance,
     ContractSide,
@@ -16,16 +22,25 @@ from .types import (
     Venue,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # SQLModel classes for database persistence
 class TradeRecord(SQLModel, table=True):
     """Trade record for database storage."""
 
     __tablename__ = "trades"
+    # get_trades filters on event or venue and reads newest first; each
+    # index serves both the filter and the ORDER BY created_at
+    __table_args__ = (
+        Index("ix_trades_event_created", "event_id", "created_at"),
+        Index("ix_trades_venue_a_created", "venue_a", "created_at"),
+        Index("ix_trades_venue_b_created", "venue_b", "created_at"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     trade_id: str = Field(unique=True, index=True)
-    event_id: str = Field(index=True)
+    event_id: str
     venue_a: str
     venue_b: str
     contract_a: str
@@ -49,6 +64,10 @@ class PositionRecord(SQLModel, table=True):
     """Position record for database storage."""
 
     __tablename__ = "positions"
+    # One row per venue contract; save_position upserts against it
+    __table_args__ = (
+        Index("uq_position_venue_contract", "venue", "contract_id", unique=True),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     venue: str
@@ -67,16 +86,18 @@ class QuoteRecord(SQLModel, table=True):
     """Quote record for database storage."""
 
     __tablename__ = "quotes"
+    # Latest quotes for a contract come straight off this index
+    __table_args__ = (Index("ix_quotes_contract_ts", "contract_id", "ts"),)
 
     id: int | None = Field(default=None, primary_key=True)
     venue: str
-    contract_id: str = Field(index=True)
+    contract_id: str
     best_bid: float
     best_ask: float
     best_bid_size: float
     best_ask_size: float
     mid_price: float | None = None
-    ts: datetime
+    ts: datetime = Field(index=True)
 
 
 class BalanceRecord(SQLModel, table=True):
@@ -92,6 +113,114 @@ class BalanceRecord(SQLModel, table=True):
     ts: datetime
 
 
+# Columns read back into domain objects, in unpacking order. Selecting plain
+# columns returns lightweight tuples instead of ORM instances, skipping
+# identity-map bookkeeping for every record.
+_TRADE_COLUMNS = tuple(
+    getattr(TradeRecord, name) for name in (
+        "trade_id", "event_id", "venue_a", "venue_b", "contract_a",
+        "contract_b", "side_a", "side_b", "qty", "price_a", "price_b",
+        "fee_a", "fee_b", "edge_bps", "pnl", "status", "created_at",
+        "filled_at",
+    )
+)
+_POSITION_COLUMNS = tuple(
+    getattr(PositionRecord, name) for name in (
+        "venue", "contract_id", "normalized_event_id", "side", "qty",
+        "avg_price", "unrealized_pnl", "realized_pnl", "created_at",
+        "updated_at",
+    )
+)
+_QUOTE_COLUMNS = tuple(
+    getattr(QuoteRecord, name) for name in (
+        "venue", "contract_id", "best_bid", "best_ask", "best_bid_size",
+        "best_ask_size", "ts", "mid_price",
+    )
+)
+_BALANCE_COLUMNS = tuple(
+    getattr(BalanceRecord, name) for name in (
+        "venue", "currency", "available", "total", "ts",
+    )
+)
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE, and the position columns an
+# upsert overwrites
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+_POSITION_UPDATE_COLUMNS = (
+    "qty", "avg_price", "unrealized_pnl", "realized_pnl", "updated_at",
+)
+
+# WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+# fsyncs at checkpoints rather than on every commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    """Apply write-friendly PRAGMAs to each new SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _trade_record(trade: Trade) -> TradeRecord:
+    """Convert a trade to its database record."""
+    return TradeRecord(
+        trade_id=trade.trade_id,
+        event_id=trade.event_id,
+        venue_a=trade.venue_a.value,
+        venue_b=trade.venue_b.value,
+        contract_a=trade.contract_a,
+        contract_b=trade.contract_b,
+        side_a=trade.side_a.value,
+        side_b=trade.side_b.value,
+        qty=trade.qty,
+        price_a=trade.price_a,
+        price_b=trade.price_b,
+        fee_a=trade.fee_a,
+        fee_b=trade.fee_b,
+        edge_bps=trade.edge_bps,
+        pnl=trade.pnl,
+        status=trade.status,
+        created_at=trade.created_at,
+        filled_at=trade.filled_at,
+        extra=trade.extra if isinstance(trade.extra, str) else None,
+    )
+
+
+def _quote_record(quote: Quote) -> QuoteRecord:
+    """Convert a quote to its database record."""
+    return QuoteRecord(
+        venue=quote.venue.value,
+        contract_id=quote.contract_id,
+        best_bid=quote.best_bid,
+        best_ask=quote.best_ask,
+        best_bid_size=quote.best_bid_size,
+        best_ask_size=quote.best_ask_size,
+        mid_price=quote.mid_price,
+        ts=quote.ts,
+    )
+
+
+def _balance_record(balance: Balance) -> BalanceRecord:
+    """Convert a balance to its database record."""
+    return BalanceRecord(
+        venue=balance.venue.value,
+        currency=balance.currency,
+        available=balance.available,
+        total=balance.total,
+        ts=balance.ts,
+    )
+
+
 class PersistenceManager:
     """Manages data persistence to database."""
 
@@ -102,106 +231,139 @@ class PersistenceManager:
             database_url: Database connection URL
         """
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
+        is_sqlite = database_url.startswith("sqlite")
+        self.engine = create_engine(
+            database_url,
+            echo=False,
+            connect_args={"check_same_thread": False} if is_sqlite else {},
+        )
+        if is_sqlite:
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
 
-        # Create tables
+        # Create tables, and any indexes added since an existing database's
+        # tables were created
         SQLModel.metadata.create_all(self.engine)
+        existing_indexes = {
+            index["name"] for index in inspect(self.engine).get_indexes("positions")
+        }
+        if "uq_position_venue_contract" not in existing_indexes:
+            self._dedupe_positions()
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+    def _dedupe_positions(self) -> None:
+        """Drop duplicate position rows so the unique index can be built.
+
+        Databases created before the index existed may hold several rows per
+        venue contract; the most recently updated one is kept.
+        """
+        with Session(self.engine) as session:
+            rows = session.exec(
+                select(
+                    PositionRecord.id,
+                    PositionRecord.venue,
+                    PositionRecord.contract_id,
+                ).order_by(PositionRecord.updated_at.desc(), PositionRecord.id.desc())
+            ).all()
+
+            seen = set()
+            stale_ids = []
+            for row_id, venue, contract_id in rows:
+                if (venue, contract_id) in seen:
+                    stale_ids.append(row_id)
+                else:
+                    seen.add((venue, contract_id))
+
+            if stale_ids:
+                logger.warning(
+                    "Removing %d duplicate position rows before indexing",
+                    len(stale_ids),
+                )
+                session.exec(
+                    delete(PositionRecord).where(PositionRecord.id.in_(stale_ids))
+                )
+                session.commit()
 
     def save_trade(self, trade: Trade) -> None:
         """Save trade to database."""
-        trade_record = TradeRecord(
-            trade_id=trade.trade_id,
-            event_id=trade.event_id,
-            venue_a=trade.venue_a.value,
-            venue_b=trade.venue_b.value,
-            contract_a=trade.contract_a,
-            contract_b=trade.contract_b,
-            side_a=trade.side_a.value,
-            side_b=trade.side_b.value,
-            qty=trade.qty,
-            price_a=trade.price_a,
-            price_b=trade.price_b,
-            fee_a=trade.fee_a,
-            fee_b=trade.fee_b,
-            edge_bps=trade.edge_bps,
-            pnl=trade.pnl,
-            status=trade.status,
-            created_at=trade.created_at,
-            filled_at=trade.filled_at,
-            extra=trade.extra if isinstance(trade.extra, str) else None,
-        )
+        self._bulk_insert([_trade_record(trade)])
 
-        with Session(self.engine) as session:
-            session.add(trade_record)
-            session.commit()
+    def save_trades_bulk(self, trades: list[Trade]) -> None:
+        """Save many trades in a single transaction."""
+        self._bulk_insert([_trade_record(trade) for trade in trades])
 
     def save_position(self, position: Position) -> None:
-        """Save position to database."""
-        position_record = PositionRecord(
-            venue=position.venue.value,
-            contract_id=position.contract_id,
-            normalized_event_id=position.normalized_event_id,
-            side=position.side.value,
-            qty=position.qty,
-            avg_price=position.avg_price,
-            unrealized_pnl=position.unrealized_pnl,
-            realized_pnl=position.realized_pnl,
-            created_at=position.created_at,
-            updated_at=position.updated_at,
-        )
+        """Save position to database, replacing any row for its contract."""
+        values = {
+            "venue": position.venue.value,
+            "contract_id": position.contract_id,
+            "normalized_event_id": position.normalized_event_id,
+            "side": position.side.value,
+            "qty": position.qty,
+            "avg_price": position.avg_price,
+            "unrealized_pnl": position.unrealized_pnl,
+            "realized_pnl": position.realized_pnl,
+            "created_at": position.created_at,
+            "updated_at": position.updated_at,
+        }
+        insert = _UPSERT_INSERTS.get(self.engine.dialect.name)
 
         with Session(self.engine) as session:
-            # Check if position already exists
-            existing = session.exec(
-                select(PositionRecord).where(
-                    PositionRecord.venue == position.venue.value,
-                    PositionRecord.contract_id == position.contract_id,
+            if insert is not None:
+                # Single-statement upsert
+                stmt = insert(PositionRecord).values(**values)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["venue", "contract_id"],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in _POSITION_UPDATE_COLUMNS
+                    },
                 )
-            ).first()
-
-            if existing:
-                # Update existing position
-                existing.qty = position.qty
-                existing.avg_price = position.avg_price
-                existing.unrealized_pnl = position.unrealized_pnl
-                existing.realized_pnl = position.realized_pnl
-                existing.updated_at = position.updated_at
-                session.add(existing)
+                session.exec(stmt)
             else:
-                # Create new position
-                session.add(position_record)
+                # Check if position already exists
+                existing = session.exec(
+                    select(PositionRecord).where(
+                        PositionRecord.venue == values["venue"],
+                        PositionRecord.contract_id == values["contract_id"],
+                    )
+                ).first()
+
+                if existing:
+                    # Update existing position
+                    for column in _POSITION_UPDATE_COLUMNS:
+                        setattr(existing, column, values[column])
+                    session.add(existing)
+                else:
+                    # Create new position
+                    session.add(PositionRecord(**values))
 
             session.commit()
 
     def save_quote(self, quote: Quote) -> None:
         """Save quote to database."""
-        quote_record = QuoteRecord(
-            venue=quote.venue.value,
-            contract_id=quote.contract_id,
-            best_bid=quote.best_bid,
-            best_ask=quote.best_ask,
-            best_bid_size=quote.best_bid_size,
-            best_ask_size=quote.best_ask_size,
-            mid_price=quote.mid_price,
-            ts=quote.ts,
-        )
+        self._bulk_insert([_quote_record(quote)])
 
-        with Session(self.engine) as session:
-            session.add(quote_record)
-            session.commit()
+    def save_quotes_bulk(self, quotes: list[Quote]) -> None:
+        """Save many quotes in a single transaction."""
+        self._bulk_insert([_quote_record(quote) for quote in quotes])
 
     def save_balance(self, balance: Balance) -> None:
         """Save balance to database."""
-        balance_record = BalanceRecord(
-            venue=balance.venue.value,
-            currency=balance.currency,
-            available=balance.available,
-            total=balance.total,
-            ts=balance.ts,
-        )
+        self._bulk_insert([_balance_record(balance)])
+
+    def save_balances_bulk(self, balances: list[Balance]) -> None:
+        """Save many balances in a single transaction."""
+        self._bulk_insert([_balance_record(balance) for balance in balances])
+
+    def _bulk_insert(self, records: list[SQLModel]) -> None:
+        """Insert records with one commit, so one fsync for the whole batch."""
+        if not records:
+            return
 
         with Session(self.engine) as session:
-            session.add(balance_record)
+            session.add_all(records)
             session.commit()
 
     def get_trades(
@@ -213,7 +375,7 @@ class PersistenceManager:
     ) -> list[Trade]:
         """Get trades from database."""
         with Session(self.engine) as session:
-            query = select(TradeRecord)
+            query = select(*_TRADE_COLUMNS)
 
             if event_id:
                 query = query.where(TradeRecord.event_id == event_id)
@@ -229,33 +391,35 @@ class PersistenceManager:
 
             query = query.order_by(TradeRecord.created_at.desc()).limit(limit)
 
-            records = session.exec(query).all()
-
-            trades = []
-            for record in records:
-                trade = Trade(
-                    trade_id=record.trade_id,
-                    event_id=record.event_id,
-                    venue_a=Venue(record.venue_a),
-                    venue_b=Venue(record.venue_b),
-                    contract_a=record.contract_a,
-                    contract_b=record.contract_b,
-                    side_a=OrderSide(record.side_a),
-                    side_b=OrderSide(record.side_b),
-                    qty=record.qty,
-                    price_a=record.price_a,
-                    price_b=record.price_b,
-                    fee_a=record.fee_a,
-                    fee_b=record.fee_b,
-                    edge_bps=record.edge_bps,
-                    pnl=record.pnl,
-                    status=record.status,
-                    created_at=record.created_at,
-                    filled_at=record.filled_at,
+            records = session.exec(query)
+
+            return [
+                Trade(
+                    trade_id=trade_id,
+                    event_id=event_id,
+                    venue_a=Venue(venue_a),
+                    venue_b=Venue(venue_b),
+                    contract_a=contract_a,
+                    contract_b=contract_b,
+                    side_a=OrderSide(side_a),
+                    side_b=OrderSide(side_b),
+                    qty=qty,
+                    price_a=price_a,
+                    price_b=price_b,
+                    fee_a=fee_a,
+                    fee_b=fee_b,
+                    edge_bps=edge_bps,
+                    pnl=pnl,
+                    status=status,
+                    created_at=created_at,
+                    filled_at=filled_at,
                 )
-                trades.append(trade)
-
-            return trades
+                for (
+                    trade_id, event_id, venue_a, venue_b, contract_a, contract_b,
+                    side_a, side_b, qty, price_a, price_b, fee_a, fee_b,
+                    edge_bps, pnl, status, created_at, filled_at,
+                ) in records
+            ]
 
     def get_positions(
         self,
@@ -264,7 +428,7 @@ class PersistenceManager:
     ) -> list[Position]:
         """Get positions from database."""
         with Session(self.engine) as session:
-            query = select(PositionRecord)
+            query = select(*_POSITION_COLUMNS)
 
             if event_id:
                 query = query.where(PositionRecord.normalized_event_id == event_id)
@@ -272,25 +436,26 @@ class PersistenceManager:
             if venue:
                 query = query.where(PositionRecord.venue == venue.value)
 
-            records = session.exec(query).all()
-
-            positions = []
-            for record in records:
-                position = Position(
-                    venue=Venue(record.venue),
-                    contract_id=record.contract_id,
-                    normalized_event_id=record.normalized_event_id,
-                    side=ContractSide(record.side),
-                    qty=record.qty,
-                    avg_price=record.avg_price,
-                    unrealized_pnl=record.unrealized_pnl,
-                    realized_pnl=record.realized_pnl,
-                    created_at=record.created_at,
-                    updated_at=record.updated_at,
+            records = session.exec(query)
+
+            return [
+                Position(
+                    venue=Venue(venue),
+                    contract_id=contract_id,
+                    normalized_event_id=normalized_event_id,
+                    side=ContractSide(side),
+                    qty=qty,
+                    avg_price=avg_price,
+                    unrealized_pnl=unrealized_pnl,
+                    realized_pnl=realized_pnl,
+                    created_at=created_at,
+                    updated_at=updated_at,
                 )
-                positions.append(position)
-
-            return positions
+                for (
+                    venue, contract_id, normalized_event_id, side, qty, avg_price,
+                    unrealized_pnl, realized_pnl, created_at, updated_at,
+                ) in records
+            ]
 
     def get_quotes(
         self,
@@ -300,7 +465,7 @@ class PersistenceManager:
     ) -> list[Quote]:
         """Get quotes from database."""
         with Session(self.engine) as session:
-            query = select(QuoteRecord)
+            query = select(*_QUOTE_COLUMNS)
 
             if contract_id:
                 query = query.where(QuoteRecord.contract_id == contract_id)
@@ -310,65 +475,73 @@ class PersistenceManager:
 
             query = query.order_by(QuoteRecord.ts.desc()).limit(limit)
 
-            records = session.exec(query).all()
-
-            quotes = []
-            for record in records:
-                quote = Quote(
-                    venue=Venue(record.venue),
-                    contract_id=record.contract_id,
-                    best_bid=record.best_bid,
-                    best_ask=record.best_ask,
-                    best_bid_size=record.best_bid_size,
-                    best_ask_size=record.best_ask_size,
-                    ts=record.ts,
-                    mid_price=record.mid_price,
+            records = session.exec(query)
+
+            return [
+                Quote(
+                    venue=Venue(venue),
+                    contract_id=contract_id,
+                    best_bid=best_bid,
+                    best_ask=best_ask,
+                    best_bid_size=best_bid_size,
+                    best_ask_size=best_ask_size,
+                    ts=ts,
+                    mid_price=mid_price,
                 )
-                quotes.append(quote)
-
-            return quotes
+                for (
+                    venue, contract_id, best_bid, best_ask, best_bid_size,
+                    best_ask_size, ts, mid_price,
+                ) in records
+            ]
 
     def get_balances(self, venue: Venue | None = None) -> list[Balance]:
         """Get balances from database."""
         with Session(self.engine) as session:
-            query = select(BalanceRecord)
+            query = select(*_BALANCE_COLUMNS)
 
             if venue:
                 query = query.where(BalanceRecord.venue == venue.value)
 
             query = query.order_by(BalanceRecord.ts.desc())
 
-            records = session.exec(query).all()
+            records = session.exec(query)
 
-            balances = []
-            for record in records:
-                balance = Balance(
-                    venue=Venue(record.venue),
-                    currency=record.currency,
-                    available=record.available,
-                    total=record.total,
-                    ts=record.ts,
+            return [
+                Balance(
+                    venue=Venue(venue),
+                    currency=currency,
+                    available=available,
+                    total=total,
+                    ts=ts,
                 )
-                balances.append(balance)
-
-            return balances
+                for venue, currency, available, total, ts in records
+            ]
 
     def get_portfolio_summary(self) -> dict[str, any]:
         """Get portfolio summary from database."""
         with Session(self.engine) as session:
-            # Get total trades
-            total_trades = len(session.exec(select(TradeRecord)).all())
-
-            # Get total PnL
-            trades = session.exec(select(TradeRecord)).all()
-            total_pnl = sum(trade.pnl for trade in trades)
-
-            # Get active positions
-            positions = session.exec(select(PositionRecord)).all()
-            active_positions = sum(1 for pos in positions if pos.qty > 0)
-
-            # Get total exposure
-            total_exposure = sum(pos.qty * pos.avg_price for pos in positions if pos.qty > 0)
+            # Trade count and total PnL in one aggregate row
+            total_trades, total_pnl = session.exec(
+                select(
+                    func.count(TradeRecord.id),
+                    func.coalesce(func.sum(TradeRecord.pnl), 0.0),
+                )
+            ).one()
+
+            # Active positions and their exposure
+            is_active = PositionRecord.qty > 0
+            active_positions, total_exposure = session.exec(
+                select(
+                    func.count(case((is_active, 1))),
+                    func.coalesce(
+                        func.sum(case((
+                            is_active,
+                            PositionRecord.qty * PositionRecord.avg_price,
+                        ))),
+                        0.0,
+                    ),
+                )
+            ).one()
 
             return {
                 "total_trades": total_trades,
@@ -377,18 +550,51 @@ class PersistenceManager:
                 "total_exposure": total_exposure,
             }
 
-    def cleanup_old_data(self, days_to_keep: int = 30) -> None:
-        """Clean up old data from database."""
-        cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
-
+    def get_trade_pnls(self, status: str | None = None) -> np.ndarray:
+        """Get trade PnLs in execution order as a float64 array."""
         with Session(self.engine) as session:
-            # Clean up old quotes
-            old_quotes = session.exec(
-                select(QuoteRecord).where(QuoteRecord.ts < cutoff_date)
-            ).all()
+            query = select(TradeRecord.pnl)
+            if status:
+                query = query.where(TradeRecord.status == status)
+            query = query.order_by(TradeRecord.created_at, TradeRecord.id)
+
+            return np.fromiter(session.exec(query), dtype=np.float64)
+
+    def get_trade_stats(
+        self, status: str | None = None, sharpe_window: int | None = None
+    ) -> dict[str, float]:
+        """Get PnL statistics over the stored trade history.
+
+        See ``trade_pnl_stats`` for the rollups computed.
+        """
+        return trade_pnl_stats(self.get_trade_pnls(status), sharpe_window)
 
-            for quote in old_quotes:
-                session.delete(quote)
+    def cleanup_old_data(
+        self,
+        days_to_keep: int = 30,
+        trade_days_to_keep: int | None = None,
+        balance_days_to_keep: int | None = None,
+    ) -> None:
+        """Clean up old data from database.
+
+        Args:
+            days_to_keep: Retention for quotes, in days
+            trade_days_to_keep: Retention for trades; None keeps them all
+            balance_days_to_keep: Retention for balances; None keeps them all
+        """
+        now = datetime.now(UTC)
+        retention = (
+            (QuoteRecord, QuoteRecord.ts, days_to_keep),
+            (TradeRecord, TradeRecord.created_at, trade_days_to_keep),
+            (BalanceRecord, BalanceRecord.ts, balance_days_to_keep),
+        )
+
+        with Session(self.engine) as session:
+            # One DELETE per table instead of loading and deleting row by row
+            for record, column, days in retention:
+                if days is not None:
+                    cutoff_date = now - timedelta(days=days)
+                    session.exec(delete(record).where(column < cutoff_date))
 
             session.commit()
 
@@ -2,9 +2,72 @@
 
 from __future__ import annotations
 
+import numpy as np
+
+from .odds import KELLY_CAP
 from .types import ContractSide, Position, Quote, Trade, Venue
 
 
+def trade_pnl_stats(
+    pnls: np.ndarray, sharpe_window: int | None = None
+) -> dict[str, float]:
+    """Compute PnL rollups over trade PnLs in execution order.
+
+    The Kelly fraction is the win-rate form ``p - q / (avg_win / avg_loss)``,
+    clamped to ``[0, KELLY_CAP]``; it is zero until there is at least one
+    losing trade to estimate the payoff ratio from. Break-even trades count
+    toward the trade total but neither average. The Sharpe ratio is per
+    trade, over the last ``sharpe_window`` trades (all of them when None).
+    """
+    total_trades = len(pnls)
+    if total_trades == 0:
+        return {
+            "total_trades": 0,
+            "total_pnl": 0.0,
+            "winning_trades": 0,
+            "win_rate": 0.0,
+            "avg_win": 0.0,
+            "avg_loss": 0.0,
+            "max_drawdown": 0.0,
+            "sharpe_ratio": 0.0,
+            "kelly_fraction": 0.0,
+        }
+
+    wins = pnls > 0
+    losses = pnls < 0
+    win_count = int(np.count_nonzero(wins))
+    win_rate = win_count / total_trades
+    avg_win = float(pnls[wins].mean()) if win_count else 0.0
+    avg_loss = float(-pnls[losses].mean()) if losses.any() else 0.0
+
+    if avg_loss <= 0.0 or avg_win <= 0.0:
+        kelly = 0.0
+    else:
+        kelly = win_rate - (1.0 - win_rate) / (avg_win / avg_loss)
+        kelly = max(0.0, min(kelly, KELLY_CAP))
+
+    # Drawdown from the running peak of cumulative PnL, starting flat
+    cumulative = np.cumsum(pnls)
+    peaks = np.maximum.accumulate(np.maximum(cumulative, 0.0))
+    max_drawdown = float((peaks - cumulative).max())
+
+    window = pnls if sharpe_window is None else pnls[-sharpe_window:]
+    std_dev = float(window.std(ddof=1)) if len(window) > 1 else 0.0
+    sharpe_ratio = float(window.mean()) / std_dev if std_dev > 0.0 else 0.0
+
+    return {
+        "total_trades": total_trades,
+        "total_pnl": float(cumulative[-1]),
+        "winning_trades": win_count,
+        "win_rate": win_rate,
+        "avg_win": avg_win,
+        "avg_loss": avg_loss,
+        "max_drawdown": max_drawdown,
+        "sharpe_ratio": sharpe_ratio,
+        "kelly_fraction": kelly,
+    }
+
+
 class Portfolio:
     """Manages portfolio positions and PnL."""
 
@@ -21,10 +84,13 @@ class Portfolio:
         self._positions: dict[str, dict[Venue, Position]] = {}
         self._trades: list[Trade] = []
         self._quotes: dict[str, Quote] = {}
+        # Last summary built, dropped whenever trades or quotes change
+        self._summary_cache: dict[str, any] | None = None
 
     def add_trade(self, trade: Trade) -> None:
         """Add a completed trade to the portfolio."""
         self._trades.append(trade)
+        self._summary_cache = None
 
         # Update positions
         self._update_positions_from_trade(trade)
@@ -106,6 +172,7 @@ class Portfolio:
         """Update market quotes for mark-to-market."""
         for quote in quotes:
             self._quotes[quote.contract_id] = quote
+        self._summary_cache = None
 
     def mark_to_market(self) -> dict[str, float]:
         """Calculate mark-to-market PnL for all positions."""
@@ -172,8 +239,12 @@ class Portfolio:
 
     def get_portfolio_summary(self) -> dict[str, any]:
         """Get comprehensive portfolio summary."""
-        # Calculate realized PnL
-        realized_pnl = sum(trade.pnl for trade in self._trades)
+        if self._summary_cache is not None:
+            return self._copy_summary()
+
+        # Realized PnL rollups over the trade history
+        stats = trade_pnl_stats(self.get_trade_pnls())
+        realized_pnl = stats["total_pnl"]
 
         # Calculate mark-to-market
         mtm = self.mark_to_market()
@@ -194,12 +265,7 @@ class Portfolio:
             for venue_positions in self._positions.values()
         )
 
-        # Count trades
-        total_trades = len(self._trades)
-        successful_trades = sum(1 for trade in self._trades if trade.pnl > 0)
-        win_rate = (successful_trades / total_trades * 100) if total_trades > 0 else 0.0
-
-        return {
+        self._summary_cache = {
             "initial_balance": self.initial_balance,
             "current_balance": self.current_balance,
             "realized_pnl": realized_pnl,
@@ -209,16 +275,34 @@ class Portfolio:
             "total_exposure": self.get_total_exposure(),
             "total_positions": total_positions,
             "active_positions": active_positions,
-            "total_trades": total_trades,
-            "successful_trades": successful_trades,
-            "win_rate": win_rate,
+            "total_trades": stats["total_trades"],
+            "successful_trades": stats["winning_trades"],
+            "win_rate": stats["win_rate"] * 100,
+            "max_drawdown": stats["max_drawdown"],
+            "sharpe_ratio": stats["sharpe_ratio"],
+            "kelly_fraction": stats["kelly_fraction"],
             "position_breakdown": mtm["position_pnl"],
         }
+        return self._copy_summary()
+
+    def _copy_summary(self) -> dict[str, any]:
+        """Copy the cached summary, including its nested position breakdown."""
+        summary = dict(self._summary_cache)
+        summary["position_breakdown"] = dict(summary["position_breakdown"])
+        return summary
 
     def get_trade_history(self) -> list[Trade]:
         """Get trade history."""
         return self._trades.copy()
 
+    def get_trade_pnls(self) -> np.ndarray:
+        """Get trade PnLs in execution order as a float64 array."""
+        return np.fromiter(
+            (trade.pnl for trade in self._trades),
+            dtype=np.float64,
+            count=len(self._trades),
+        )
+
     def get_recent_trades(self, limit: int = 10) -> list[Trade]:
         """Get recent trades."""
         return self._trades[-limit:] if self._trades else []
@@ -247,5 +331,6 @@ class Portfolio:
         self._positions.clear()
         self._trades.clear()
         self._quotes.clear()
+        self._summary_cache = None
 
 
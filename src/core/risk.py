@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from collections import deque
 from datetime import datetime, timedelta
 
@@ -17,6 +18,7 @@ class RiskManager:
         max_drawdown_pct: float = 10.0,
         circuit_breaker_error_rate: float = 0.1,
         circuit_breaker_latency_ms: float = 5000.0,
+        summary_ttl: float = 1.0,
     ):
         """Initialize risk manager.
         
@@ -25,6 +27,7 @@ class RiskManager:
             max_drawdown_pct: Maximum drawdown percentage
             circuit_breaker_error_rate: Error rate threshold for circuit breaker
             circuit_breaker_latency_ms: Latency threshold for circuit breaker
+            summary_ttl: Seconds an unchanged risk summary is reused for
         """
         self.risk_limits = risk_limits
         self.max_drawdown_pct = max_drawdown_pct
@@ -45,6 +48,12 @@ class RiskManager:
         self._circuit_breakers: dict[Venue, bool] = dict.fromkeys(Venue, False)
         self._circuit_breaker_timestamps: dict[Venue, datetime] = {}
 
+        # Last risk summary and the monotonic time it was built. Recording
+        # anything drops it; the TTL bounds staleness of the 5-minute
+        # error/latency windows, which age without any recorded event.
+        self.summary_ttl = summary_ttl
+        self._summary_cache: tuple[float, dict[str, any]] | None = None
+
     def check_trade_risk(
         self,
         opportunity: any,  # ArbOpportunity
@@ -94,6 +103,7 @@ class RiskManager:
     def record_trade(self, trade: Trade) -> None:
         """Record a completed trade."""
         self._trades_history.append(trade)
+        self._summary_cache = None
 
         # Update PnL history
         if trade.pnl != 0:
@@ -105,6 +115,7 @@ class RiskManager:
             "timestamp": datetime.utcnow(),
             "error": str(error),
         })
+        self._summary_cache = None
 
         # Check if circuit breaker should trigger
         if self._should_trigger_circuit_breaker(venue):
@@ -116,6 +127,7 @@ class RiskManager:
             "timestamp": datetime.utcnow(),
             "latency_ms": latency_ms,
         })
+        self._summary_cache = None
 
         # Check if circuit breaker should trigger
         if self._should_trigger_circuit_breaker(venue):
@@ -132,6 +144,7 @@ class RiskManager:
             if datetime.utcnow() > reset_time:
                 self._circuit_breakers[venue] = False
                 del self._circuit_breaker_timestamps[venue]
+                self._summary_cache = None
                 return False
 
         return True
@@ -158,6 +171,7 @@ class RiskManager:
         """Trigger circuit breaker for a venue."""
         self._circuit_breakers[venue] = True
         self._circuit_breaker_timestamps[venue] = datetime.utcnow()
+        self._summary_cache = None
         print(f"Circuit breaker triggered for {venue}")
 
     def _get_recent_errors(self, venue: Venue, minutes: int) -> list[dict]:
@@ -201,6 +215,11 @@ class RiskManager:
 
     def get_risk_summary(self) -> dict[str, any]:
         """Get risk management summary."""
+        now = time.monotonic()
+        cached = self._summary_cache
+        if cached is not None and now - cached[0] < self.summary_ttl:
+            return self._copy_summary(cached[1])
+
         # Calculate current PnL
         total_pnl = sum(trade.pnl for trade in self._trades_history)
 
@@ -223,7 +242,7 @@ class RiskManager:
             if active
         ]
 
-        return {
+        summary = {
             "total_pnl": total_pnl,
             "max_drawdown": max_drawdown,
             "drawdown_pct": drawdown_pct,
@@ -239,12 +258,26 @@ class RiskManager:
                 for venue in Venue
             },
         }
+        self._summary_cache = (now, summary)
+        return self._copy_summary(summary)
+
+    def _copy_summary(self, summary: dict[str, any]) -> dict[str, any]:
+        """Copy a cached summary, including its nested lists and mappings."""
+        summary = dict(summary)
+        summary["active_circuit_breakers"] = list(summary["active_circuit_breakers"])
+        summary["recent_errors"] = dict(summary["recent_errors"])
+        summary["recent_latencies"] = {
+            venue: [dict(latency) for latency in latencies]
+            for venue, latencies in summary["recent_latencies"].items()
+        }
+        return summary
 
     def reset_circuit_breaker(self, venue: Venue) -> None:
         """Manually reset circuit breaker for a venue."""
         self._circuit_breakers[venue] = False
         if venue in self._circuit_breaker_timestamps:
             del self._circuit_breaker_timestamps[venue]
+        self._summary_cache = None
         print(f"Circuit breaker reset for {venue}")
 
     def update_risk_limits(self, new_limits: RiskLimits) -> None:
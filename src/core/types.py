@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import itertools
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+# Client order IDs are a per-process random prefix plus a counter: unique across
+# restarts like uuid4, without an os.urandom call per order request.
+_CLIENT_ORDER_ID_PREFIX = uuid.uuid4().hex[:12]
+_client_order_seq = itertools.count(1)
+
+
+def utc_timestamp(value: datetime) -> float:
+    """POSIX seconds for a datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
 
 class Venue(str, Enum):
     """Supported trading venues."""
@@ -69,7 +82,7 @@ class FeeModel:
     extra: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Contract:
     """Binary prediction market contract."""
 
@@ -84,9 +97,16 @@ class Contract:
     fees: FeeModel
     min_size: float = 1.0
     max_size: float | None = None
+    side_str: str = field(init=False, repr=False, compare=False)
+    expires_ts: float = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        """Cache the side string and expiry timestamp used in hot loops."""
+        self.side_str = self.side.value
+        self.expires_ts = utc_timestamp(self.expires_at)
 
-@dataclass
+
+@dataclass(slots=True)
 class Quote:
     """Market quote for a contract."""
 
@@ -105,7 +125,7 @@ class Quote:
             self.mid_price = (self.best_bid + self.best_ask) / 2
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     """Order placement request."""
 
@@ -120,7 +140,7 @@ class OrderRequest:
     def __post_init__(self) -> None:
         """Generate client order ID if not provided."""
         if self.client_order_id is None:
-            self.client_order_id = str(uuid.uuid4())
+            self.client_order_id = f"{_CLIENT_ORDER_ID_PREFIX}-{next(_client_order_seq)}"
 
 
 @dataclass
@@ -138,7 +158,7 @@ class Fill:
     client_order_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbOpportunity:
     """Arbitrage opportunity between two venues."""
 
@@ -151,9 +171,15 @@ class ArbOpportunity:
     rationale: str
     confidence_score: float = 0.0
     created_at: datetime = field(default_factory=datetime.utcnow)
+    expiry_ts: float | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the expiry timestamp unless the caller supplied it."""
+        if self.expiry_ts is None:
+            self.expiry_ts = utc_timestamp(self.expiry)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position in a contract."""
 
@@ -169,7 +195,7 @@ class Position:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     """Account balance for a venue."""
 
@@ -180,7 +206,7 @@ class Balance:
     ts: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Completed trade record."""
 
@@ -199,9 +225,12 @@ class Trade:
     fee_b: float = 0.0
     edge_bps: float = 0.0
     pnl: float = 0.0
-    status: Literal["pending", "partial", "filled", "failed", "hedged"] = "pending"
+    status: Literal["pending", "partial", "filled", "failed", "hedged", "cancelled"] = "pending"
     created_at: datetime = field(default_factory=datetime.utcnow)
     filled_at: datetime | None = None
+    order_id_a: str | None = None
+    order_id_b: str | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
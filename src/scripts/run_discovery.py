@@ -10,12 +10,14 @@ from ..connectors.polymarket import PolymarketConnector
 from ..core.config import settings
 from ..core.discovery import DiscoveryEngine
 from ..core.fees import create_default_fee_calculator
+from ..core.logs import configure_logging
 from ..core.matcher import EventMatcher
 from ..core.types import Venue
 
 
 async def main():
     """Main discovery function."""
+    configure_logging(settings.log_level)
     print("Starting arbitrage opportunity discovery...")
     print(f"Mode: {settings.mode}")
     print(f"Min edge: {settings.min_edge_bps}bps")
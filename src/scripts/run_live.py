@@ -7,11 +7,18 @@ from ..connectors.kalshi import KalshiConnector
 from ..connectors.polymarket import PolymarketConnector
 from ..core.config import settings
 from ..core.live import LiveTradingEngine
+from ..core.logs import configure_logging
 from ..core.types import Venue
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 
 async def main():
     """Main live trading function."""
+    configure_logging(settings.log_level)
     print("Starting live trading engine...")
     print("WARNING: This will execute real trades with real money!")
 
@@ -111,8 +118,8 @@ async def _cleanup_connectors(connectors: dict[Venue, any]) -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
-
-
-
+    # The libuv event loop cuts per-await overhead in the trading loop
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
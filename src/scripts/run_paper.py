@@ -8,12 +8,14 @@ from ..connectors.base import MockConnector
 from ..connectors.kalshi import KalshiConnector
 from ..connectors.polymarket import PolymarketConnector
 from ..core.config import settings
+from ..core.logs import configure_logging
 from ..core.paper import PaperTradingEngine
 from ..core.types import Venue
 
 
 async def main():
     """Main paper trading function."""
+    configure_logging(settings.log_level)
     print("Starting paper trading engine...")
     print(f"Mode: {settings.mode}")
     print(f"Initial balance: ${settings.starting_balance_usd:,.2f}")
@@ -0,0 +1,90 @@
+"""Tests for venue request batcher."""
+
+import asyncio
+from datetime import datetime
+
+from src.connectors.base import MockConnector
+from src.core.batcher import VenueBatcher
+from src.core.types import Quote, Venue
+
+
+class CountingConnector(MockConnector):
+    """Mock connector that records each get_quotes and list_contracts call."""
+
+    def __init__(self, venue: Venue, credentials: dict[str, str]):
+        super().__init__(venue, credentials)
+        self.quote_calls: list[list[str]] = []
+        self.list_calls = 0
+
+    async def get_quotes(self, contract_ids: list[str]):
+        self.quote_calls.append(contract_ids)
+        return await super().get_quotes(contract_ids)
+
+    async def list_contracts(self):
+        self.list_calls += 1
+        await asyncio.sleep(0.01)
+        return await super().list_contracts()
+
+
+class TestVenueBatcher:
+    """Test venue batcher functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.connector = CountingConnector(Venue.POLYMARKET, {})
+        for cid in ("c1", "c2"):
+            self.connector._quotes[cid] = Quote(
+                Venue.POLYMARKET, cid, 0.4, 0.42, 100.0, 100.0, datetime.utcnow()
+            )
+        self.batcher = VenueBatcher({Venue.POLYMARKET: self.connector})
+
+    async def test_concurrent_requests_share_one_call(self):
+        """Test requests within one window reach the venue as one call."""
+        quotes = await asyncio.gather(
+            self.batcher.submit_quote_request(Venue.POLYMARKET, "c1"),
+            self.batcher.submit_quote_request(Venue.POLYMARKET, "c2"),
+            self.batcher.submit_quote_request(Venue.POLYMARKET, "c1"),
+            self.batcher.submit_quote_request(Venue.POLYMARKET, "missing"),
+        )
+
+        assert self.connector.quote_calls == [["c1", "c2", "missing"]]
+        assert [q.contract_id if q else None for q in quotes] == ["c1", "c2", "c1", None]
+
+    async def test_later_requests_open_a_new_window(self):
+        """Test a request after a flush triggers a fresh call."""
+        await self.batcher.submit_quote_request(Venue.POLYMARKET, "c1")
+        await self.batcher.submit_quote_request(Venue.POLYMARKET, "c2")
+
+        assert self.connector.quote_calls == [["c1"], ["c2"]]
+
+    async def test_contract_listing_is_single_flight(self):
+        """Test concurrent listings share one in-flight call."""
+        await asyncio.gather(
+            self.batcher.list_contracts(Venue.POLYMARKET),
+            self.batcher.list_contracts(Venue.POLYMARKET),
+        )
+
+        assert self.connector.list_calls == 1
+
+    async def test_cancelled_flush_releases_waiters(self):
+        """Test cancelling a flush fails its waiters and closes the window."""
+        # Cancel before the flush starts, then during its window
+        for yields in (1, 2):
+            waiter = asyncio.ensure_future(
+                self.batcher.submit_quote_request(Venue.POLYMARKET, "c1")
+            )
+            for _ in range(yields):
+                await asyncio.sleep(0)
+            (flush,) = self.batcher._tasks
+            flush.cancel()
+
+            done, _ = await asyncio.wait([waiter], timeout=1.0)
+            assert waiter in done
+            assert waiter.cancelled()
+
+        # The next request opens a fresh window instead of joining a dead one
+        quote = await asyncio.wait_for(
+            self.batcher.submit_quote_request(Venue.POLYMARKET, "c2"), timeout=1.0
+        )
+        assert quote.contract_id == "c2"
+        assert self.connector.quote_calls == [["c2"]]
@@ -0,0 +1,427 @@
+"""Tests for discovery engine module."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+from src.core.discovery import DiscoveryEngine
+from src.core.fees import FeeCalculator, create_default_fee_calculator
+from src.core.matcher import EventMatcher
+from src.core.types import Contract, ContractSide, FeeModel, OrderSide, Quote, Venue
+
+
+class FakeConnector:
+    """Connector stub that records quote requests."""
+
+    def __init__(self):
+        self.requested: list[list[str]] = []
+
+    async def get_quotes(self, contract_ids: list[str]) -> list:
+        self.requested.append(list(contract_ids))
+        return []
+
+
+class QuotingConnector(FakeConnector):
+    """Connector stub that quotes every requested contract."""
+
+    def __init__(self, contracts: list[Contract]):
+        super().__init__()
+        self.contracts = {c.contract_id: c for c in contracts}
+
+    async def get_quotes(self, contract_ids: list[str]) -> list:
+        await super().get_quotes(contract_ids)
+        return [make_quote(self.contracts[cid], 0.4, 500.0) for cid in contract_ids]
+
+
+class CountingMapper:
+    """Mapper stub that counts mapping calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def map_to_event_id(self, market_id, title, description="", metadata=None):
+        self.calls += 1
+        return f"canonical_{market_id}"
+
+
+def make_contract(venue: Venue, event_id: str, side: ContractSide) -> Contract:
+    """Create a test contract."""
+    return Contract(
+        venue=venue,
+        contract_id=f"{venue.value}_{event_id}_{side.value}",
+        event_key=f"Event {event_id}",
+        normalized_event_id=event_id,
+        side=side,
+        tick_size=0.01,
+        settlement_ccy="USD",
+        expires_at=datetime.utcnow() + timedelta(days=30),
+        fees=FeeModel(),
+    )
+
+
+def make_quote(contract: Contract, ask: float, size: float) -> Quote:
+    """Create a test quote for a contract."""
+    return Quote(
+        venue=contract.venue,
+        contract_id=contract.contract_id,
+        best_bid=max(ask - 0.02, 0.0),
+        best_ask=ask,
+        best_bid_size=size,
+        best_ask_size=size,
+        ts=datetime.utcnow(),
+    )
+
+
+def make_low_fee_calculator() -> FeeCalculator:
+    """Create a fee calculator cheap enough for opportunities to exist."""
+    return FeeCalculator({
+        Venue.POLYMARKET: FeeModel(taker_bps=25.0, gas_estimate_usd=0.001),
+        Venue.KALSHI: FeeModel(taker_bps=30.0, withdrawal_fee=0.002),
+    })
+
+
+class TestDiscoveryEngine:
+    """Test discovery engine functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = DiscoveryEngine(
+            fee_calculator=create_default_fee_calculator(),
+            event_matcher=EventMatcher(),
+        )
+
+    def test_match_by_event_id(self):
+        """Test deterministic matching by canonical event ID."""
+        contracts_a = [
+            make_contract(Venue.POLYMARKET, "event1", ContractSide.YES),
+            make_contract(Venue.POLYMARKET, "event1", ContractSide.NO),
+            make_contract(Venue.POLYMARKET, "event2", ContractSide.YES),
+        ]
+        contracts_b = [
+            make_contract(Venue.KALSHI, "event1", ContractSide.NO),
+            make_contract(Venue.KALSHI, "event1", ContractSide.YES),
+            make_contract(Venue.KALSHI, "event3", ContractSide.YES),
+        ]
+
+        matched_pairs = self.engine._match_by_event_id(contracts_a, contracts_b)
+
+        # Only event1 is listed on both venues
+        assert len(matched_pairs) == 2
+        assert {p.match_reason for p in matched_pairs} == {
+            "deterministic_event_id_yes",
+            "deterministic_event_id_no",
+        }
+        for pair in matched_pairs:
+            assert pair.event_id == "event1"
+            assert pair.contract_a.venue == Venue.POLYMARKET
+            assert pair.contract_b.venue == Venue.KALSHI
+            assert pair.contract_a.side == pair.contract_b.side
+
+    def test_match_by_event_id_missing_side(self):
+        """Test that a side listed on only one venue is not paired."""
+        contracts_a = [make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)]
+        contracts_b = [
+            make_contract(Venue.KALSHI, "event1", ContractSide.YES),
+            make_contract(Venue.KALSHI, "event1", ContractSide.NO),
+        ]
+
+        matched_pairs = self.engine._match_by_event_id(contracts_a, contracts_b)
+
+        assert len(matched_pairs) == 1
+        assert matched_pairs[0].contract_a.side == ContractSide.YES
+
+    async def test_refresh_quotes_partitions_by_venue(self):
+        """Test that each venue is asked only for its own contract IDs."""
+        contracts_a = [
+            make_contract(Venue.POLYMARKET, "event1", ContractSide.YES),
+            make_contract(Venue.POLYMARKET, "event1", ContractSide.NO),
+        ]
+        contracts_b = [
+            make_contract(Venue.KALSHI, "event1", ContractSide.YES),
+            make_contract(Venue.KALSHI, "event1", ContractSide.NO),
+        ]
+        # Venue connectors do not prefix contract IDs with the venue name
+        for contract in contracts_a:
+            contract.contract_id = contract.contract_id.replace("polymarket_", "0x")
+        for contract in contracts_b:
+            contract.contract_id = contract.contract_id.replace("kalshi_", "KX-")
+        matched_pairs = self.engine._match_by_event_id(contracts_a, contracts_b)
+        connectors = {Venue.POLYMARKET: FakeConnector(), Venue.KALSHI: FakeConnector()}
+
+        await self.engine._refresh_quotes(connectors, matched_pairs)
+
+        for venue, contracts in (
+            (Venue.POLYMARKET, contracts_a),
+            (Venue.KALSHI, contracts_b),
+        ):
+            requested = connectors[venue].requested
+            assert len(requested) == 1
+            assert sorted(requested[0]) == sorted(c.contract_id for c in contracts)
+
+    def test_find_pair_opportunities_edge(self):
+        """Test edge is one minus the summed effective asks."""
+        engine = DiscoveryEngine(
+            fee_calculator=FeeCalculator({}),
+            event_matcher=EventMatcher(),
+        )
+        contract_a = make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)
+        contract_b = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+        engine._quotes_cache = {
+            contract_a.contract_id: make_quote(contract_a, 0.40, 500.0),
+            contract_b.contract_id: make_quote(contract_b, 0.45, 500.0),
+        }
+        pair = engine._match_by_event_id([contract_a], [contract_b])[0]
+
+        opportunities = list(engine._find_pair_opportunities(pair))
+
+        assert len(opportunities) == 2
+        for opp in opportunities:
+            assert abs(opp.edge_bps - 1500.0) < 1e-6
+            assert opp.leg_a.price == 0.40
+            assert opp.leg_b.price == 0.45
+
+    def test_filter_drops_near_expiry(self):
+        """Test opportunities expiring within the hour are filtered out."""
+        engine = DiscoveryEngine(
+            fee_calculator=FeeCalculator({}),
+            event_matcher=EventMatcher(),
+        )
+        contract_a = make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)
+        contract_b = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+        engine._quotes_cache = {
+            contract_a.contract_id: make_quote(contract_a, 0.40, 500.0),
+            contract_b.contract_id: make_quote(contract_b, 0.45, 500.0),
+        }
+        pair = engine._match_by_event_id([contract_a], [contract_b])[0]
+        opportunities = list(engine._find_pair_opportunities(pair))
+
+        # Naive (UTC) and tz-aware expiries compare on the same timeline
+        near = replace(
+            opportunities[0],
+            expiry=datetime.now(UTC) + timedelta(minutes=30),
+            expiry_ts=None,
+        )
+
+        assert engine._filter_opportunities([near, opportunities[1]]) == [opportunities[1]]
+
+    def test_filter_top_k(self):
+        """Test top_k keeps the highest-edge opportunities in sorted order."""
+        engine = DiscoveryEngine(
+            fee_calculator=FeeCalculator({}),
+            event_matcher=EventMatcher(),
+        )
+        contract_a = make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)
+        contract_b = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+        engine._quotes_cache = {
+            contract_a.contract_id: make_quote(contract_a, 0.40, 500.0),
+            contract_b.contract_id: make_quote(contract_b, 0.45, 500.0),
+        }
+        pair = engine._match_by_event_id([contract_a], [contract_b])[0]
+        template = next(engine._find_pair_opportunities(pair))
+        opportunities = [replace(template, edge_bps=edge) for edge in (200.0, 900.0, 500.0, 700.0)]
+
+        top = engine._filter_opportunities(opportunities, top_k=2)
+
+        assert [opp.edge_bps for opp in top] == [900.0, 700.0]
+        assert top == engine._filter_opportunities(opportunities)[:2]
+
+    def test_batch_matches_per_pair(self):
+        """Test vectorized and parallel scans match the per-pair path."""
+        rng = random.Random(42)
+        engine = DiscoveryEngine(
+            fee_calculator=make_low_fee_calculator(),
+            event_matcher=EventMatcher(),
+        )
+        contracts_a, contracts_b = [], []
+        quotes = {}
+        for i in range(200):
+            for side in ContractSide:
+                contract_a = make_contract(Venue.POLYMARKET, f"event{i}", side)
+                contract_b = make_contract(Venue.KALSHI, f"event{i}", side)
+                contracts_a.append(contract_a)
+                contracts_b.append(contract_b)
+                for contract in (contract_a, contract_b):
+                    # Leave some contracts unquoted
+                    if rng.random() < 0.95:
+                        quotes[contract.contract_id] = make_quote(
+                            contract,
+                            round(rng.uniform(0.2, 0.6), 2),
+                            rng.choice([0.0, 50.0, 150.0, 1000.0]),
+                        )
+        engine._quotes_cache = quotes
+        matched_pairs = engine._match_by_event_id(contracts_a, contracts_b)
+
+        expected = []
+        for pair in matched_pairs:
+            expected.extend(engine._find_pair_opportunities(pair))
+        actual = engine._batch_find_opportunities(
+            engine._resolve_quotes(matched_pairs)
+        )
+
+        def key(opp):
+            return (
+                opp.event_id,
+                opp.leg_a.contract_id,
+                opp.leg_b.contract_id,
+                opp.leg_a.price,
+                opp.leg_b.price,
+                opp.leg_a.qty,
+                opp.edge_bps,
+                opp.notional,
+                opp.rationale,
+            )
+
+        assert expected
+        assert [key(o) for o in actual] == [key(o) for o in expected]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            engine.scan_executor = executor
+            engine.scan_chunk_size = 16
+            parallel = engine._parallel_scan(engine._resolve_quotes(matched_pairs))
+        assert [key(o) for o in parallel] == [key(o) for o in expected]
+
+    async def test_fetch_quotes_in_batches(self):
+        """Test that large quote requests are split into batches."""
+        self.engine.quote_batch_size = 2
+        connector = FakeConnector()
+        contract_ids = [f"contract{i}" for i in range(5)]
+
+        await self.engine._fetch_quotes(Venue.KALSHI, connector, contract_ids)
+
+        assert sorted(map(len, connector.requested)) == [1, 2, 2]
+        assert sorted(sum(connector.requested, [])) == sorted(contract_ids)
+
+    def test_set_market_data(self):
+        """Test loading a snapshot pairs venues in a fixed order."""
+        contract_a = make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)
+        contract_b = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+
+        # Venue order of the input mapping does not matter
+        self.engine.set_market_data(
+            {Venue.KALSHI: [contract_b], Venue.POLYMARKET: [contract_a]}, {}
+        )
+        matched_pairs = self.engine._get_matched_pairs()
+
+        assert len(matched_pairs) == 1
+        assert matched_pairs[0].contract_a is contract_a
+        assert matched_pairs[0].contract_b is contract_b
+
+        stats = self.engine.get_discovery_stats()
+        assert stats["total_contracts"] == 2
+        assert stats["venues_connected"] == 2
+
+    def test_matched_pairs_cached_until_contracts_change(self):
+        """Test matched pairs are reused until new contracts are loaded."""
+        contract_a = make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)
+        contract_b = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+        self.engine.set_market_data(
+            {Venue.POLYMARKET: [contract_a], Venue.KALSHI: [contract_b]}, {}
+        )
+
+        matched_pairs = self.engine._get_matched_pairs()
+        assert self.engine._get_matched_pairs() is matched_pairs
+
+        # Reloading an identical contract set keeps the cached pairs
+        self.engine.set_market_data(
+            {Venue.POLYMARKET: [replace(contract_a)], Venue.KALSHI: [replace(contract_b)]},
+            {},
+        )
+        assert self.engine._get_matched_pairs() is matched_pairs
+
+        self.engine.set_market_data(
+            {Venue.POLYMARKET: [contract_a], Venue.KALSHI: []}, {}
+        )
+        assert self.engine._get_matched_pairs() == []
+
+    def test_mapping_cache(self):
+        """Test mapper results are memoized per market and bounded."""
+        self.engine.mapping_cache_size = 1
+        mapper = CountingMapper()
+        contract = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+        other = make_contract(Venue.KALSHI, "event2", ContractSide.YES)
+
+        event_id = self.engine._map_to_event_id(Venue.KALSHI, mapper, contract)
+        assert event_id == "canonical_event1"
+        self.engine._map_to_event_id(Venue.KALSHI, mapper, contract)
+        assert mapper.calls == 1
+
+        # Mapping another market evicts the oldest entry
+        self.engine._map_to_event_id(Venue.KALSHI, mapper, other)
+        self.engine._map_to_event_id(Venue.KALSHI, mapper, contract)
+        assert mapper.calls == 3
+
+    def test_unmapped_markets_are_not_cached(self):
+        """Test a market the mapper abstains on is retried on the next call."""
+        mapper = CountingMapper()
+        mapper.map_to_event_id = lambda *args, **kwargs: None
+        contract = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+
+        assert self.engine._map_to_event_id(Venue.KALSHI, mapper, contract) is None
+
+        # A mapping registered afterwards is used straight away
+        mapper = CountingMapper()
+        event_id = self.engine._map_to_event_id(Venue.KALSHI, mapper, contract)
+        assert event_id == "canonical_event1"
+        assert mapper.calls == 1
+
+    def test_raw_ask_sum_skips_fee_math(self):
+        """Test pairs short of min edge at raw asks never reach the fee calculator."""
+        engine = DiscoveryEngine(
+            fee_calculator=make_low_fee_calculator(),
+            event_matcher=EventMatcher(),
+        )
+        contract_a = make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)
+        contract_b = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+        pair = engine._match_by_event_id([contract_a], [contract_b])[0]
+
+        priced = []
+        calculate = engine._calculate_effective_price
+        engine._calculate_effective_price = lambda *args: priced.append(args) or calculate(*args)
+
+        # 50bps raw edge is below the 80bps minimum before any fees
+        assert engine._score_direction(pair, 0.50, 0.495, 500.0, 500.0) is None
+        assert priced == []
+
+        # Negative fee terms disable the shortcut
+        engine.fee_calculator.update_fee_model(Venue.KALSHI, FeeModel(taker_bps=-200.0))
+        engine._check_fee_version()
+
+        assert engine._score_direction(pair, 0.50, 0.495, 500.0, 500.0) is not None
+
+    def test_fee_update_invalidates_effective_prices(self):
+        """Test the taker fee table is rebuilt when fees change."""
+        fee_calculator = FeeCalculator({Venue.KALSHI: FeeModel(taker_bps=0.0)})
+        engine = DiscoveryEngine(
+            fee_calculator=fee_calculator,
+            event_matcher=EventMatcher(),
+        )
+        contract = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+
+        assert engine._calculate_effective_price(contract, 0.5, OrderSide.BUY) == 0.5
+
+        fee_calculator.update_fee_model(Venue.KALSHI, FeeModel(taker_bps=100.0))
+        engine._check_fee_version()
+
+        assert engine._calculate_effective_price(contract, 0.5, OrderSide.BUY) == 0.505
+
+    async def test_quote_ttl_and_staleness(self):
+        """Test fresh quotes are not re-fetched and stale quotes are ignored."""
+        contract_a = make_contract(Venue.POLYMARKET, "event1", ContractSide.YES)
+        contract_b = make_contract(Venue.KALSHI, "event1", ContractSide.YES)
+        matched_pairs = self.engine._match_by_event_id([contract_a], [contract_b])
+        connectors = {
+            Venue.POLYMARKET: QuotingConnector([contract_a]),
+            Venue.KALSHI: QuotingConnector([contract_b]),
+        }
+        self.engine.quote_ttl_ms = 60_000.0
+
+        await self.engine._refresh_quotes(connectors, matched_pairs)
+        await self.engine._refresh_quotes(connectors, matched_pairs)
+
+        assert len(connectors[Venue.KALSHI].requested) == 1
+        assert len(self.engine._resolve_quotes(matched_pairs)) == 1
+
+        # Quotes older than the hard limit are dropped from the scan
+        self.engine.max_quote_age_ms = 0.0
+        assert self.engine._resolve_quotes(matched_pairs) == []
@@ -109,6 +109,27 @@ class TestEventRegistry:
         venues = {m.venue for m in markets}
         assert venues == {"polymarket", "kalshi"}
     
+    def test_remapping_updates_reverse_index(self):
+        """Test re-adding a market under a new event moves it in the index."""
+        registry = EventRegistry()
+
+        registry.add_mapping(VenueMapping(
+            venue="kalshi",
+            market_id="PRES-2028",
+            event_id="ELECTION:US:PRESIDENT:2028:TRUMP",
+            title_raw="Trump wins 2028?",
+        ))
+        registry.add_mapping(VenueMapping(
+            venue="kalshi",
+            market_id="PRES-2028",
+            event_id="ELECTION:US:PRESIDENT:2028:VANCE",
+            title_raw="Vance wins 2028?",
+        ))
+
+        assert registry.get_mapped_markets("ELECTION:US:PRESIDENT:2028:TRUMP") == []
+        markets = registry.get_mapped_markets("ELECTION:US:PRESIDENT:2028:VANCE")
+        assert [m.title_raw for m in markets] == ["Vance wins 2028?"]
+
     def test_save_and_load_events(self):
         """Test saving and loading events from CSV."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -160,6 +181,85 @@ class TestEventRegistry:
             assert loaded.market_id == "pm_123"
             assert loaded.event_id == "ELECTION:US:PRESIDENT:2028:TRUMP"
 
+    def test_mapping_saves_append_then_compact(self):
+        """Test mapping saves append changed rows and compact when bloated."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mappings_file = Path(tmpdir) / "mappings.csv"
+
+            def row_count() -> int:
+                return len(mappings_file.read_text(encoding="utf-8").splitlines()) - 1
+
+            registry = EventRegistry(mappings_file=mappings_file)
+            for market_id in ("pm_1", "pm_2"):
+                registry.add_mapping(VenueMapping(
+                    venue="polymarket",
+                    market_id=market_id,
+                    event_id="ELECTION:US:PRESIDENT:2028:TRUMP",
+                    title_raw="Trump 2028?",
+                ))
+            registry.save()
+            assert row_count() == 2
+
+            # Re-adding a market appends only that row; the last row wins on load
+            registry.add_mapping(VenueMapping(
+                venue="polymarket",
+                market_id="pm_1",
+                event_id="ELECTION:US:PRESIDENT:2028:VANCE",
+                title_raw="Vance 2028?",
+            ))
+            registry.save()
+            assert row_count() == 3
+
+            reloaded = EventRegistry(mappings_file=mappings_file)
+            assert len(reloaded.mappings) == 2
+            assert reloaded.get_event_id("polymarket", "pm_1") == "ELECTION:US:PRESIDENT:2028:VANCE"
+
+            # Beyond two rows per mapping the journal is rewritten in full
+            for _ in range(2):
+                reloaded.add_mapping(reloaded.get_mapping("polymarket", "pm_2"))
+                reloaded.save()
+            assert row_count() == 2
+            assert not mappings_file.with_name("mappings.csv.tmp").exists()
+
+    def test_save_and_load_parquet(self):
+        """Test round-tripping events and mappings through Parquet."""
+        pytest.importorskip("pyarrow")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            events_file = Path(tmpdir) / "events.parquet"
+            mappings_file = Path(tmpdir) / "mappings.parquet"
+
+            registry1 = EventRegistry(events_file=events_file, mappings_file=mappings_file)
+            registry1.add_event(CanonicalEvent(
+                event_id="ELECTION:US:PRESIDENT:2028:TRUMP",
+                event_type=EventType.ELECTION,
+                scope=EventScope.US,
+                date_open=None,
+                date_close=datetime(2028, 11, 5),
+                canonical_units="YES/NO",
+                aliases=["TRUMP 2028"],
+            ))
+            registry1.add_mapping(VenueMapping(
+                venue="polymarket",
+                market_id="pm_123",
+                event_id="ELECTION:US:PRESIDENT:2028:TRUMP",
+                title_raw="Trump 2028?",
+                outcomes=["YES", "NO"],
+                confidence=0.9,
+            ))
+            registry1.save()
+
+            registry2 = EventRegistry(events_file=events_file, mappings_file=mappings_file)
+            event = registry2.get_event("ELECTION:US:PRESIDENT:2028:TRUMP")
+            mapping = registry2.get_mapping("polymarket", "pm_123")
+
+            assert event is not None
+            assert event.date_close == datetime(2028, 11, 5)
+            assert event.aliases == ["TRUMP 2028"]
+            assert registry2.search_by_alias("trump 2028") is event
+            assert mapping is not None
+            assert mapping.outcomes == ["YES", "NO"]
+            assert mapping.confidence == 0.9
+
 
 class TestPolymarketMapper:
     """Test Polymarket-specific mapper."""
@@ -0,0 +1,255 @@
+"""Tests for execution engine module."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from src.connectors.base import MockConnector
+from src.core.execution import ExecutionEngine
+from src.core.types import ArbOpportunity, OrderRequest, OrderSide, OrderTIF, Venue
+
+
+class SlowConnector(MockConnector):
+    """Mock connector that holds each order open briefly and tracks overlap."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def place_order(self, req: OrderRequest):
+        SlowConnector.in_flight += 1
+        SlowConnector.max_in_flight = max(SlowConnector.max_in_flight, SlowConnector.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().place_order(req)
+        finally:
+            SlowConnector.in_flight -= 1
+
+
+class RecordingConnector(MockConnector):
+    """Mock connector that records every order it is sent."""
+
+    def __init__(self, venue: Venue, credentials: dict[str, str]):
+        super().__init__(venue, credentials)
+        self.placed: list[OrderRequest] = []
+
+    async def place_order(self, req: OrderRequest):
+        self.placed.append(req)
+        return await super().place_order(req)
+
+
+class RejectingConnector(RecordingConnector):
+    """Mock connector that never fills."""
+
+    async def place_order(self, req: OrderRequest):
+        fill = await super().place_order(req)
+        if req.price == 0.0:
+            # Market-priced hedge orders are accepted
+            return fill
+        return None
+
+
+class CancellableConnector(MockConnector):
+    """Mock connector that fills after a delay and records cancel requests."""
+
+    def __init__(self, venue: Venue, credentials: dict[str, str], delay: float = 0.0):
+        super().__init__(venue, credentials)
+        self.delay = delay
+        self.cancelled: list[str] = []
+
+    async def place_order(self, req: OrderRequest):
+        await asyncio.sleep(self.delay)
+        fill = await super().place_order(req)
+        fill.venue_order_id = f"{self.venue.value}-{req.client_order_id}"
+        return fill
+
+    async def cancel_order(self, venue_order_id: str) -> bool:
+        self.cancelled.append(venue_order_id)
+        return True
+
+
+def make_opportunity() -> ArbOpportunity:
+    """Create a test opportunity with one leg per venue."""
+    return ArbOpportunity(
+        event_id="event1",
+        leg_a=OrderRequest(
+            venue=Venue.POLYMARKET,
+            contract_id="pm_event1_YES",
+            side=OrderSide.BUY,
+            price=0.40,
+            qty=1.0,
+            tif=OrderTIF.IOC,
+        ),
+        leg_b=OrderRequest(
+            venue=Venue.KALSHI,
+            contract_id="kalshi_event1_NO",
+            side=OrderSide.BUY,
+            price=0.45,
+            qty=1.0,
+            tif=OrderTIF.IOC,
+        ),
+        edge_bps=1500.0,
+        notional=85.0,
+        expiry=datetime.utcnow() + timedelta(days=30),
+        rationale="YES@A+NO@B: 1500.0bps",
+    )
+
+
+class TestExecutionEngine:
+    """Test execution engine functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        SlowConnector.in_flight = 0
+        SlowConnector.max_in_flight = 0
+
+    async def test_legs_placed_concurrently(self):
+        """Test both legs are in flight at the same time by default."""
+        engine = ExecutionEngine({
+            Venue.POLYMARKET: SlowConnector(Venue.POLYMARKET, {}),
+            Venue.KALSHI: SlowConnector(Venue.KALSHI, {}),
+        })
+
+        trade = await engine.execute_opportunity(make_opportunity(), 100.0)
+
+        assert trade is not None
+        assert trade.status == "filled"
+        assert SlowConnector.max_in_flight == 2
+
+    async def test_sequential_legs_in_safe_mode(self):
+        """Test parallel_legs=False places one leg at a time."""
+        engine = ExecutionEngine(
+            {
+                Venue.POLYMARKET: SlowConnector(Venue.POLYMARKET, {}),
+                Venue.KALSHI: SlowConnector(Venue.KALSHI, {}),
+            },
+            parallel_legs=False,
+        )
+
+        trade = await engine.execute_opportunity(make_opportunity(), 100.0)
+
+        assert trade is not None
+        assert SlowConnector.max_in_flight == 1
+
+    async def test_single_leg_fill_is_hedged(self):
+        """Test a one-legged fill is unwound on the venue that filled."""
+        polymarket = RecordingConnector(Venue.POLYMARKET, {})
+        kalshi = RejectingConnector(Venue.KALSHI, {})
+        engine = ExecutionEngine(
+            {Venue.POLYMARKET: polymarket, Venue.KALSHI: kalshi},
+            retry_delay=0.0,
+            jitter=0.0,
+        )
+
+        trade = await engine.execute_opportunity(make_opportunity(), 100.0)
+
+        assert trade is None
+        history = engine.get_trade_history()
+        assert [t.status for t in history] == ["hedged"]
+
+        # The filled YES buy is sold back; nothing more goes to Kalshi
+        entry, hedge = polymarket.placed
+        assert hedge.venue == Venue.POLYMARKET
+        assert hedge.contract_id == entry.contract_id == "pm_event1_YES"
+        assert hedge.side == OrderSide.SELL
+        assert hedge.qty == entry.qty
+        assert hedge.price == 0.0
+        assert all(req.price != 0.0 for req in kalshi.placed)
+
+    async def test_duplicate_inflight_opportunities_fill_once(self):
+        """Test concurrent identical opportunities yield one filled trade."""
+        polymarket = SlowConnector(Venue.POLYMARKET, {})
+        kalshi = SlowConnector(Venue.KALSHI, {})
+        engine = ExecutionEngine({Venue.POLYMARKET: polymarket, Venue.KALSHI: kalshi})
+
+        trades = await asyncio.gather(
+            engine.execute_opportunity(make_opportunity(), 100.0),
+            engine.execute_opportunity(make_opportunity(), 100.0),
+        )
+
+        filled = [trade for trade in trades if trade is not None]
+        assert len(filled) == 1
+        assert filled[0].status == "filled"
+        assert len(polymarket._orders) == 1
+        assert len(kalshi._orders) == 1
+        assert engine.get_execution_stats()["successful_trades"] == 1
+        assert engine._inflight == {}
+
+    async def test_stats_outlive_bounded_history(self):
+        """Test execution stats count trades that fell out of the history."""
+        engine = ExecutionEngine(
+            {
+                Venue.POLYMARKET: MockConnector(Venue.POLYMARKET, {}),
+                Venue.KALSHI: MockConnector(Venue.KALSHI, {}),
+            },
+            history_size=2,
+        )
+
+        for _ in range(3):
+            await engine.execute_opportunity(make_opportunity(), 100.0)
+
+        stats = engine.get_execution_stats()
+        assert len(engine.get_trade_history()) == 2
+        assert stats["total_trades"] == 3
+        assert stats["successful_trades"] == 3
+        assert abs(stats["total_pnl"] - 45.0) < 1e-9
+
+    async def test_cancel_reaches_placed_leg_mid_execution(self):
+        """Test cancelling a trade mid-execution cancels its placed leg."""
+        polymarket = CancellableConnector(Venue.POLYMARKET, {})
+        kalshi = CancellableConnector(Venue.KALSHI, {}, delay=0.05)
+        engine = ExecutionEngine({Venue.POLYMARKET: polymarket, Venue.KALSHI: kalshi})
+
+        execution = asyncio.create_task(
+            engine.execute_opportunity(make_opportunity(), 100.0)
+        )
+        await asyncio.sleep(0.01)
+        [trade] = engine.get_active_trades()
+        assert trade.order_id_a is not None
+        assert trade.order_id_b is None
+
+        assert await engine.cancel_trade(trade.trade_id) is True
+
+        assert await execution is None
+        assert polymarket.cancelled == [trade.order_id_a]
+        assert kalshi.cancelled == []
+        assert [t.status for t in engine.get_trade_history()] == ["cancelled"]
+        assert engine.get_execution_stats()["total_trades"] == 1
+
+    def test_backoff_delay(self):
+        """Test retry delays grow geometrically and respect the cap."""
+        engine = ExecutionEngine({}, retry_delay=0.1, max_delay=0.5, jitter=0.0)
+
+        delays = [engine._backoff_delay(attempt) for attempt in range(4)]
+
+        assert delays == [0.1, 0.2, 0.4, 0.5]
+
+    async def test_execute_leg_does_not_mutate_request(self):
+        """Test leg sizing leaves the opportunity's order request untouched."""
+        connector = MockConnector(Venue.POLYMARKET, {})
+        engine = ExecutionEngine({Venue.POLYMARKET: connector})
+        leg = make_opportunity().leg_a
+
+        fill = await engine._execute_leg(leg, 100.0)
+
+        assert leg.qty == 1.0
+        assert fill is not None
+        assert fill.qty == 100.0
+        assert fill.client_order_id == leg.client_order_id
+
+    async def test_trade_ids_are_unique_and_ordered(self):
+        """Test each executed trade gets a distinct, increasing trade ID."""
+        engine = ExecutionEngine({
+            Venue.POLYMARKET: MockConnector(Venue.POLYMARKET, {}),
+            Venue.KALSHI: MockConnector(Venue.KALSHI, {}),
+        })
+
+        trades = [
+            await engine.execute_opportunity(make_opportunity(), 100.0)
+            for _ in range(3)
+        ]
+
+        ids = [trade.trade_id for trade in trades]
+        prefixes = {trade_id.rsplit("-", 1)[0] for trade_id in ids}
+        seqs = [int(trade_id.rsplit("-", 1)[1], 16) for trade_id in ids]
+        assert len(prefixes) == 1
+        assert seqs == sorted(set(seqs))
+        assert ids == sorted(ids)
@@ -0,0 +1,67 @@
+"""Tests for fee calculation module."""
+
+import numpy as np
+
+from src.core.fees import FeeCalculator
+from src.core.types import FeeModel, OrderSide, Venue
+
+
+class TestFeeCalculator:
+    """Test fee calculator functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = FeeCalculator({
+            Venue.POLYMARKET: FeeModel(maker_bps=5.0, taker_bps=25.0, gas_estimate_usd=0.01),
+            Venue.KALSHI: FeeModel(taker_bps=30.0, withdrawal_fee=0.002),
+        })
+
+    def test_batch_cost_matches_scalar(self):
+        """Test the vectorized cost estimate equals the scalar one per trade."""
+        rng = np.random.default_rng(0)
+        venues = list(Venue)
+        venue_idx = rng.integers(0, len(venues), size=200)
+        prices = rng.uniform(0.01, 0.99, size=200)
+        qtys = rng.uniform(1.0, 500.0, size=200)
+        is_maker = rng.random(200) < 0.5
+
+        batch = self.calculator.estimate_trade_cost_batch(venue_idx, prices, qtys, is_maker)
+
+        expected = [
+            self.calculator.estimate_trade_cost(
+                venues[v], OrderSide.BUY, float(p), float(q), bool(m)
+            )
+            for v, p, q, m in zip(venue_idx, prices, qtys, is_maker, strict=True)
+        ]
+        assert batch.tolist() == expected
+
+    def test_update_fee_model_refreshes_batch_terms(self):
+        """Test replaced fee models are used by the batch path."""
+        self.calculator.update_fee_model(Venue.KALSHI, FeeModel(taker_bps=100.0))
+        kalshi = list(Venue).index(Venue.KALSHI)
+
+        cost = self.calculator.estimate_trade_cost_batch(
+            np.array([kalshi]), np.array([0.5]), 10.0
+        )
+
+        assert cost.tolist() == [0.05]
+
+    def test_breakeven_price_round_trips(self):
+        """Test the breakeven price reproduces the target effective price."""
+        rate = 25.0 / 10000
+        fixed = 0.01
+        for side, sign in ((OrderSide.BUY, 1.0), (OrderSide.SELL, -1.0)):
+            for qty in (0.5, 10.0, 1000.0):
+                price = self.calculator.calculate_breakeven_price(
+                    Venue.POLYMARKET, side, 0.55, qty
+                )
+                effective = price + sign * (price * rate + fixed) / qty
+                assert abs(effective - 0.55) < 1e-12
+
+    def test_breakeven_price_zero_qty(self):
+        """Test a zero quantity without fees falls back to the target price."""
+        calculator = FeeCalculator({Venue.KALSHI: FeeModel()})
+
+        assert calculator.calculate_breakeven_price(
+            Venue.KALSHI, OrderSide.BUY, 0.55, 0.0
+        ) == 0.55
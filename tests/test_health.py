@@ -0,0 +1,106 @@
+"""Tests for health monitor module."""
+
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.health import HealthMonitor
+from src.core.types import HealthStatus, Venue
+
+
+def make_status(venue: Venue, is_healthy: bool) -> HealthStatus:
+    """Create a venue health status."""
+    return HealthStatus(
+        venue=venue,
+        is_healthy=is_healthy,
+        latency_ms=10.0,
+        error_rate=0.0,
+        last_update=datetime.utcnow(),
+    )
+
+
+class TestHealthMonitor:
+    """Test health monitor functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.monitor = HealthMonitor(FastAPI(), cache_ttl=60.0, flush_interval=60.0)
+
+    def test_health_status_is_cached(self):
+        """Test repeated probes within the TTL reuse one response."""
+        first = self.monitor.get_health_status()
+
+        assert self.monitor.get_health_status() is first
+
+    def test_venue_update_invalidates_cache(self):
+        """Test a venue health change is visible on the next probe."""
+        assert self.monitor.get_health_status().status == "healthy"
+
+        self.monitor.update_venue_health(
+            Venue.KALSHI, make_status(Venue.KALSHI, is_healthy=False)
+        )
+
+        assert self.monitor.get_health_status().status == "unhealthy"
+
+    def test_health_endpoint_returns_serialized_status(self):
+        """Test /health serves the cached status as JSON."""
+        client = TestClient(self.monitor.get_app())
+        self.monitor.update_venue_health(
+            Venue.POLYMARKET, make_status(Venue.POLYMARKET, is_healthy=True)
+        )
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["status"] == "healthy"
+        assert body["venues"][0]["venue"] == Venue.POLYMARKET.value
+        assert response.text == self.monitor.get_health_json()
+
+    async def test_unhealthy_count_tracks_venue_updates(self):
+        """Test readiness follows venues flipping between healthy and not."""
+        self.monitor.update_venue_health(
+            Venue.KALSHI, make_status(Venue.KALSHI, is_healthy=False)
+        )
+        self.monitor.update_venue_health(
+            Venue.KALSHI, make_status(Venue.KALSHI, is_healthy=False)
+        )
+        self.monitor.update_venue_health(
+            Venue.POLYMARKET, make_status(Venue.POLYMARKET, is_healthy=False)
+        )
+        assert self.monitor._unhealthy_count == 2
+        assert not await self.monitor.is_ready()
+
+        self.monitor.update_venue_health(
+            Venue.KALSHI, make_status(Venue.KALSHI, is_healthy=True)
+        )
+        self.monitor.update_venue_health(
+            Venue.POLYMARKET, make_status(Venue.POLYMARKET, is_healthy=True)
+        )
+        assert self.monitor._unhealthy_count == 0
+        assert await self.monitor.is_ready()
+
+        self.monitor.update_system_metrics({"error_rate": 0.5})
+        self.monitor.flush_now()
+        assert not await self.monitor.is_healthy()
+
+    def test_metric_updates_are_batched(self):
+        """Test metric updates are applied together once per flush interval."""
+        self.monitor.update_system_metrics({"error_rate": 0.01})
+        self.monitor.flush_now()
+        first = self.monitor.get_health_status()
+        assert first.system == {"error_rate": 0.01}
+
+        self.monitor.update_system_metrics({"error_rate": 0.02})
+        self.monitor.update_system_metrics({"trades": {"total": 1}})
+        assert self.monitor.get_health_status() is first
+        assert self.monitor.system_metrics == {"error_rate": 0.01}
+
+        self.monitor.flush_now()
+        assert self.monitor.system_metrics == {
+            "error_rate": 0.02,
+            "trades": {"total": 1},
+        }
+        assert self.monitor.get_health_status() is not first
@@ -1,11 +1,26 @@
 """Tests for event matcher module."""
 
+import random
 from datetime import datetime, timedelta
 
-from src.core.matcher import EventMatcher
+import numpy as np
+
+from src.core.matcher import EventMatcher, title_prefix_block
 from src.core.types import Contract, ContractSide, FeeModel, Venue
 
 
+def title_similarity_matrix(
+    matcher: EventMatcher, titles_a: list[str], titles_b: list[str]
+) -> list[list[float]]:
+    """Score raw titles pairwise the way the matcher scores its groups."""
+    return matcher._normalized_similarity_matrix(
+        [matcher._normalize_title(title) for title in titles_a],
+        [matcher._normalize_title(title) for title in titles_b],
+        np.array([not title for title in titles_a], dtype=bool),
+        np.array([not title for title in titles_b], dtype=bool),
+    ).tolist()
+
+
 class TestEventMatcher:
     """Test event matching functionality."""
 
@@ -156,6 +171,41 @@ class TestEventMatcher:
         # Should have low similarity
         assert similarity < 0.5
 
+    def test_title_similarity_matrix(self):
+        """Test pairwise title similarity matrix."""
+        titles_a = ["Will Biden win 2024 election?", ""]
+        titles_b = [
+            "Will Biden win 2024 election?",
+            "Biden wins 2024 election",
+            "Will the stock market crash?",
+        ]
+
+        scores = title_similarity_matrix(self.matcher, titles_a, titles_b)
+
+        assert len(scores) == 2
+        assert all(len(row) == 3 for row in scores)
+        assert scores[0][0] == 1.0
+        assert scores[0][1] > 0.7
+        assert scores[0][2] < 0.5
+        # Empty titles never match
+        assert scores[1] == [0.0, 0.0, 0.0]
+
+    def test_title_similarity_matches_matrix(self):
+        """Test pairwise and matrix title scores agree."""
+        titles = [
+            "Will Biden win 2024 election?",
+            "Biden wins 2024 election",
+            "Will the stock market crash?",
+            "",
+        ]
+
+        scores = title_similarity_matrix(self.matcher, titles, titles)
+
+        for i, title_a in enumerate(titles):
+            for j, title_b in enumerate(titles):
+                pair = self.matcher._calculate_title_similarity(title_a, title_b)
+                assert abs(pair - scores[i][j]) < 1e-12
+
     def test_expiry_similarity(self):
         """Test expiry similarity calculation."""
         expiry_a = datetime.utcnow() + timedelta(days=30)
@@ -235,6 +285,121 @@ class TestEventMatcher:
         assert matched_pairs[0].confidence_score == 1.0
         assert matched_pairs[0].match_reason == "manual_mapping_yes"
 
+    def test_manual_mappings_file_round_trip(self, tmp_path):
+        """Test manual mappings saved to CSV load back in both directions."""
+        mappings_file = tmp_path / "mappings.csv"
+        matcher = EventMatcher(mappings_file=str(mappings_file))
+        matcher.add_manual_mapping("event1", "event2")
+        matcher.add_manual_mapping("event3", "event4")
+        with open(mappings_file, "a", encoding="utf-8") as f:
+            f.write("event5\n")
+
+        reloaded = EventMatcher(mappings_file=str(mappings_file))
+
+        assert reloaded.manual_mappings == {
+            "event1": "event2",
+            "event2": "event1",
+            "event3": "event4",
+            "event4": "event3",
+        }
+
+    def test_exact_title_match(self):
+        """Test identical normalized titles match in the exact stage."""
+        contracts_a = [
+            Contract(
+                venue=Venue.POLYMARKET,
+                contract_id="pm_event1_YES",
+                event_key="Will the Fed cut rates in March?",
+                normalized_event_id="event1",
+                side=ContractSide.YES,
+                tick_size=0.01,
+                settlement_ccy="USDC",
+                expires_at=datetime.utcnow() + timedelta(days=30),
+                fees=FeeModel(),
+            ),
+        ]
+
+        contracts_b = [
+            Contract(
+                venue=Venue.KALSHI,
+                contract_id="kalshi_event2_YES",
+                event_key="Fed cut rates in March",
+                normalized_event_id="event2",
+                side=ContractSide.YES,
+                tick_size=0.01,
+                settlement_ccy="USD",
+                expires_at=datetime.utcnow() + timedelta(days=30),
+                fees=FeeModel(),
+            ),
+        ]
+
+        matched_pairs = self.matcher.match_events(contracts_a, contracts_b)
+
+        assert len(matched_pairs) == 1
+        assert matched_pairs[0].match_reason == "exact_title_yes"
+
+    def test_blocking_fn(self):
+        """Test fuzzy scoring only compares events within a block."""
+        def blocking_fn(title):
+            return "election" in title
+
+        matcher = EventMatcher(blocking_fn=blocking_fn)
+        matched_pairs = matcher.match_events(
+            self.contracts_a,
+            self.contracts_b,
+            min_confidence=0.5,
+        )
+        assert len(matched_pairs) == 2
+
+        matcher = EventMatcher(blocking_fn=title_prefix_block)
+        matched_pairs = matcher.match_events(
+            self.contracts_a,
+            self.contracts_b,
+            min_confidence=0.5,
+        )
+        # "biden win 2024" and "biden wins 2024" fall in different blocks
+        assert len(matched_pairs) == 0
+
+    def test_expiry_window_matches_brute_force(self):
+        """Test expiry-window pruning finds the same matches as scoring all pairs."""
+        rng = random.Random(0)
+        words = ["fed", "rates", "cut", "march", "biden", "election", "btc", "100k"]
+        base = datetime(2025, 1, 1)
+
+        def make_contracts(venue, prefix, count):
+            contracts = []
+            for i in range(count):
+                contracts.append(Contract(
+                    venue=venue,
+                    contract_id=f"{prefix}_{i}_YES",
+                    event_key=" ".join(rng.sample(words, 4)),
+                    normalized_event_id=f"{prefix}{i}",
+                    side=ContractSide.YES,
+                    tick_size=0.01,
+                    settlement_ccy="USD",
+                    expires_at=base + timedelta(hours=rng.randrange(0, 24 * 30)),
+                    fees=FeeModel(),
+                ))
+            return contracts
+
+        contracts_a = make_contracts(Venue.POLYMARKET, "a", 60)
+        contracts_b = make_contracts(Venue.KALSHI, "b", 60)
+
+        brute_force = EventMatcher()
+        brute_force._max_expiry_gap = lambda min_confidence: None
+
+        for min_confidence in (0.65, 0.7, 0.8):
+            expected = brute_force.match_events(contracts_a, contracts_b, min_confidence)
+            actual = self.matcher.match_events(contracts_a, contracts_b, min_confidence)
+            assert expected
+            assert [
+                (p.contract_a.contract_id, p.contract_b.contract_id, p.confidence_score)
+                for p in actual
+            ] == [
+                (p.contract_a.contract_id, p.contract_b.contract_id, p.confidence_score)
+                for p in expected
+            ]
+
     def test_get_match_statistics(self):
         """Test match statistics calculation."""
         # Create some matched pairs
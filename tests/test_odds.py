@@ -2,7 +2,10 @@
 
 from datetime import datetime
 
+import numpy as np
+
 from src.core.odds import (
+    _score_directions_numpy,
     calculate_arbitrage_edge,
     calculate_breakeven_probability,
     calculate_expected_pnl,
@@ -15,6 +18,7 @@ from src.core.odds import (
     price_to_probability,
     probability_to_price,
     round_to_tick_size,
+    score_directions,
 )
 from src.core.types import ContractSide, Quote, Venue
 
@@ -168,6 +172,10 @@ class TestOddsCalculations:
         # Should be 0.12
         assert rounded_price == 0.12
 
+        # Results are the nearest float to the decimal price
+        assert round_to_tick_size(0.3, 0.1) == 0.3
+        assert round_to_tick_size(0.57, 0.01) == 0.57
+
     def test_calculate_kelly_fraction(self):
         """Test Kelly fraction calculation."""
         edge_bps = 100.0  # 1%
@@ -201,4 +209,20 @@ class TestOddsCalculations:
         # NO probability should be 1 - mid price (0.5)
         assert prob_no == 0.5
 
-
+    def test_score_directions(self):
+        """Test vectorized scoring matches the scalar helpers."""
+        eff_a = np.array([0.40, 0.55, 0.30, 0.0, 0.495])
+        eff_b = np.array([0.45, 0.50, 0.30, 0.0, 0.495])
+        size_a = np.array([500.0, 500.0, 50.0, 10.0, 1000.0])
+        size_b = np.array([800.0, 500.0, 500.0, 10.0, 1000.0])
+
+        for scorer in (score_directions, _score_directions_numpy):
+            edge_bps, qty, notional = scorer(eff_a, eff_b, size_a, size_b, 100.0)
+            for i in range(len(eff_a)):
+                expected_qty = min_executable_qty(
+                    size_a[i], size_b[i], 100.0, eff_a[i], eff_b[i]
+                )
+                capital = eff_a[i] + eff_b[i]
+                assert edge_bps[i] == max(0.0, (1.0 - capital) * 10000.0)
+                assert qty[i] == expected_qty
+                assert notional[i] == expected_qty * capital
@@ -0,0 +1,62 @@
+"""Tests for paper trading engine."""
+
+from src.core.paper import PaperTradingEngine
+
+from .test_execution import make_opportunity
+
+
+class TestPaperTradingEngine:
+    """Test paper trading engine functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = PaperTradingEngine()
+
+    async def test_cached_state_refreshes_after_trade(self):
+        """Test positions and balances are rebuilt once a trade is recorded."""
+        positions = self.engine._get_current_positions()
+        balances = self.engine._get_current_balances()
+        assert self.engine._get_current_positions() is positions
+        assert self.engine._get_current_balances() is balances
+
+        await self.engine._process_opportunities([make_opportunity()])
+
+        assert len(self.engine.get_trade_history()) == 1
+        assert self.engine._get_current_positions()["event1"] > 0
+        total = sum(b.total for b in self.engine._get_current_balances().values())
+        assert abs(total - self.engine.portfolio.current_balance) < 1e-9
+
+    async def test_opportunities_in_one_tick_respect_risk_limits(self):
+        """Test approvals within a tick count toward risk limits."""
+        limit = self.engine.risk_manager.risk_limits.max_open_risk_usd
+        opportunity = make_opportunity()
+        count = int(limit // opportunity.notional) + 2
+
+        await self.engine._process_opportunities(
+            [make_opportunity() for _ in range(count)]
+        )
+
+        trades = self.engine.get_trade_history()
+        assert 0 < len(trades) < count
+        assert len({trade.trade_id for trade in trades}) == len(trades)
+
+    async def test_stops_checking_once_risk_is_exhausted(self):
+        """Test no risk checks run after open risk reaches the limit."""
+        limit = self.engine.risk_manager.risk_limits.max_open_risk_usd
+        opportunity = make_opportunity()
+        fits = int(limit // opportunity.notional)
+        checks = []
+        check_trade_risk = self.engine.risk_manager.check_trade_risk
+
+        def counting_check(*args):
+            checks.append(args[0])
+            return check_trade_risk(*args)
+
+        self.engine.risk_manager.check_trade_risk = counting_check
+
+        await self.engine._process_opportunities(
+            [make_opportunity() for _ in range(fits + 10)]
+        )
+
+        assert len(self.engine.get_trade_history()) == fits
+        assert len(checks) == fits
@@ -0,0 +1,243 @@
+"""Tests for persistence module."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+
+from src.core.persistence import PersistenceManager
+from src.core.types import Balance, ContractSide, Position, Quote, Trade, Venue
+
+
+class TestPersistenceManager:
+    """Test persistence manager functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.persistence = PersistenceManager("sqlite://")
+
+    def teardown_method(self):
+        """Release the database."""
+        self.persistence.close()
+
+    def test_bulk_saves_round_trip(self):
+        """Test bulk-saved records read back like individually saved ones."""
+        now = datetime.now(UTC)
+        trades = [
+            Trade(
+                trade_id=f"t{i}",
+                event_id="event1",
+                pnl=float(i),
+                created_at=now + timedelta(seconds=i),
+            )
+            for i in range(3)
+        ]
+        quotes = [
+            Quote(Venue.KALSHI, f"c{i}", 0.4, 0.42, 100.0, 100.0, now)
+            for i in range(3)
+        ]
+
+        self.persistence.save_trades_bulk(trades)
+        self.persistence.save_trade(Trade(trade_id="t3", event_id="event2", created_at=now))
+        self.persistence.save_quotes_bulk(quotes)
+        self.persistence.save_balances_bulk([
+            Balance(Venue.KALSHI, "USD", 90.0, 100.0, now),
+            Balance(Venue.POLYMARKET, "USDC", 50.0, 50.0, now),
+        ])
+
+        assert [t.trade_id for t in self.persistence.get_trades(event_id="event1")] == [
+            "t2", "t1", "t0",
+        ]
+        assert len(self.persistence.get_trades()) == 4
+        assert {q.contract_id for q in self.persistence.get_quotes()} == {"c0", "c1", "c2"}
+        assert len(self.persistence.get_balances()) == 2
+
+    def test_bulk_save_of_nothing_is_a_no_op(self):
+        """Test empty batches do not touch the database."""
+        self.persistence.save_trades_bulk([])
+
+        assert self.persistence.get_trades() == []
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """Test file-backed SQLite databases are opened in WAL mode."""
+        persistence = PersistenceManager(f"sqlite:///{tmp_path / 'pm_arb.db'}")
+        try:
+            with persistence.engine.connect() as conn:
+                mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+                sync = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+        finally:
+            persistence.close()
+
+        assert mode == "wal"
+        assert sync == 1  # NORMAL
+
+    def test_portfolio_summary_aggregates(self):
+        """Test the database summary totals trades and active positions."""
+        now = datetime.now(UTC)
+        assert self.persistence.get_portfolio_summary() == {
+            "total_trades": 0,
+            "total_pnl": 0.0,
+            "active_positions": 0,
+            "total_exposure": 0.0,
+        }
+
+        self.persistence.save_trades_bulk([
+            Trade(trade_id="t1", pnl=1.5, created_at=now),
+            Trade(trade_id="t2", pnl=-0.5, created_at=now),
+        ])
+        for contract_id, qty in (("c1", 10.0), ("c2", 0.0)):
+            self.persistence.save_position(Position(
+                venue=Venue.KALSHI,
+                contract_id=contract_id,
+                normalized_event_id="event1",
+                side=ContractSide.YES,
+                qty=qty,
+                avg_price=0.4,
+                created_at=now,
+                updated_at=now,
+            ))
+
+        summary = self.persistence.get_portfolio_summary()
+        assert summary["total_trades"] == 2
+        assert summary["total_pnl"] == 1.0
+        assert summary["active_positions"] == 1
+        assert abs(summary["total_exposure"] - 4.0) < 1e-9
+
+    def test_cleanup_deletes_only_expired_rows(self):
+        """Test cleanup removes stale quotes and honours per-table retention."""
+        now = datetime.now(UTC)
+        old = now - timedelta(days=40)
+        self.persistence.save_quotes_bulk([
+            Quote(Venue.KALSHI, "old", 0.4, 0.42, 100.0, 100.0, old),
+            Quote(Venue.KALSHI, "new", 0.4, 0.42, 100.0, 100.0, now),
+        ])
+        self.persistence.save_trades_bulk([
+            Trade(trade_id="old", created_at=old),
+            Trade(trade_id="new", created_at=now),
+        ])
+
+        self.persistence.cleanup_old_data(days_to_keep=30)
+
+        assert [q.contract_id for q in self.persistence.get_quotes()] == ["new"]
+        assert len(self.persistence.get_trades()) == 2
+
+        self.persistence.cleanup_old_data(days_to_keep=30, trade_days_to_keep=30)
+
+        assert [t.trade_id for t in self.persistence.get_trades()] == ["new"]
+
+    def test_filtered_reads_use_composite_indexes(self):
+        """Test filtered trade and quote reads need no full scan or sort."""
+        queries = (
+            "SELECT * FROM trades WHERE event_id = 'e' ORDER BY created_at DESC LIMIT 100",
+            "SELECT * FROM trades WHERE venue_a = 'kalshi' ORDER BY created_at DESC LIMIT 100",
+            "SELECT * FROM quotes WHERE contract_id = 'c' ORDER BY ts DESC LIMIT 100",
+        )
+        with self.persistence.engine.connect() as conn:
+            for query in queries:
+                plan = " ".join(
+                    row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}")
+                )
+                assert "USING INDEX" in plan
+                assert "TEMP B-TREE" not in plan
+
+    def test_save_position_upserts(self):
+        """Test saving a position twice updates the one stored row."""
+        now = datetime.now(UTC)
+        position = Position(
+            venue=Venue.KALSHI,
+            contract_id="c1",
+            normalized_event_id="event1",
+            side=ContractSide.YES,
+            qty=10.0,
+            avg_price=0.4,
+            created_at=now,
+            updated_at=now,
+        )
+        self.persistence.save_position(position)
+
+        position.qty = 25.0
+        position.avg_price = 0.45
+        self.persistence.save_position(position)
+
+        stored = self.persistence.get_positions()
+        assert len(stored) == 1
+        assert stored[0].qty == 25.0
+        assert stored[0].avg_price == 0.45
+
+    def test_opening_database_with_duplicate_positions(self, tmp_path):
+        """Test a pre-index database with duplicate positions still opens."""
+        url = f"sqlite:///{tmp_path / 'positions.db'}"
+        PersistenceManager(url).close()
+
+        old = PersistenceManager(url)
+        now = datetime.now(UTC)
+        with old.engine.begin() as conn:
+            conn.execute(text("DROP INDEX uq_position_venue_contract"))
+            for qty, updated_at in ((10.0, now), (25.0, now + timedelta(seconds=1))):
+                conn.execute(
+                    text(
+                        "INSERT INTO positions (venue, contract_id, "
+                        "normalized_event_id, side, qty, avg_price, "
+                        "unrealized_pnl, realized_pnl, created_at, updated_at) "
+                        "VALUES ('kalshi', 'c1', 'event1', 'YES', :qty, 0.4, "
+                        "0.0, 0.0, :now, :updated_at)"
+                    ),
+                    {"qty": qty, "now": now, "updated_at": updated_at},
+                )
+        old.close()
+
+        reopened = PersistenceManager(url)
+        try:
+            stored = reopened.get_positions()
+            assert len(stored) == 1
+            assert stored[0].qty == 25.0
+        finally:
+            reopened.close()
+
+    def test_trade_stats(self):
+        """Test PnL statistics are computed over trades in execution order."""
+        now = datetime.now(UTC)
+        pnls = [2.0, -1.0, 3.0, -4.0, 1.0]
+        self.persistence.save_trades_bulk([
+            Trade(trade_id=f"t{i}", pnl=pnl, created_at=now + timedelta(seconds=i))
+            for i, pnl in enumerate(pnls)
+        ])
+
+        stats = self.persistence.get_trade_stats()
+
+        assert list(self.persistence.get_trade_pnls()) == pnls
+        assert stats["total_trades"] == 5
+        assert stats["total_pnl"] == 1.0
+        assert stats["win_rate"] == 0.6
+        assert stats["avg_win"] == 2.0
+        assert stats["avg_loss"] == 2.5
+        # Peak 4.0 after the third trade, trough 0.0 after the fourth
+        assert stats["max_drawdown"] == 4.0
+        assert abs(stats["kelly_fraction"] - (0.6 - 0.4 / 0.8)) < 1e-12
+        # Mean 0.2 over a sample standard deviation of sqrt(7.7)
+        assert abs(stats["sharpe_ratio"] - 0.2 / 7.7 ** 0.5) < 1e-12
+
+        # Last two trades: mean -1.5, sample standard deviation 5 / sqrt(2)
+        windowed = self.persistence.get_trade_stats(sharpe_window=2)
+        assert abs(windowed["sharpe_ratio"] + 1.5 / (5 / 2 ** 0.5)) < 1e-12
+
+    def test_kelly_fraction_is_capped(self):
+        """Test Kelly stays within the cap, and is zero without any losses."""
+        now = datetime.now(UTC)
+        self.persistence.save_trades_bulk([
+            Trade(trade_id=f"t{i}", pnl=pnl, created_at=now + timedelta(seconds=i))
+            for i, pnl in enumerate([3.0, 2.0])
+        ])
+        assert self.persistence.get_trade_stats()["kelly_fraction"] == 0.0
+
+        # Win rate 2/3 at a 5:1 payoff would be 0.6 uncapped
+        self.persistence.save_trade(
+            Trade(trade_id="t2", pnl=-0.5, created_at=now + timedelta(seconds=2))
+        )
+        assert self.persistence.get_trade_stats()["kelly_fraction"] == 0.25
+
+    def test_trade_stats_without_trades(self):
+        """Test an empty history yields zeroed statistics."""
+        stats = self.persistence.get_trade_stats()
+
+        assert stats["total_trades"] == 0
+        assert stats["kelly_fraction"] == 0.0
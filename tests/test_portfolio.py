@@ -0,0 +1,87 @@
+"""Tests for portfolio module."""
+
+from datetime import datetime
+
+import numpy as np
+
+from src.core.portfolio import Portfolio, trade_pnl_stats
+from src.core.types import Quote, Trade, Venue
+
+
+def make_trade(pnl: float = 0.0) -> Trade:
+    """Create a filled test trade on one event."""
+    return Trade(
+        event_id="event1",
+        contract_a="a",
+        contract_b="b",
+        qty=10.0,
+        price_a=0.4,
+        price_b=0.5,
+        pnl=pnl,
+    )
+
+
+class TestPortfolio:
+    """Test portfolio functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.portfolio = Portfolio(initial_balance=1000.0)
+
+    def test_summary_refreshes_after_trade(self):
+        """Test a recorded trade is reflected in the next summary."""
+        assert self.portfolio.get_portfolio_summary()["total_trades"] == 0
+
+        self.portfolio.add_trade(make_trade(pnl=1.0))
+
+        summary = self.portfolio.get_portfolio_summary()
+        assert summary["total_trades"] == 1
+        assert summary["realized_pnl"] == 1.0
+
+    def test_summary_refreshes_after_quotes(self):
+        """Test new quotes are reflected in the next summary."""
+        self.portfolio.add_trade(make_trade())
+        before = self.portfolio.get_portfolio_summary()
+
+        self.portfolio.update_quotes([
+            Quote(Venue.POLYMARKET, "a", 0.5, 0.52, 100.0, 100.0, datetime.utcnow()),
+        ])
+
+        after = self.portfolio.get_portfolio_summary()
+        assert after["unrealized_pnl"] != before["unrealized_pnl"]
+
+    def test_summary_is_not_shared_with_callers(self):
+        """Test mutating a returned summary does not leak into later calls."""
+        summary = self.portfolio.get_portfolio_summary()
+        summary["total_trades"] = 99
+        summary["position_breakdown"]["event1"] = 99.0
+
+        summary = self.portfolio.get_portfolio_summary()
+        assert summary["total_trades"] == 0
+        assert summary["position_breakdown"] == {}
+
+    def test_summary_pnl_rollups(self):
+        """Test the summary carries drawdown, Sharpe and Kelly over trade PnLs."""
+        for pnl in [2.0, -1.0, 3.0, -4.0, 1.0]:
+            self.portfolio.add_trade(make_trade(pnl=pnl))
+
+        summary = self.portfolio.get_portfolio_summary()
+
+        assert summary["realized_pnl"] == 1.0
+        assert summary["successful_trades"] == 3
+        assert summary["win_rate"] == 60.0
+        assert summary["max_drawdown"] == 4.0
+        assert abs(summary["sharpe_ratio"] - 0.2 / 7.7 ** 0.5) < 1e-12
+        assert abs(summary["kelly_fraction"] - (0.6 - 0.4 / 0.8)) < 1e-12
+
+    def test_break_even_trades_are_not_losses(self):
+        """Test zero-PnL trades count toward win rate but not the loss average."""
+        stats = trade_pnl_stats(np.array([3.0, 0.0, -1.0, 0.0]))
+
+        assert stats["win_rate"] == 0.25
+        assert stats["avg_win"] == 3.0
+        assert stats["avg_loss"] == 1.0
+        # 0.25 - 0.75 / 3 is zero
+        assert stats["kelly_fraction"] == 0.0
+
+        assert trade_pnl_stats(np.array([2.0, 0.0]))["kelly_fraction"] == 0.0
@@ -0,0 +1,55 @@
+"""Tests for risk management module."""
+
+from src.core.risk import RiskManager
+from src.core.types import RiskLimits, Trade, Venue
+
+
+class TestRiskManager:
+    """Test risk manager functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        limits = RiskLimits(
+            max_open_risk_usd=1000.0,
+            max_per_trade_usd=100.0,
+            max_position_per_event_usd=500.0,
+            max_drawdown_pct=10.0,
+            min_edge_bps=50.0,
+            max_slippage_bps=20.0,
+        )
+        self.risk_manager = RiskManager(limits, summary_ttl=60.0)
+
+    def test_summary_is_cached(self):
+        """Test repeated summaries reuse one build."""
+        self.risk_manager.get_risk_summary()
+        cached = self.risk_manager._summary_cache
+
+        self.risk_manager.get_risk_summary()
+
+        assert self.risk_manager._summary_cache is cached
+
+    def test_recording_invalidates_summary(self):
+        """Test trades and errors are reflected despite the cache TTL."""
+        self.risk_manager.get_risk_summary()
+
+        self.risk_manager.record_trade(Trade(pnl=2.5))
+        self.risk_manager.record_error(Venue.KALSHI, RuntimeError("timeout"))
+
+        summary = self.risk_manager.get_risk_summary()
+        assert summary["total_trades"] == 1
+        assert summary["total_pnl"] == 2.5
+        assert summary["recent_errors"][Venue.KALSHI.value] == 1
+
+    def test_summary_is_not_shared_with_callers(self):
+        """Test mutating a returned summary leaves later summaries intact."""
+        self.risk_manager.record_latency(Venue.KALSHI, 100.0)
+        summary = self.risk_manager.get_risk_summary()
+
+        summary["active_circuit_breakers"].append(Venue.KALSHI)
+        summary["recent_errors"][Venue.KALSHI.value] = 99
+        summary["recent_latencies"][Venue.KALSHI.value].clear()
+
+        summary = self.risk_manager.get_risk_summary()
+        assert summary["active_circuit_breakers"] == []
+        assert summary["recent_errors"][Venue.KALSHI.value] == 0
+        assert len(summary["recent_latencies"][Venue.KALSHI.value]) == 1